@@ -4,8 +4,63 @@ import os
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DATA_DIR = os.environ.get("TIGRINYA_DATA_DIR", BASE_DIR)
 PDFS_DIR = os.path.join(DATA_DIR, "pdfs")
+PDF_STORE_DIR = os.path.join(PDFS_DIR, "store")
 METADATA_PATH = os.path.join(DATA_DIR, "pdf_metadata.json")
 RAW_DATA_PATH = os.path.join(DATA_DIR, "raw_data.json")
+FRONTIER_PATH = os.path.join(DATA_DIR, "scrape_frontier.json")
+PAGE_INDEX_PATH = os.path.join(DATA_DIR, "listing_page_index.json")
+IMAGE_INDEX_PATH = os.path.join(DATA_DIR, "image_index.json")
+
+# Shared backend browser: Chromium contexts (scrape jobs) allowed at once
+BROWSER_MAX_CONTEXTS = int(os.environ.get("BROWSER_MAX_CONTEXTS", "2"))
+
+# PDF text/image extraction processes (0 = one per CPU core, 1 = in-process)
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", "0")) or os.cpu_count() or 1
+
+# PDF text backend: "pdfplumber" (layout-aware, slowest), "pdfminer" or "pypdfium2" (fastest).
+# See benchmarks/bench_extractors.py for speed and agreement on your PDFs
+TEXT_EXTRACTOR = os.environ.get("TEXT_EXTRACTOR", "pdfplumber")
+
+# PDF images: "raster" (default) re-renders each image's page crop at 200 DPI (slow); "embedded" writes
+# the image XObjects' own bitmaps (JPEGs as stored), skipping images under IMAGE_MIN_PX pixels a side
+# or IMAGE_MIN_PAGE_FRACTION of the page
+IMAGE_EXTRACTION = os.environ.get("IMAGE_EXTRACTION", "raster")
+IMAGE_MIN_PX = int(os.environ.get("IMAGE_MIN_PX", "64"))
+IMAGE_MIN_PAGE_FRACTION = float(os.environ.get("IMAGE_MIN_PAGE_FRACTION", "0.01"))
+
+# Image descriptions: images under IMAGE_DESCRIBE_MIN_PX pixels a side are not sent to Gemini, and
+# images whose 128-bit perceptual hash is within IMAGE_HASH_MAX_DISTANCE bits (max 15) of an already
+# described one reuse its description (mastheads, logos, recurring ads)
+IMAGE_DESCRIBE_MIN_PX = int(os.environ.get("IMAGE_DESCRIBE_MIN_PX", "128"))
+IMAGE_HASH_MAX_DISTANCE = int(os.environ.get("IMAGE_HASH_MAX_DISTANCE", "10"))
+
+# When images are saved and described: "eager" during PDF processing; "deferred" only records each
+# image's page and box, and the backend saves and describes them on the first GET
+# /articles/{index}/images or from a background worker that does one PDF every IMAGE_QUEUE_DELAY seconds
+IMAGE_PROCESSING = os.environ.get("IMAGE_PROCESSING", "eager")
+IMAGE_QUEUE_DELAY = float(os.environ.get("IMAGE_QUEUE_DELAY", "5"))
+
+# Gemini requests (NER and image descriptions) in flight at once while processing PDFs
+GEMINI_CONCURRENCY = int(os.environ.get("GEMINI_CONCURRENCY", "8"))
+
+# NER splits each article into windows of whole sentences of at most NER_WINDOW_CHARS characters,
+# analysed concurrently and merged (Ge'ez text runs about one token per 1-2 characters)
+NER_WINDOW_CHARS = int(os.environ.get("NER_WINDOW_CHARS", "6000"))
+
+# Image descriptions: up to DESCRIBE_BATCH_SIZE images per Gemini request, sent inline as JPEGs
+# downscaled to DESCRIBE_BATCH_MAX_PX pixels on the longer side
+DESCRIBE_BATCH_SIZE = max(1, int(os.environ.get("DESCRIBE_BATCH_SIZE", "8")))
+DESCRIBE_BATCH_MAX_PX = int(os.environ.get("DESCRIBE_BATCH_MAX_PX", "768"))
+
+# Gemini results cached by input content, model and prompt version, so unchanged text and images are
+# never sent twice; least recently used entries are dropped above GEMINI_CACHE_MAX_MB (0 disables the cache)
+GEMINI_CACHE_PATH = os.path.join(DATA_DIR, "gemini_cache.sqlite")
+GEMINI_CACHE_MAX_MB = float(os.environ.get("GEMINI_CACHE_MAX_MB", "256"))
+
+# Bump when extraction, cleaning, NER or image description changes: raw_data.json entries made by
+# another version (or TEXT_EXTRACTOR / IMAGE_EXTRACTION, or the other tool's cleaner) are reprocessed,
+# entries with the same settings and an unchanged PDF hash are reused
+PROCESSING_VERSION = 2
 
 # Qdrant / RAG
 QDRANT_HOST = os.environ.get("QDRANT_HOST", "localhost")
@@ -18,8 +73,23 @@ NEWSPAPERS = [
         "name": "Haddas Ertra",
         "source": "shabait.com",
         "base_url": "https://shabait.com/category/newspapers/haddas-ertra-news",
-        "link_selector_href": "haddas-ertra",
         "description": "Tigrinya newspaper from Eritrea Ministry of Information",
+        # Listing pages: page 1 is base_url, later pages follow page_url_pattern
+        "page_url_pattern": "{base_url}/page/{page}/",
+        "listing_item_selector": "article.listing-item",
+        "listing_link_selector": 'a.post-url[href*="haddas-ertra"]',
+        "listing_date_selector": ".entry-date, .post-date, time",
+        # Article pages; relative links are resolved against site_url
+        "site_url": "https://shabait.com",
+        "article_title_selector": "h1, .entry-title, .post-title",
+        "article_date_selector": ".entry-date, .post-date, time",
+        "pdf_icon_selector": "img.wp-image-77661",
+        "pdf_link_selector": 'a[href$=".pdf"]',
+        "pdf_url_hints": ["erinewspapers.com", "hadas-eritrea"],
+        # Crawl budget for this newspaper (listing pages / PDFs in flight, starting requests/sec per host)
+        "listing_concurrency": 4,
+        "download_concurrency": 4,
+        "requests_per_second": 2.0,
     },
 ]
 
@@ -1,13 +1,35 @@
-"""FastAPI app for Tigrinya News: articles and RAG only. Scraping and pipeline run separately (script_runner.py)."""
+"""FastAPI app for Tigrinya News: articles, RAG and in-process scraping. The rest of the pipeline runs separately (script_runner.py)."""
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.routes import articles, nlp, newspapers, rag, pipeline_runner, pipeline
+from app.config import BROWSER_MAX_CONTEXTS, IMAGE_PROCESSING
+from app.routes import articles, nlp, newspapers, rag, pipeline_runner, pipeline, scrape
+from app.services.browser_manager import BrowserManager
+from app.services.deferred_images import BackgroundImageWorker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One Chromium for all in-process scrape jobs; started on first use, closed on shutdown
+    app.state.browser = BrowserManager(max_contexts=BROWSER_MAX_CONTEXTS)
+    # Deferred images not yet requested are saved and described in the background
+    image_worker = BackgroundImageWorker()
+    if IMAGE_PROCESSING == "deferred":
+        image_worker.start()
+    try:
+        yield
+    finally:
+        image_worker.stop()
+        await app.state.browser.close()
+
 
 app = FastAPI(
     title="Tigrinya News API",
     description="Browse articles and ask questions (RAG). Scraping and pipeline run via script_runner.py.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -24,8 +46,15 @@ app.include_router(nlp.router)
 app.include_router(rag.router)
 app.include_router(pipeline_runner.router)
 app.include_router(pipeline.router)
+app.include_router(scrape.router)
 
 
 @app.get("/")
 def root():
     return {"message": "Tigrinya News API", "docs": "/docs"}
+
+
+@app.get("/health/browser")
+async def browser_health():
+    """Shared scrape browser status (relaunches it if it crashed)."""
+    return await app.state.browser.health()
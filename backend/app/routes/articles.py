@@ -5,16 +5,16 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException
 
-from app.config import METADATA_PATH, RAW_DATA_PATH
+from app.config import METADATA_PATH
+from app.services.deferred_images import complete_images, has_pending
+from app.services.pdf_service import load_raw_data
 
 router = APIRouter(prefix="/articles", tags=["articles"])
 
 
 def _load_raw():
-    if not os.path.exists(RAW_DATA_PATH):
-        return []
-    with open(RAW_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Includes images completed by IMAGE_PROCESSING=deferred since raw_data.json was written
+    return load_raw_data()
 
 
 def _load_metadata():
@@ -55,3 +55,25 @@ def get_article_text(index: int):
                 "word_count": item.get("word_count", 0),
             }
     raise HTTPException(status_code=404, detail="Article not found")
+
+
+@router.get("/{index}/images")
+def get_article_images(index: int):
+    """Images of an article with their Tigrinya descriptions.
+
+    With IMAGE_PROCESSING=deferred the first request saves and describes the article's images
+    (this can take a while); later requests are served from the stored result.
+    """
+    data = _load_raw()
+    for item in data:
+        if item.get("index") == index:
+            images = item.get("images", [])
+            if has_pending(images) and item.get("pdf_sha256"):
+                images = complete_images(item["pdf_sha256"]) or images
+            return {
+                "index": index,
+                "news_title": item.get("news_title"),
+                "images": images,
+                "pending": has_pending(images),
+            }
+    raise HTTPException(status_code=404, detail="Article not found")
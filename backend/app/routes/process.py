@@ -4,7 +4,7 @@ from pydantic import BaseModel
 
 from fastapi import APIRouter, BackgroundTasks
 
-from app.services.pdf_service import process_pdfs
+from app.services.pdf_service import process_pdfs, reclean
 
 router = APIRouter(prefix="/process", tags=["process"])
 
@@ -21,7 +21,8 @@ def _set_status(**kwargs):
     _process_status.update(kwargs)
 
 
-async def _run_processing(filenames: Optional[List[str]]):
+# Plain function: BackgroundTasks runs it in a worker thread, where process_pdfs can start its own event loop
+def _run_processing(filenames: Optional[List[str]]):
     _set_status(running=True, stage="processing", result=None, error=None)
     try:
         result = process_pdfs(pdf_filenames=filenames)
@@ -57,6 +58,23 @@ async def start_processing_all(background_tasks: BackgroundTasks):
     return {"ok": True, "message": "Processing all PDFs from metadata"}
 
 
+@router.post("/reclean")
+def reclean_text():
+    """Re-run text cleaning on raw_data.json from the stored page texts (no PDF re-extraction)."""
+    if _process_status.get("running"):
+        return {"ok": False, "message": "Processing already running", "status": _process_status}
+    _set_status(running=True, stage="recleaning", result=None, error=None)
+    try:
+        result = reclean()
+        _set_status(stage="done", result=result)
+        return result
+    except Exception as e:
+        _set_status(stage="error", error=str(e))
+        return {"ok": False, "error": str(e)}
+    finally:
+        _set_status(running=False)
+
+
 @router.get("/status")
 def processing_status():
     """Current processing status."""
@@ -1,11 +1,11 @@
 """Scrape API: trigger scraping and PDF downloading."""
 import asyncio
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
 
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, BackgroundTasks, Request
 
-from app.services.scraper_service import scrape_articles
+from app.services.scraper_service import scrape_newspapers
 
 router = APIRouter(prefix="/scrape", tags=["scrape"])
 
@@ -15,10 +15,16 @@ _scrape_status: dict = {"running": False, "stage": None, "progress": None, "resu
 
 class ScrapeRequest(BaseModel):
     newspaper_id: str = "haddas-ertra"
+    newspaper_ids: Optional[List[str]] = None  # Several newspapers crawled concurrently (overrides newspaper_id)
     max_articles: int = 100
     max_pages: int = 100
     start_date: Optional[str] = None
     end_date: Optional[str] = None
+    listing_concurrency: Optional[int] = None  # None: each newspaper's own setting in NEWSPAPERS
+    fetcher_mode: str = "auto"  # "auto" (HTTP, Playwright fallback) | "http" | "playwright"
+    download_concurrency: Optional[int] = None
+    incremental: bool = True  # False wipes pdfs/ and metadata and scrapes from scratch
+    requests_per_second: Optional[float] = Field(None, gt=0)  # Starting rate per host; adapts to 429/5xx responses
 
 
 def _set_status(**kwargs):
@@ -26,15 +32,21 @@ def _set_status(**kwargs):
     _scrape_status.update(kwargs)
 
 
-async def _run_scrape(newspaper_id: str, max_articles: int, max_pages: int, start_date: Optional[str] = None, end_date: Optional[str] = None):
+async def _run_scrape(request: ScrapeRequest, browser_manager=None):
     _set_status(running=True, stage="initializing", progress=None, result=None, error=None)
     try:
-        result = await scrape_articles(
-            newspaper_id=newspaper_id,
-            max_articles=max_articles,
-            max_pages=max_pages,
-            start_date=start_date,
-            end_date=end_date,
+        result = await scrape_newspapers(
+            newspaper_ids=request.newspaper_ids or [request.newspaper_id],
+            max_articles=request.max_articles,
+            max_pages=request.max_pages,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            listing_concurrency=request.listing_concurrency,
+            fetcher_mode=request.fetcher_mode,
+            download_concurrency=request.download_concurrency,
+            incremental=request.incremental,
+            requests_per_second=request.requests_per_second,
+            browser_manager=browser_manager,
             progress_callback=lambda p: _set_status(stage=p.get("stage"), progress=p)
         )
         _set_status(stage="download_complete", result=result, progress=None)
@@ -47,21 +59,17 @@ async def _run_scrape(newspaper_id: str, max_articles: int, max_pages: int, star
 @router.post("")
 async def start_scrape(
     background_tasks: BackgroundTasks,
-    request: ScrapeRequest
+    request: ScrapeRequest,
+    http_request: Request,
 ):
     """Start scraping in the background. Poll GET /scrape/status for progress."""
     if _scrape_status.get("running"):
         return {"ok": False, "message": "Scrape already running", "status": _scrape_status}
 
-    background_tasks.add_task(
-        _run_scrape, 
-        request.newspaper_id, 
-        request.max_articles, 
-        request.max_pages,
-        request.start_date,
-        request.end_date
-    )
-    return {"ok": True, "message": "Scrape started", "newspaper_id": request.newspaper_id}
+    # Reuse the app's long-lived browser (see main.lifespan) instead of launching one per scrape
+    browser_manager = getattr(http_request.app.state, "browser", None)
+    background_tasks.add_task(_run_scrape, request, browser_manager)
+    return {"ok": True, "message": "Scrape started", "newspaper_ids": request.newspaper_ids or [request.newspaper_id]}
 
 
 @router.get("/status")
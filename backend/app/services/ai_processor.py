@@ -1,8 +1,11 @@
+import io
 import os
 import json
+import threading
 import warnings
 from dotenv import load_dotenv
-from app.config import BASE_DIR
+from app.config import BASE_DIR, DESCRIBE_BATCH_MAX_PX, GEMINI_CACHE_MAX_MB
+from app.services.gemini_cache import GeminiCache, cache_key
 
 # Load config.env but do not override existing env (so GOOGLE_API_KEY from shell is kept)
 config_path = os.path.join(BASE_DIR, 'config.env')
@@ -19,6 +22,18 @@ if api_key:
 # Model supported by current Gemini API (gemini-1.5-flash often returns 404 on v1beta)
 GEMINI_MODEL = "gemini-2.0-flash"
 
+# Bump when a prompt below changes, so results cached for the old prompt are not reused
+NER_PROMPT_VERSION = 1
+DESCRIBE_PROMPT_VERSION = 1
+
+BATCH_PROMPT = (
+    "Describe each of the {count} numbered images above in Tigrinya. Keep each description concise "
+    "(1-2 sentences). Return ONLY a JSON array of {count} strings, the description of image 1 first."
+)
+
+_cache = None
+_cache_lock = threading.Lock()
+
 
 def get_model():
     """Get the Gemini model instance."""
@@ -30,14 +45,47 @@ def get_model():
         print(f"Error configuring model: {e}")
         return None
 
+def get_cache():
+    """The shared Gemini result cache, or None if GEMINI_CACHE_MAX_MB is 0 or it cannot be opened."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = False
+            if GEMINI_CACHE_MAX_MB > 0:
+                try:
+                    _cache = GeminiCache()
+                except Exception as e:
+                    print(f"Gemini cache disabled: {e}")
+        return _cache or None
+
+
 def perform_ner(text):
     """
     Perform Named Entity Recognition (NER) on the given text.
     Returns a JSON object with lists of Person, Location, and Organization entities.
+    Results for text already analysed (same model and prompt version) come from the cache.
+    Text past 30,000 characters is ignored: whole articles go through AsyncGemini.perform_ner,
+    which sends them in NER_WINDOW_CHARS windows.
+    """
+    return perform_ner_checked(text)[0]
+
+
+def perform_ner_checked(text):
+    """
+    perform_ner's (entities, ok): ok is False when the entities are empty because there is no
+    model (no API key) or the request or its JSON failed, so the caller can try again later.
     """
+    if not text:
+        return {"people": [], "locations": [], "organizations": []}, True
+    text = text[:30000]
+    cache = get_cache()
+    key = cache_key("ner", GEMINI_MODEL, NER_PROMPT_VERSION, text.encode("utf-8"))
+    if cache and (cached := cache.get(key)) is not None:
+        return cached, True
+
     model = get_model()
-    if not model or not text:
-        return {"people": [], "locations": [], "organizations": []}
+    if not model:
+        return {"people": [], "locations": [], "organizations": []}, False
 
     prompt = """
     Analyze the following Tigrinya text and extract named entities.
@@ -50,7 +98,7 @@ def perform_ner(text):
     Do not translate the entities, keep them in Tigrinya.
 
     Text:
-    """ + text[:30000]
+    """ + text
 
     try:
         response = model.generate_content(prompt)
@@ -61,14 +109,17 @@ def perform_ner(text):
         end = result_text.rfind('}')
         if start != -1 and end != -1:
             result_text = result_text[start:end+1]
-        return json.loads(result_text)
+        entities = json.loads(result_text)
+        if cache:
+            cache.put(key, entities)
+        return entities, True
     except Exception as e:
         err_str = str(e)
         if "API key" in err_str and ("expired" in err_str or "invalid" in err_str.lower() or "API_KEY_INVALID" in err_str):
             print("Error performing NER: API key expired or invalid. Set GOOGLE_API_KEY in your shell (e.g. in ~/.zshrc) or put a valid key in config.env.")
         else:
             print(f"Error performing NER: {e}")
-        return {"people": [], "locations": [], "organizations": []}
+        return {"people": [], "locations": [], "organizations": []}, False
 
 def _is_api_key_error(e: Exception) -> bool:
     err = str(e)
@@ -78,28 +129,107 @@ def _is_api_key_error(e: Exception) -> bool:
     )
 
 
-def describe_image(image_path, _api_key_error_logged=None):
+def _log_api_key_error(_api_key_error_logged):
+    if _api_key_error_logged is not None and not _api_key_error_logged.get("done"):
+        _api_key_error_logged["done"] = True
+        print(
+            "Error describing images: API key expired or invalid. "
+            "Set GOOGLE_API_KEY in your shell (e.g. in ~/.zshrc) or put a valid key in config.env."
+        )
+
+
+def _image_cache_key(image_path):
+    with open(image_path, "rb") as f:
+        return cache_key("describe", GEMINI_MODEL, DESCRIBE_PROMPT_VERSION, f.read())
+
+
+def _inline_image(image_path):
+    """The image as an inline JPEG part, downscaled to DESCRIBE_BATCH_MAX_PX on the longer side."""
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        img = img.convert("RGB")
+        img.thumbnail((DESCRIBE_BATCH_MAX_PX, DESCRIBE_BATCH_MAX_PX))
+        buffer = io.BytesIO()
+        img.save(buffer, "JPEG", quality=85)
+    return {"mime_type": "image/jpeg", "data": buffer.getvalue()}
+
+
+def _parse_descriptions(text, count):
+    """The `count` descriptions in a batch response, or None if it is not a JSON array of that many strings."""
+    text = text.replace('```json', '').replace('```', '').strip()
+    start = text.find('[')
+    end = text.rfind(']')
+    try:
+        items = json.loads(text[start:end + 1]) if start != -1 and end > start else None
+    except ValueError:
+        items = None
+    if isinstance(items, list) and len(items) == count and all(isinstance(item, str) for item in items):
+        return [item.strip() for item in items]
+    # A one-image request may be answered with the bare description
+    if count == 1 and items is None and text:
+        return [text.strip('"')]
+    return None
+
+
+def _describe_batch(model, parts):
+    """Descriptions of the inline image `parts` from one request. A malformed response is split in half
+    and retried, down to single images (None for an image still not described); a failed request raises."""
+    content = []
+    for number, part in enumerate(parts, start=1):
+        content += [f"Image {number}:", part]
+    content.append(BATCH_PROMPT.format(count=len(parts)))
+    descriptions = _parse_descriptions(model.generate_content(content).text, len(parts))
+    if descriptions is not None:
+        return descriptions
+    if len(parts) == 1:
+        print("Error describing image: malformed response")
+        return [None]
+    half = len(parts) // 2
+    return _describe_batch(model, parts[:half]) + _describe_batch(model, parts[half:])
+
+
+def describe_images_batch(image_paths, _api_key_error_logged=None):
     """
-    Generate a description of the image in Tigrinya.
-    Uses _api_key_error_logged (mutable container) to log API key errors only once.
+    Generate Tigrinya descriptions of several images in one request (callers send DESCRIBE_BATCH_SIZE
+    at a time, see pdf_service.describe_images_async). Images are sent inline (downscaled), so there
+    are no uploads; returns one description per path: "" for images that are missing or unreadable,
+    None where there is no model (no API key) or the request failed, so the caller can try again later.
+    Cached descriptions are reused.
     """
-    model = get_model()
-    if not model or not os.path.exists(image_path):
-        return ""
+    descriptions = [""] * len(image_paths)
+    cache = get_cache()
+    todo = []
+    for position, image_path in enumerate(image_paths):
+        if not os.path.exists(image_path):
+            continue
+        key = None
+        if cache:
+            key = _image_cache_key(image_path)
+            if (cached := cache.get(key)) is not None:
+                descriptions[position] = cached
+                continue
+        try:
+            todo.append((position, key, _inline_image(image_path)))
+        except Exception as e:
+            print(f"Error reading image {image_path}: {e}")
 
+    model = get_model() if todo else None
+    if not model:
+        for position, _, _ in todo:
+            descriptions[position] = None
+        return descriptions
     try:
-        sample_file = genai.upload_file(path=image_path, display_name="Image")
-        prompt = "Describe this image in Tigrinya. Keep the description concise (1-2 sentences)."
-        response = model.generate_content([sample_file, prompt])
-        return response.text.strip()
+        results = _describe_batch(model, [part for _, _, part in todo])
     except Exception as e:
+        # Quota, rate limit or network: leave these for a later run
         if _is_api_key_error(e):
-            if _api_key_error_logged is not None and not _api_key_error_logged.get("done"):
-                _api_key_error_logged["done"] = True
-                print(
-                    "Error describing images: API key expired or invalid. "
-                    "Set GOOGLE_API_KEY in your shell (e.g. in ~/.zshrc) or put a valid key in config.env."
-                )
+            _log_api_key_error(_api_key_error_logged)
         else:
-            print(f"Error describing image {image_path}: {e}")
-        return ""
+            print(f"Error describing images: {e}")
+        results = [None] * len(todo)
+    for (position, key, _), description in zip(todo, results):
+        descriptions[position] = description
+        if cache and description:
+            cache.put(key, description)
+    return descriptions
@@ -0,0 +1,118 @@
+"""Long-lived shared Chromium for backend scrape jobs: one browser process, an isolated context per job."""
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Optional
+
+
+class BrowserManager:
+    """Keep one headless Chromium alive for the app's lifetime and hand out browser contexts.
+
+    The browser starts on first use and is relaunched if it crashed or disconnected. At most
+    `max_contexts` contexts exist at once; further jobs wait for a free slot. Contexts share
+    nothing (cookies, cache, storage), so concurrent jobs stay isolated.
+    """
+
+    def __init__(self, max_contexts: int = 2):
+        self.max_contexts = max(1, max_contexts)
+        self.restarts = 0
+        self.active_contexts = 0
+        self._playwright = None
+        self._browser = None
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_contexts)
+
+    def _connected(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _ensure_browser(self):
+        async with self._lock:
+            if self._connected():
+                return self._browser
+            if self._browser is not None:
+                # Crashed or disconnected: drop the dead handle and launch a fresh one
+                self.restarts += 1
+                self._browser = None
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+
+    @asynccontextmanager
+    async def context(self, **context_options):
+        """Yield a fresh browser context (closed afterwards), waiting if `max_contexts` are in use."""
+        async with self._slots:
+            browser = await self._ensure_browser()
+            context = await browser.new_context(**context_options)
+            self.active_contexts += 1
+            try:
+                yield context
+            finally:
+                self.active_contexts -= 1
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
+    def lazy_context(self) -> "ManagedContext":
+        """A context handle for PlaywrightFetcher that only takes a slot once a page is needed."""
+        return ManagedContext(self)
+
+    async def health(self) -> dict:
+        """Browser status; relaunches it if it was started before but is no longer connected."""
+        started = self._browser is not None
+        connected = self._connected()
+        error = None
+        if started and not connected:
+            try:
+                await self._ensure_browser()
+                connected = self._connected()
+            except Exception as e:
+                error = str(e)
+        return {
+            "ok": connected or not started,
+            "started": started,
+            "connected": connected,
+            "active_contexts": self.active_contexts,
+            "max_contexts": self.max_contexts,
+            "restarts": self.restarts,
+            "error": error,
+        }
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+class ManagedContext:
+    """Same interface as fetchers.LazyBrowser (`get()` / `close()`), backed by a BrowserManager context."""
+
+    def __init__(self, manager: BrowserManager):
+        self.manager = manager
+        self._stack: Optional[AsyncExitStack] = None
+        self._context = None
+        self._lock = asyncio.Lock()
+
+    async def get(self):
+        async with self._lock:
+            if self._context is not None and not self._context.browser.is_connected():
+                # The shared browser died mid-job: release the dead context and take a new one
+                await self.close()
+            if self._context is None:
+                self._stack = AsyncExitStack()
+                self._context = await self._stack.enter_async_context(self.manager.context())
+            return self._context
+
+    async def close(self):
+        if self._stack is not None:
+            await self._stack.aclose()
+        self._stack = None
+        self._context = None
@@ -0,0 +1,112 @@
+"""Deferred images (IMAGE_PROCESSING=deferred): saved and described on first request or by a background worker."""
+import os
+import threading
+from typing import Dict, List, Optional
+
+from app.config import IMAGE_QUEUE_DELAY, PDFS_DIR
+from app.services.image_index import ImageIndex
+from app.services.json_store import write_json_atomic
+from app.services.pdf_service import complete_pending_images, completed_images_path, has_pending, load_raw_data
+from app.services.pdf_store import store_path
+
+# How often the background worker looks for new pending images once it has none left
+IDLE_POLL_SECONDS = 60
+
+# Creating the shared ImageIndex (it locks its own lookups, adds and saves) and saving it with completed.json
+_write_lock = threading.Lock()
+_pdf_locks: Dict[str, threading.Lock] = {}
+_pdf_locks_guard = threading.Lock()
+_index: Optional[ImageIndex] = None
+
+
+def _pdf_lock(sha256: str) -> threading.Lock:
+    with _pdf_locks_guard:
+        return _pdf_locks.setdefault(sha256, threading.Lock())
+
+
+def _image_index() -> ImageIndex:
+    global _index
+    with _write_lock:
+        if _index is None:
+            _index = ImageIndex()
+        return _index
+
+
+def pending_hashes(raw_data: List[Dict]) -> List[str]:
+    """Content hashes of PDFs with pending images, in raw_data order."""
+    hashes = []
+    for entry in raw_data:
+        sha256 = entry.get("pdf_sha256")
+        if sha256 and sha256 not in hashes and has_pending(entry.get("images")):
+            hashes.append(sha256)
+    return hashes
+
+
+def _pdf_path(sha256: str, entry: Dict) -> Optional[str]:
+    for path in (store_path(sha256), os.path.join(PDFS_DIR, entry.get("pdf_filename") or "")):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def complete_images(sha256: str) -> Optional[List[Dict]]:
+    """Save and describe the pending images of the PDF with this hash.
+
+    The result goes to completed_images_path(sha256), not raw_data.json: readers merge it in
+    (load_raw_data) and the next processing run writes it into raw_data.json. Returns the PDF's
+    image list (unchanged if nothing was pending or the PDF is gone), or None if no article has this
+    hash. Concurrent calls for one PDF wait for the first instead of redoing it.
+    """
+    with _pdf_lock(sha256):
+        entry = next((e for e in load_raw_data() if e.get("pdf_sha256") == sha256), None)
+        if entry is None:
+            return None
+        images = entry.get("images", [])
+        pdf_path = _pdf_path(sha256, entry)
+        if not has_pending(images) or pdf_path is None:
+            return images
+
+        index = _image_index()
+        completed = complete_pending_images(pdf_path, sha256, images, index, {})
+        with _write_lock:
+            write_json_atomic(completed_images_path(sha256), {"pending": images, "images": completed})
+            index.save()
+        return completed
+
+
+class BackgroundImageWorker:
+    """Low-priority thread that completes pending images one PDF at a time, in raw_data order.
+
+    It waits `delay` seconds after each PDF, so article requests (which complete their own PDF
+    first) and other work are not crowded out. PDFs that fail are not retried until restart.
+    """
+
+    def __init__(self, delay: float = IMAGE_QUEUE_DELAY):
+        self.delay = delay
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._failed: set = set()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="deferred-images", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            hashes = [h for h in pending_hashes(load_raw_data()) if h not in self._failed]
+            if not hashes:
+                self._stop.wait(IDLE_POLL_SECONDS)
+                continue
+            sha256 = hashes[0]
+            try:
+                images = complete_images(sha256)
+                if images is None or has_pending(images):
+                    self._failed.add(sha256)
+            except Exception as e:
+                print(f"Deferred images for {sha256[:12]} failed: {e}")
+                self._failed.add(sha256)
+            self._stop.wait(self.delay)
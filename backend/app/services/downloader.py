@@ -0,0 +1,136 @@
+"""Async PDF downloader: shared keep-alive connection pool, bounded parallelism, streaming and resumable writes."""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import httpx
+
+from app.services.rate_limiter import HostRateLimiter, limited_transport
+
+CHUNK_SIZE = 256 * 1024
+PART_SUFFIX = ".part"
+# Next to a .part file: the ETag or Last-Modified of the response it came from, sent as If-Range on resume
+VALIDATOR_SUFFIX = ".validator"
+
+
+class PdfDownloader:
+    """Download files through one httpx client, at most `concurrency` at a time.
+
+    Each response is streamed in chunks to `<dest>.part` and renamed into place once complete,
+    so a crash never leaves a truncated file under the final name. If a `.part` file is already
+    there (an interrupted earlier attempt), the download resumes with an HTTP Range request
+    guarded by If-Range, so a file changed on the server is fetched again in full rather than
+    stitched onto the old bytes. A .part file without a saved validator is started over.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, concurrency: int = 4, retries: int = 3):
+        self.client = client
+        self.retries = max(0, retries)
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def download(self, url: str, dest_path: str) -> int:
+        """Download `url` to `dest_path`. Returns the file size in bytes; raises on failure."""
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                try:
+                    await self._stream_to_part(url, dest_path + PART_SUFFIX)
+                    break
+                except httpx.TransportError:
+                    # Connection dropped mid-transfer: keep the .part file and resume from where it stopped
+                    attempt += 1
+                    if attempt > self.retries:
+                        raise
+                    await asyncio.sleep(min(2 ** attempt, 10))
+            os.replace(dest_path + PART_SUFFIX, dest_path)
+            _remove(dest_path + PART_SUFFIX + VALIDATOR_SUFFIX)
+            return os.path.getsize(dest_path)
+
+    async def _stream_to_part(self, url: str, part_path: str) -> None:
+        validator_path = part_path + VALIDATOR_SUFFIX
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        validator = _read(validator_path) if offset else None
+        if offset and not validator:
+            # Nothing to tell whether the server's file is still the one these bytes came from
+            _remove(part_path)
+            offset = 0
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator} if offset else {}
+
+        async with self.client.stream("GET", url, headers=headers) as r:
+            if offset and r.status_code == 416:
+                if _total_size(r) == offset:
+                    return  # The .part file already holds the whole body
+                restart = True  # The file on the server is now shorter than the .part file
+            else:
+                r.raise_for_status()
+                # A 206 must continue exactly where the .part file ends
+                restart = r.status_code == 206 and _range_start(r) != offset
+                if restart and not offset:
+                    raise httpx.DecodingError(f"Unrequested partial response for {url}")
+            if not restart:
+                # Servers that ignore Range, or whose file changed (If-Range), answer 200 with the full body
+                resume = bool(offset) and r.status_code == 206
+                if not resume:
+                    _write_validator(validator_path, r)
+                with open(part_path, "ab" if resume else "wb") as f:
+                    async for chunk in r.aiter_bytes(CHUNK_SIZE):
+                        f.write(chunk)
+                return
+        _remove(part_path)
+        _remove(validator_path)
+        await self._stream_to_part(url, part_path)
+
+
+def _total_size(response: httpx.Response) -> Optional[int]:
+    """Total size from a `Content-Range: bytes */1234` header, if present."""
+    value = response.headers.get("Content-Range", "")
+    try:
+        return int(value.rsplit("/", 1)[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def _range_start(response: httpx.Response) -> Optional[int]:
+    """First byte position from a `Content-Range: bytes 100-199/1234` header, if present."""
+    value = response.headers.get("Content-Range", "")
+    try:
+        return int(value.split()[1].split("-", 1)[0])
+    except (IndexError, ValueError):
+        return None
+
+
+def _write_validator(path: str, response: httpx.Response) -> None:
+    # If-Range only accepts strong ETags; otherwise fall back to Last-Modified
+    etag = response.headers.get("ETag", "")
+    validator = etag if etag and not etag.startswith("W/") else response.headers.get("Last-Modified")
+    if validator:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(validator)
+    else:
+        _remove(path)
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+@asynccontextmanager
+async def open_downloader(concurrency: int = 4, retries: int = 3, limiter: Optional[HostRateLimiter] = None):
+    """Yield a PdfDownloader backed by a keep-alive pool sized to `concurrency`, rate limited through `limiter` if given."""
+    limits = httpx.Limits(max_connections=max(1, concurrency), max_keepalive_connections=max(1, concurrency))
+    timeout = httpx.Timeout(60.0, connect=30.0)
+    transport = limited_transport(limiter, limits)
+    async with httpx.AsyncClient(transport=transport, timeout=timeout, follow_redirects=True) as client:
+        yield PdfDownloader(client, concurrency=concurrency, retries=retries)
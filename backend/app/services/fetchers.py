@@ -0,0 +1,372 @@
+"""Page fetchers for the scraper: plain HTTP fast path with Playwright as a fallback.
+
+Every fetcher exposes the same two coroutines, where `site` is a newspaper entry from
+app.config.NEWSPAPERS (its selectors, site_url and pdf_url_hints):
+- fetch_listing(url, site) -> list of {"href", "date_text"} dicts, or None if the page does not exist
+- fetch_article(url, site) -> {"title", "date", "pdf_url"} dict, or None if the page could not be loaded
+"""
+import asyncio
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Optional
+
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+
+from app.services.rate_limiter import HostRateLimiter, limited_transport
+
+FETCHER_MODES = ("auto", "http", "playwright")
+
+# Lean browser navigation: skip everything but the HTML and wait only for the elements we read
+BLOCKED_RESOURCE_TYPES = ("image", "media", "font", "stylesheet")
+BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net", "facebook.net", "facebook.com/tr")
+# Per-stage timeouts in ms: the navigation itself, then the wait for listing items or the PDF link
+GOTO_TIMEOUT_MS = 20000
+LISTING_SELECTOR_TIMEOUT_MS = 10000
+ARTICLE_SELECTOR_TIMEOUT_MS = 5000
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+
+def absolute_url(href: str, site_url: str) -> str:
+    return href if href.startswith("http") else f"{site_url.rstrip('/')}{href}"
+
+
+def pick_pdf_url(icon_href: Optional[str], pdf_hrefs: list[str], site: dict) -> Optional[str]:
+    """Choose the issue PDF: the link wrapping the download icon first, then any .pdf link matching the site's pdf_url_hints."""
+    hints = site["pdf_url_hints"]
+    if icon_href and (icon_href.endswith(".pdf") or any(hint in icon_href for hint in hints)):
+        return absolute_url(icon_href, site["site_url"])
+    for href in pdf_hrefs:
+        if href and any(hint in href for hint in hints):
+            return absolute_url(href, site["site_url"])
+    return None
+
+
+def parse_listing_html(html: str, site: dict) -> list[dict]:
+    """Parse listing items out of server-rendered HTML (same selectors as the Playwright path)."""
+    tree = LexborHTMLParser(html)
+    items = []
+    for article in tree.css(site["listing_item_selector"]):
+        date_el = article.css_first(site["listing_date_selector"])
+        link = article.css_first(site["listing_link_selector"])
+        items.append({
+            "href": link.attributes.get("href") if link else None,
+            "date_text": (date_el.text() or "").strip() if date_el else None,
+        })
+    return items
+
+
+def parse_article_html(html: str, site: dict) -> dict:
+    """Parse title, date and PDF link out of a server-rendered article page."""
+    tree = LexborHTMLParser(html)
+    title_el = tree.css_first(site["article_title_selector"])
+    date_el = tree.css_first(site["article_date_selector"])
+
+    icon_href = None
+    icon = tree.css_first(site["pdf_icon_selector"])
+    if icon:
+        parent = icon.parent
+        while parent is not None and parent.tag != "a":
+            parent = parent.parent
+        if parent is not None:
+            icon_href = parent.attributes.get("href")
+
+    pdf_hrefs = [link.attributes.get("href") for link in tree.css(site["pdf_link_selector"])]
+    return {
+        "title": (title_el.text() or "").strip() if title_el else None,
+        "date": (date_el.text() or "").strip() if date_el else None,
+        "pdf_url": pick_pdf_url(icon_href, pdf_hrefs, site),
+    }
+
+
+class LatencyLog:
+    """Per-page fetch latencies, grouped by "<fetcher>_<listing|article>"."""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        self.samples.setdefault(key, []).append(seconds)
+
+    def summary(self) -> dict:
+        out = {}
+        for key, values in self.samples.items():
+            ordered = sorted(values)
+            out[key] = {
+                "pages": len(ordered),
+                "mean_ms": round(1000 * sum(ordered) / len(ordered), 1),
+                "p50_ms": round(1000 * ordered[len(ordered) // 2], 1),
+                "p95_ms": round(1000 * ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+            }
+        return out
+
+
+class HttpFetcher:
+    """Fetch pages with plain HTTP requests and parse them with selectolax (no browser)."""
+
+    name = "http"
+
+    def __init__(self, client: httpx.AsyncClient, latency: Optional[LatencyLog] = None):
+        self.client = client
+        self.latency = latency or LatencyLog()
+
+    async def _get_html(self, url: str) -> Optional[str]:
+        r = await self.client.get(url)
+        if r.status_code == 404:
+            return None
+        r.raise_for_status()
+        return r.text
+
+    async def fetch_listing(self, url: str, site: dict) -> Optional[list[dict]]:
+        started = time.perf_counter()
+        html = await self._get_html(url)
+        self.latency.record("http_listing", time.perf_counter() - started)
+        return None if html is None else parse_listing_html(html, site)
+
+    async def fetch_article(self, url: str, site: dict) -> Optional[dict]:
+        started = time.perf_counter()
+        html = await self._get_html(url)
+        self.latency.record("http_article", time.perf_counter() - started)
+        return None if html is None else parse_article_html(html, site)
+
+
+class LazyBrowser:
+    """Start Chromium on first use only, so HTTP-only scrapes never pay for a browser."""
+
+    def __init__(self):
+        self._playwright = None
+        self._browser = None
+        self._lock = asyncio.Lock()
+
+    async def get(self):
+        async with self._lock:
+            if self._browser is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+
+    async def close(self):
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+class PlaywrightFetcher:
+    """Render pages in Chromium through a pool of at most `concurrency` browser pages.
+
+    In `lean` mode (the default) images, media, fonts, stylesheets and analytics requests are
+    aborted, navigation only waits for DOMContentLoaded, and then for the selectors we actually
+    read, each stage with its own timeout. `lean=False` keeps the old full load: networkidle
+    plus a fixed 2 s settle on listing pages.
+    """
+
+    name = "playwright"
+
+    def __init__(
+        self,
+        browser: LazyBrowser,
+        concurrency: int = 4,
+        limiter: Optional[HostRateLimiter] = None,
+        lean: bool = True,
+        latency: Optional[LatencyLog] = None,
+    ):
+        self.browser = browser
+        self.concurrency = max(1, concurrency)
+        self.limiter = limiter
+        self.lean = lean
+        self.latency = latency or LatencyLog()
+        self._pool: asyncio.Queue = asyncio.Queue()
+        self._pages: list = []
+        # Pages being opened: counted before the awaits, so concurrent callers cannot overshoot `concurrency`
+        self._opening = 0
+
+    async def _acquire(self):
+        # Pages die with their browser; drop them so a restarted browser gets fresh ones
+        while not self._pool.empty():
+            page = self._pool.get_nowait()
+            if not page.is_closed():
+                return page
+            self._pages.remove(page)
+        if len(self._pages) + self._opening < self.concurrency:
+            self._opening += 1
+            try:
+                page = await (await self.browser.get()).new_page()
+                if self.lean:
+                    await page.route("**/*", _block_non_documents)
+            finally:
+                self._opening -= 1
+            self._pages.append(page)
+            return page
+        return await self._pool.get()
+
+    async def _goto(self, page, url: str, selector: str, selector_timeout_ms: int) -> None:
+        if self.limiter:
+            await self.limiter.acquire(url)
+        if self.lean:
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=GOTO_TIMEOUT_MS)
+        else:
+            response = await page.goto(url)
+        if self.limiter and response is not None:
+            self.limiter.feedback(url, response.status, response.headers.get("retry-after"))
+
+        if self.lean:
+            try:
+                await page.wait_for_selector(selector, state="attached", timeout=selector_timeout_ms)
+            except Exception:
+                pass  # Parse whatever is there; empty results trigger the usual fallbacks
+        else:
+            await page.wait_for_load_state("networkidle")
+
+    async def fetch_listing(self, url: str, site: dict) -> Optional[list[dict]]:
+        page = await self._acquire()
+        try:
+            started = time.perf_counter()
+            try:
+                await self._goto(page, url, site["listing_item_selector"], LISTING_SELECTOR_TIMEOUT_MS)
+                if not self.lean:
+                    await page.wait_for_timeout(2000)
+            except Exception:
+                return None
+            finally:
+                self.latency.record("playwright_listing", time.perf_counter() - started)
+
+            items = []
+            for article in await page.query_selector_all(site["listing_item_selector"]):
+                try:
+                    date_el = await article.query_selector(site["listing_date_selector"])
+                    date_text = (await date_el.text_content()).strip() if date_el else None
+                    link = await article.query_selector(site["listing_link_selector"])
+                    href = await link.get_attribute("href") if link else None
+                    items.append({"href": href, "date_text": date_text})
+                except Exception:
+                    continue
+            return items
+        finally:
+            self._pool.put_nowait(page)
+
+    async def fetch_article(self, url: str, site: dict) -> Optional[dict]:
+        page = await self._acquire()
+        try:
+            started = time.perf_counter()
+            try:
+                pdf_selector = f'{site["pdf_icon_selector"]}, {site["pdf_link_selector"]}'
+                await self._goto(page, url, pdf_selector, ARTICLE_SELECTOR_TIMEOUT_MS)
+            except Exception:
+                return None
+            finally:
+                self.latency.record("playwright_article", time.perf_counter() - started)
+
+            title_el = await page.query_selector(site["article_title_selector"])
+            date_el = await page.query_selector(site["article_date_selector"])
+
+            icon_href = None
+            icon = await page.query_selector(site["pdf_icon_selector"])
+            if icon:
+                parent = await icon.query_selector("xpath=ancestor::a[1]")
+                if parent:
+                    icon_href = await parent.get_attribute("href")
+
+            pdf_hrefs = [await link.get_attribute("href") for link in await page.query_selector_all(site["pdf_link_selector"])]
+            return {
+                "title": (await title_el.text_content()).strip() if title_el else None,
+                "date": (await date_el.text_content()).strip() if date_el else None,
+                "pdf_url": pick_pdf_url(icon_href, pdf_hrefs, site),
+            }
+        finally:
+            self._pool.put_nowait(page)
+
+    async def close(self):
+        for page in self._pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        self._pages.clear()
+
+
+async def _block_non_documents(route) -> None:
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class FallbackFetcher:
+    """Try the primary fetcher and use the fallback only when its selectors come back empty (or it errors)."""
+
+    def __init__(self, primary, fallback):
+        self.primary = primary
+        self.fallback = fallback
+        self.name = f"{primary.name}+{fallback.name}"
+        self.fallbacks = 0
+        self.latency = primary.latency
+
+    async def fetch_listing(self, url: str, site: dict) -> Optional[list[dict]]:
+        try:
+            items = await self.primary.fetch_listing(url, site)
+            if items is None or any(item.get("href") for item in items):
+                return items
+        except Exception:
+            pass
+        self.fallbacks += 1
+        return await self.fallback.fetch_listing(url, site)
+
+    async def fetch_article(self, url: str, site: dict) -> Optional[dict]:
+        try:
+            info = await self.primary.fetch_article(url, site)
+            if info is None or info.get("pdf_url"):
+                return info
+        except Exception:
+            pass
+        self.fallbacks += 1
+        return await self.fallback.fetch_article(url, site)
+
+
+@asynccontextmanager
+async def open_fetcher(
+    mode: str = "auto",
+    concurrency: int = 4,
+    limiter: Optional[HostRateLimiter] = None,
+    lean_browser: bool = True,
+    browser_manager=None,
+):
+    """Yield a fetcher for `mode` ("auto": HTTP with Playwright fallback, "http", or "playwright") and clean it up.
+
+    With a `limiter`, every page request (HTTP or browser navigation) waits for its host's rate limit.
+    Per-page latencies of all fetchers are collected in the yielded fetcher's `latency` log.
+    With a `browser_manager` (the backend's shared BrowserManager) Playwright pages come from a
+    context on its long-lived browser instead of launching a browser for this scrape.
+    """
+    if mode not in FETCHER_MODES:
+        raise ValueError(f"Unknown fetcher mode: {mode} (expected one of {', '.join(FETCHER_MODES)})")
+
+    async with AsyncExitStack() as stack:
+        browser = browser_manager.lazy_context() if browser_manager else LazyBrowser()
+        stack.push_async_callback(browser.close)
+        latency = LatencyLog()
+        playwright_fetcher = PlaywrightFetcher(browser, concurrency, limiter, lean=lean_browser, latency=latency)
+        stack.push_async_callback(playwright_fetcher.close)
+        if mode == "playwright":
+            yield playwright_fetcher
+            return
+
+        limits = httpx.Limits(max_connections=max(1, concurrency), max_keepalive_connections=max(1, concurrency))
+        client = httpx.AsyncClient(
+            headers=HTTP_HEADERS, transport=limited_transport(limiter, limits), timeout=30, follow_redirects=True
+        )
+        stack.push_async_callback(client.aclose)
+        http_fetcher = HttpFetcher(client, latency)
+        if mode == "http":
+            yield http_fetcher
+        else:
+            yield FallbackFetcher(http_fetcher, playwright_fetcher)
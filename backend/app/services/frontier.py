@@ -0,0 +1,52 @@
+"""Persistent URL frontier: which article pages and PDFs the scraper has already handled."""
+from datetime import datetime
+from typing import Optional
+
+from app.config import FRONTIER_PATH
+from app.services.json_store import load_json, write_json_atomic
+
+# Article statuses that mean "nothing left to do for this URL"
+DONE_ARTICLE_STATUSES = ("completed", "no_pdf")
+
+
+class UrlFrontier:
+    """Seen article URLs and PDF URLs with their status, stored as JSON in DATA_DIR.
+
+    Layout: {"articles": {url: {"status", "pdf_url", "updated_at"}},
+             "pdfs": {url: {"status", "filepath", "sha256", "article_url", "updated_at"}}}
+    Failed entries are kept but not treated as known, so the next run retries them.
+    PDFs rejected by the date check are "out_of_range" with the `checked_year`; runs for that year
+    skip them, other runs download them again.
+    """
+
+    def __init__(self, path: str = FRONTIER_PATH):
+        self.path = path
+        data = load_json(path, {})
+        self.articles: dict = data.get("articles", {})
+        self.pdfs: dict = data.get("pdfs", {})
+
+    def is_known_article(self, url: str) -> bool:
+        return self.articles.get(url, {}).get("status") in DONE_ARTICLE_STATUSES
+
+    def completed_pdf(self, url: str) -> Optional[dict]:
+        """The frontier record for an already downloaded PDF, or None."""
+        record = self.pdfs.get(url)
+        return record if record and record.get("status") == "completed" else None
+
+    def out_of_range_pdf(self, url: str, year: int) -> bool:
+        """Whether the PDF at `url` was downloaded before and its first page did not show `year`."""
+        record = self.pdfs.get(url)
+        return bool(record) and record.get("status") == "out_of_range" and record.get("checked_year") == year
+
+    def mark_article(self, url: str, status: str, **fields) -> None:
+        self.articles[url] = {**self.articles.get(url, {}), **fields, "status": status, "updated_at": _now()}
+
+    def mark_pdf(self, url: str, status: str, **fields) -> None:
+        self.pdfs[url] = {**self.pdfs.get(url, {}), **fields, "status": status, "updated_at": _now()}
+
+    def save(self) -> None:
+        write_json_atomic(self.path, {"articles": self.articles, "pdfs": self.pdfs})
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
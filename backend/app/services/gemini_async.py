@@ -0,0 +1,51 @@
+"""Async Gemini client: ai_processor's NER and image description calls with a concurrency limit."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional, Tuple
+
+from app.config import GEMINI_CONCURRENCY
+from app.services import ai_processor
+from app.services.ner_windows import merge_entities, ner_windows
+
+
+class AsyncGemini:
+    """Awaitable perform_ner / describe_images with at most `concurrency` requests in flight.
+
+    google-generativeai's calls block (its async transport stays bound to the first event loop), so
+    each call runs on this client's own thread pool. Use one client per event
+    loop, e.g. `with AsyncGemini() as client: asyncio.run(main(client))`.
+    """
+
+    def __init__(self, concurrency: int = GEMINI_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="gemini")
+
+    async def _call(self, fn: Callable, *args, **kwargs):
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def perform_ner(self, text: str) -> Tuple[dict, bool]:
+        """(entities, ok) for the whole text: its sentence windows (see ner_windows) analysed concurrently,
+        then merged. ok is False if any window failed (see ai_processor.perform_ner_checked)."""
+        windows = ner_windows(text)
+        results = await asyncio.gather(*(self._call(ai_processor.perform_ner_checked, w) for w in windows))
+        return merge_entities(entities for entities, _ in results), all(ok for _, ok in results)
+
+    async def describe_images(
+        self, image_paths: List[str], api_key_error_logged: Optional[dict] = None
+    ) -> List[Optional[str]]:
+        """Descriptions of `image_paths` from one request, None for images that failed (in order)."""
+        describe = partial(ai_processor.describe_images_batch, _api_key_error_logged=api_key_error_logged)
+        return await self._call(describe, image_paths)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AsyncGemini":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,89 @@
+"""Disk cache of Gemini results keyed by input content, model and prompt version (SQLite in DATA_DIR)."""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from app.config import GEMINI_CACHE_MAX_MB, GEMINI_CACHE_PATH
+
+# Once over the size limit, least recently used entries are dropped until this fraction of it is left
+EVICT_TO = 0.9
+
+
+def cache_key(kind: str, model: str, prompt_version: int, content: bytes) -> str:
+    """Key for one request: the kind of call, the model, the prompt version and a hash of the input."""
+    digest = hashlib.sha256(content).hexdigest()
+    return f"{kind}:{model}:v{prompt_version}:{digest}"
+
+
+class GeminiCache:
+    """JSON values by cache_key in SQLite, with least-recently-used eviction above `max_bytes`.
+
+    Safe to share between threads; several processes may use one file (WAL mode). `hits` and
+    `misses` count lookups made through this instance.
+    """
+
+    def __init__(self, path: str = GEMINI_CACHE_PATH, max_bytes: int = int(GEMINI_CACHE_MAX_MB * 1_000_000)):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._bytes = self._total_bytes()
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+            return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        data = json.dumps(value, ensure_ascii=False)
+        size = len(key) + len(data.encode("utf-8"))
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, data, size, time.time()),
+            )
+            self._bytes += size - (old[0] if old else 0)
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Other processes may have written too: evict against the real total
+        self._bytes = self._total_bytes()
+        target = int(self.max_bytes * EVICT_TO)
+        evicted = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_used"):
+            if self._bytes <= target:
+                break
+            evicted.append((key,))
+            self._bytes -= size
+        self._conn.execute("BEGIN")
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        self._conn.execute("COMMIT")
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": self._bytes}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
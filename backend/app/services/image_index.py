@@ -0,0 +1,99 @@
+"""Perceptual-hash index of described images, so repeated mastheads, logos and ads are described once."""
+import threading
+from typing import Optional
+
+from app.config import IMAGE_HASH_MAX_DISTANCE, IMAGE_INDEX_PATH
+from app.services.json_store import load_json, write_json_atomic
+
+HASH_BITS = 128
+# The hash is split into BANDS chunks; two hashes within BANDS - 1 bits of each other share at least one chunk
+BANDS = 16
+BAND_BITS = HASH_BITS // BANDS
+# 9x9 greyscale thumbnails with less contrast than this are flat fills: too little structure to hash
+MIN_CONTRAST = 8
+
+
+def dhash(image_path: str) -> Optional[tuple[Optional[int], int, int]]:
+    """(128-bit difference hash, width, height) of the image, or None if it cannot be read.
+
+    The image is shrunk to 9x9 greyscale; 64 bits record whether each pixel is brighter than its
+    right neighbour and 64 whether it is brighter than the one below, so re-encodes, rescales and
+    small edits keep (nearly) the same hash. The hash is None for flat, single-colour images.
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(image_path) as img:
+            width, height = img.size
+            pixels = list(img.convert("L").resize((9, 9), Image.LANCZOS).getdata())
+    except Exception:
+        return None
+    if max(pixels) - min(pixels) < MIN_CONTRAST:
+        return None, width, height
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[(row + 1) * 9 + col])
+    return value, width, height
+
+
+def _bands(value: int) -> list[tuple[int, int]]:
+    mask = (1 << BAND_BITS) - 1
+    return [(band, (value >> (band * BAND_BITS)) & mask) for band in range(BANDS)]
+
+
+class ImageIndex:
+    """Described images by perceptual hash, persisted as JSON (default image_index.json in DATA_DIR).
+
+    `lookup` finds a stored description whose hash is within `max_distance` bits (Hamming
+    distance); candidates come from a per-band table, so lookups do not scan the whole corpus.
+    With `path` None the index starts empty and is never saved. Safe to share between threads
+    (the backend's image requests and deferred-image worker each run their own event loop).
+    """
+
+    def __init__(self, path: Optional[str] = IMAGE_INDEX_PATH, max_distance: int = IMAGE_HASH_MAX_DISTANCE):
+        self.path = path
+        # Exact band matches are only guaranteed up to BANDS - 1 differing bits
+        self.max_distance = min(max_distance, BANDS - 1)
+        self._entries: list[dict] = load_json(path, []) if path else []
+        self._hashes: list[int] = []
+        self._by_band: dict[tuple[int, int], list[int]] = {}
+        # add() updates _entries, _hashes and _by_band in separate steps
+        self._lock = threading.Lock()
+        for entry in self._entries:
+            self._insert(int(entry["hash"], 16))
+
+    def _insert(self, value: int) -> None:
+        position = len(self._hashes)
+        self._hashes.append(value)
+        for key in _bands(value):
+            self._by_band.setdefault(key, []).append(position)
+
+    def lookup(self, value: int) -> Optional[dict]:
+        """The closest stored entry ({hash, description, source}) within max_distance bits, or None."""
+        best, best_distance = None, self.max_distance + 1
+        seen = set()
+        with self._lock:
+            for key in _bands(value):
+                for position in self._by_band.get(key, ()):
+                    if position in seen:
+                        continue
+                    seen.add(position)
+                    distance = bin(self._hashes[position] ^ value).count("1")
+                    if distance < best_distance:
+                        best, best_distance = self._entries[position], distance
+        return best
+
+    def add(self, value: int, description: str, source: str = "") -> None:
+        with self._lock:
+            self._entries.append({"hash": f"{value:032x}", "description": description, "source": source})
+            self._insert(value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self) -> None:
+        if self.path:
+            with self._lock:
+                write_json_atomic(self.path, self._entries)
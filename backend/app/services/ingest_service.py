@@ -36,15 +36,24 @@ def build_documents_from_raw(
     limit: Optional[int] = None,
     min_words_per_sentence: int = 5,
 ) -> List["Document"]:
-    """Build LlamaIndex Documents from raw_data (one doc per sentence with metadata)."""
+    """Build LlamaIndex Documents from raw_data (one doc per sentence with metadata).
+
+    Articles sharing a `pdf_sha256` (the same issue posted twice) are embedded once.
+    """
     from llama_index.core import Document
 
     articles = raw_data[:limit] if limit else raw_data
     documents = []
+    seen_hashes = set()
     for item in articles:
         text = item.get("extracted_text") or ""
         if not text.strip():
             continue
+        sha256 = item.get("pdf_sha256")
+        if sha256:
+            if sha256 in seen_hashes:
+                continue
+            seen_hashes.add(sha256)
         sentences = split_into_sentences(text, min_words=min_words_per_sentence)
         for i, sent in enumerate(sentences):
             if not sent.strip():
@@ -55,6 +64,7 @@ def build_documents_from_raw(
                 "article_url": item.get("article_url", ""),
                 "publication_date": item.get("publication_date", ""),
                 "pdf_filename": item.get("pdf_filename", ""),
+                "pdf_sha256": item.get("pdf_sha256", ""),
                 "sentence_index": i,
             }
             documents.append(Document(text=sent, metadata=meta))
@@ -0,0 +1,23 @@
+"""Small helpers for the JSON files the pipeline keeps in DATA_DIR."""
+import json
+import os
+from typing import Any
+
+
+def load_json(path: str, default: Any) -> Any:
+    """Load JSON from `path`, returning `default` if the file is missing or unreadable."""
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return default
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON to a temp file next to `path` and rename it into place, so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
@@ -0,0 +1,79 @@
+"""Map-reduce NER helpers: split an article into sentence-bounded windows, merge the windows' entities."""
+import re
+import unicodedata
+from typing import Iterable, Iterator
+
+from app.config import NER_WINDOW_CHARS
+
+ENTITY_KEYS = ("people", "locations", "organizations")
+# Sentence ends: Ge'ez full stop, question mark and paragraph separator, and their Latin counterparts
+_SENTENCE_END = re.compile(r"(?<=[።፧፨.?!])\s+")
+# Stripped from both ends of an entity name (Ge'ez word separator and punctuation, quotes, brackets, dashes)
+_EDGE_CHARS = "፡።፣፤፥፦፧፨.,;:!?\"'“”‘’«»()[]{}-–— "
+
+
+def _pieces(text: str, max_chars: int) -> Iterator[str]:
+    """Sentences of `text`; sentences over max_chars are split at spaces (words over it, anywhere)."""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        if len(sentence) <= max_chars:
+            yield sentence
+            continue
+        part = ""
+        for word in sentence.split():
+            while len(word) > max_chars:
+                if part:
+                    yield part
+                    part = ""
+                yield word[:max_chars]
+                word = word[max_chars:]
+            if part and len(part) + 1 + len(word) > max_chars:
+                yield part
+                part = word
+            else:
+                part = f"{part} {word}" if part else word
+        if part:
+            yield part
+
+
+def ner_windows(text: str, max_chars: int = NER_WINDOW_CHARS) -> list[str]:
+    """Consecutive runs of whole sentences of `text`, each at most `max_chars` characters."""
+    windows, current = [], ""
+    for piece in _pieces(text or "", max_chars):
+        if current and len(current) + 1 + len(piece) > max_chars:
+            windows.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        windows.append(current)
+    return windows
+
+
+def normalize_entity(name: str) -> str:
+    """NFC, single spaces, and no punctuation at either end."""
+    return unicodedata.normalize("NFC", " ".join(name.split())).strip(_EDGE_CHARS)
+
+
+def merge_entities(results: Iterable[dict]) -> dict:
+    """One {people, locations, organizations} result from per-window NER results.
+
+    Names are normalized and de-duplicated per category (ignoring case), keeping first-seen order;
+    malformed results and non-string names are skipped.
+    """
+    merged: dict[str, list[str]] = {key: [] for key in ENTITY_KEYS}
+    seen: dict[str, set] = {key: set() for key in ENTITY_KEYS}
+    for result in results:
+        if not isinstance(result, dict):
+            continue
+        for key in ENTITY_KEYS:
+            names = result.get(key) or []
+            if isinstance(names, str):
+                names = [names]
+            for name in names:
+                if not isinstance(name, str):
+                    continue
+                name = normalize_entity(name)
+                if name and name.casefold() not in seen[key]:
+                    seen[key].add(name.casefold())
+                    merged[key].append(name)
+    return merged
@@ -0,0 +1,111 @@
+"""Persisted page -> date-range index of each newspaper's listing pages, used to jump to old date ranges."""
+from datetime import datetime
+from typing import Any, Optional
+
+from dateutil import parser
+
+from app.config import PAGE_INDEX_PATH
+from app.services.json_store import load_json, write_json_atomic
+
+# Upper bound for the page search; listings are far shorter, missing pages end the search earlier
+MAX_LISTING_PAGE = 2000
+
+
+class PageDateIndex:
+    """Newest/oldest listing date seen on each page, per newspaper.
+
+    Layout: {newspaper_id: {"pages": {"12": {"newest", "oldest", "checked_at"}}}}
+    Entries go stale as new posts push old ones to later pages; `guess_page` corrects for that
+    drift from the posting rate, and every probe or crawl refreshes the pages it loads.
+    """
+
+    def __init__(self, path: str = PAGE_INDEX_PATH):
+        self.path = path
+        self.data: dict = load_json(path, {})
+
+    def record(self, key: str, page_num: int, dates: list[datetime]) -> None:
+        if not dates:
+            return
+        pages = self.data.setdefault(key, {}).setdefault("pages", {})
+        pages[str(page_num)] = {
+            "newest": max(dates).isoformat(),
+            "oldest": min(dates).isoformat(),
+            "checked_at": datetime.now().isoformat(timespec="seconds"),
+        }
+
+    def guess_page(self, key: str, target: datetime) -> Optional[int]:
+        """Estimate today's page number for the first page holding posts on or before `target`."""
+        pages = sorted(
+            (int(p), parser.parse(e["oldest"]), parser.parse(e["newest"]), parser.parse(e["checked_at"]))
+            for p, e in self.data.get(key, {}).get("pages", {}).items()
+        )
+        if not pages:
+            return None
+
+        first, last = pages[0], pages[-1]
+        span_days = (first[2] - last[1]).total_seconds() / 86400
+        days_per_page = span_days / (last[0] - first[0] + 1) if span_days > 0 else None
+
+        match = next((p for p in pages if p[1] <= target), None)
+        if match is None:
+            # Older than anything indexed: extrapolate past the last known page
+            match = last
+            if days_per_page:
+                guess = last[0] + (last[1] - target).total_seconds() / 86400 / days_per_page
+            else:
+                guess = last[0] + 1
+        else:
+            guess = match[0]
+
+        if days_per_page:
+            # Posts published since the page was checked have pushed it further back
+            guess += (datetime.now() - match[3]).total_seconds() / 86400 / days_per_page
+        return max(1, min(MAX_LISTING_PAGE, int(round(guess))))
+
+    async def find_first_page(self, key: str, target: datetime, probe: Any) -> int:
+        """Binary-search the first page whose oldest post is on or before `target`.
+
+        `probe(page_num)` must load the page and return its parsed listing dates (None if the page
+        does not exist). Starts from the indexed guess, gallops outwards to bracket the answer,
+        then bisects, so an old date range costs a handful of page loads.
+        """
+        results: dict[int, bool] = {}
+
+        async def reaches(page_num: int) -> bool:
+            if page_num not in results:
+                dates = await probe(page_num)
+                # Missing pages and pages without parseable dates count as "far enough": starting
+                # earlier than necessary only costs extra pages, never misses articles
+                results[page_num] = not dates or min(dates) <= target
+            return results[page_num]
+
+        guess = self.guess_page(key, target) or 1
+        if await reaches(guess):
+            lo, hi, step = 0, guess, 1
+            while hi > 1:
+                candidate = max(1, hi - step)
+                if not await reaches(candidate):
+                    lo = candidate
+                    break
+                hi, step = candidate, step * 2
+            if hi == 1:
+                return 1
+        else:
+            lo, step = guess, 1
+            while True:
+                candidate = min(MAX_LISTING_PAGE, lo + step)
+                if candidate == lo or await reaches(candidate):
+                    hi = candidate
+                    break
+                lo, step = candidate, step * 2
+
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if await reaches(mid):
+                hi = mid
+            else:
+                lo = mid
+        return hi
+
+    def save(self) -> None:
+        write_json_atomic(self.path, self.data)
@@ -0,0 +1,122 @@
+"""Embedded PDF images: write the image XObjects' own bitmaps instead of re-rendering page crops."""
+import io
+import os
+from typing import Dict, Iterator, List
+
+from app.config import IMAGE_MIN_PAGE_FRACTION, IMAGE_MIN_PX
+
+
+def _save_image(obj, path_prefix: str) -> str:
+    """Write one image object next to `path_prefix`; returns the file path.
+
+    JPEGs are copied as stored. Other images are decoded once and saved as PNG (Gemini does not
+    take JPEG 2000 or TIFF). Images pdfium cannot extract are rasterized from that object alone.
+    """
+    buf = io.BytesIO()
+    try:
+        obj.extract(buf, fb_format="png")
+        data = buf.getvalue()
+    except Exception:
+        data = b""
+
+    if data.startswith(b"\xff\xd8"):
+        path = f"{path_prefix}.jpg"
+    elif data.startswith(b"\x89PNG"):
+        path = f"{path_prefix}.png"
+    else:
+        # JPEG 2000, CMYK TIFF or undecodable: rasterize just this object (mask and transform applied)
+        path = f"{path_prefix}.png"
+        bitmap = obj.get_bitmap(render=True)
+        bitmap.to_pil().save(path)
+        return path
+
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def iter_embedded_images(
+    pdf_path: str,
+    images_dir: str,
+    min_px: int = IMAGE_MIN_PX,
+    min_page_fraction: float = IMAGE_MIN_PAGE_FRACTION,
+    save: bool = True,
+) -> Iterator[List[Dict]]:
+    """Save the images embedded in `pdf_path` into `images_dir`, yielding [{path, page, filename}] per page.
+
+    Images smaller than `min_px` pixels on either side, or covering less than `min_page_fraction`
+    of the page, are skipped (rules, bullets, icons). Files are named page_<n>_img_<i>.<png|jpg>.
+    With `save=False` nothing is decoded: each image is located as {page, object, bbox} for
+    `save_embedded_images` (object is its position among the page's image objects; bbox is
+    [x0, top, x1, bottom] in points from the top-left corner, as for pdfplumber's page.images).
+    """
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page_num, page in enumerate(pdf):
+            images = []
+            try:
+                page_width, page_height = page.get_size()
+                page_area = page_width * page_height
+                objects = page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE])
+                for i, obj in enumerate(objects):
+                    try:
+                        width, height = obj.get_px_size()
+                        left, bottom, right, top = obj.get_bounds()
+                        if min(width, height) < min_px:
+                            continue
+                        if page_area and (right - left) * (top - bottom) / page_area < min_page_fraction:
+                            continue
+                        if not save:
+                            # Same convention as pdfplumber boxes: [x0, top, x1, bottom], origin at the top left
+                            bbox = [left, page_height - top, right, page_height - bottom]
+                            images.append({"page": page_num + 1, "object": i, "bbox": bbox})
+                            continue
+                        path = _save_image(obj, os.path.join(images_dir, f"page_{page_num + 1}_img_{i + 1}"))
+                        images.append({
+                            "path": path,
+                            "page": page_num + 1,
+                            "filename": os.path.basename(path),
+                        })
+                    except Exception:
+                        pass
+            finally:
+                page.close()
+            yield images
+    finally:
+        pdf.close()
+
+
+def save_embedded_images(pdf_path: str, images_dir: str, located: List[Dict]) -> List[Dict]:
+    """Save images located by `iter_embedded_images(save=False)`; returns [{path, page, filename}].
+
+    Files get the same names an eager extraction would give them. Images that cannot be read are left out.
+    """
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+
+    by_page: Dict[int, List[int]] = {}
+    for image in located:
+        by_page.setdefault(image["page"], []).append(image["object"])
+
+    images = []
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page_number in sorted(by_page):
+            page = pdf[page_number - 1]
+            try:
+                objects = list(page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE]))
+                for i in by_page[page_number]:
+                    try:
+                        path = _save_image(objects[i], os.path.join(images_dir, f"page_{page_number}_img_{i + 1}"))
+                        images.append({"path": path, "page": page_number, "filename": os.path.basename(path)})
+                    except Exception:
+                        pass
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    return images
+
@@ -1,160 +1,719 @@
 """PDF processing: extract and clean Ge'ez text."""
+import asyncio
 import json
 import os
-import re
-from typing import Tuple, List, Dict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from itertools import zip_longest
+from typing import Callable, Iterable, Iterator, Tuple, List, Dict, Optional
 import pdfplumber
 
-from app.config import METADATA_PATH, RAW_DATA_PATH, PDFS_DIR
-from app.services import ai_processor
+from app.config import (
+    DESCRIBE_BATCH_SIZE,
+    IMAGE_DESCRIBE_MIN_PX,
+    IMAGE_EXTRACTION,
+    IMAGE_PROCESSING,
+    METADATA_PATH,
+    PDF_WORKERS,
+    PDFS_DIR,
+    PROCESSING_VERSION,
+    RAW_DATA_PATH,
+    TEXT_EXTRACTOR,
+)
+from app.services.ai_processor import get_cache
+from app.services.gemini_async import AsyncGemini
+from app.services.image_index import ImageIndex, dhash
+from app.services.json_store import load_json, write_json_atomic
+from app.services.pdf_images import iter_embedded_images, save_embedded_images
+from app.services.pdf_store import cached_first_page_text, file_sha256, load_page_texts, page_text_writer
+from app.services.text_cleaner import GeezTextCleaner
+from app.services.text_extractors import page_texts
+
+_CLEANER = GeezTextCleaner()
+# Recorded on raw_data entries: pdf_processor.py cleans with other rules (CLEANER there)
+CLEANER = "pdf_service"
 
-def deduplicate_geez_chars(text: str) -> str:
-    """Fix character repetition in Ge'ez text (e.g., 'ክክብብ' -> 'ክብ')."""
-    if not text:
-        return ""
-    
-    # Pattern: doubled characters (AABBCC)
-    # Applying to Ge'ez range \u1200-\u137F
-    result = ""
-    if len(text) > 0:
-        result += text[0]
-        for i in range(1, len(text)):
-            # If current char is same as previous and is in Ge'ez range, skip it
-            is_geez = "\u1200" <= text[i] <= "\u137F"
-            if is_geez and text[i] == text[i-1]:
-                continue
-            result += text[i]
-            
-    # Pattern: doubled words (ገጽገጽ) - optional but common in extraction errors
-    # Split text into potential Ge'ez blocks and deduplicate if whole blocks repeat
-    words = []
-    for word in result.split():
-        if len(word) > 2 and word[:len(word)//2] == word[len(word)//2:]:
-            # Check if it looks like a Ge'ez word repetition
-            geez_count = sum(1 for c in word if "\u1200" <= c <= "\u137F")
-            if geez_count > 1:
-                words.append(word[:len(word)//2])
-                continue
-        words.append(word)
-        
-    return " ".join(words)
 
 def clean_text(text: str) -> str:
     """Clean extracted text: keep Ge'ez, numbers, punctuation; remove English and noise."""
-    if not text:
-        return ""
-
-    noise = [
-        r"PAGE\s+\d+", r"page\s+\d+", r"waga\s+[\d.]+", r"ዋጋ\s+[\d.]+",
-        r"ISSUE\s+\d+", r"VOL\s+\d+", r"VOLUME\s+\d+",
-        r"\d{1,2}/\d{1,2}/\d{4}", r"\d{4}-\d{2}-\d{2}",
-        r"©\s*\d{4}", r"All rights reserved", r"http[s]?://\S+", r"www\.\S+",
-    ]
-    for p in noise:
-        text = re.sub(p, "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\b[a-zA-Z]+\b", "", text)
+    return _CLEANER.clean(text)
 
-    nav = [r"•", r"▪", r"&", r"±±", r"——", r"\(\([^)]*\)\)", r"\b\d+\s*[a-zA-Z]+\b"]
-    lines = text.split("\n")
-    kept = []
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        special = sum(1 for c in line if c in "•●○■□▪▫▲▼◄►◆◇◈◉◊※‹›«»\"\"''±——&()[]{}")
-        total = len(line.replace(" ", ""))
-        if total > 0 and special / total > 0.15:
-            continue
-        if len(line) < 10:
-            geez = sum(1 for c in line if "\u1200" <= c <= "\u137F")
-            if geez < 3:
-                continue
-        for p in nav:
-            line = re.sub(p, "", line)
-        if line.strip():
-            # Deduplicate characters
-            line = deduplicate_geez_chars(line)
-            
-            # Filter by word count (strictly at least 4 words)
-            # Use Ge'ez aware splitting
-            words = [w for w in line.split() if any("\u1200" <= c <= "\u137F" for c in w)]
-            if len(words) >= 4:
-                kept.append(line)
-
-    text = "\n".join(kept)
-    allowed = r"[\u1200-\u137F\u0000-\u007F\u2000-\u206F]"
-    text = re.sub(f"[^{allowed}]", "", text)
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"\n\s*\n", "\n", text)
-    return text.strip()
-
-
-def extract_content_from_pdf(pdf_path: str, pdf_name: str) -> Tuple[str, int, List[Dict]]:
-    """Extract and clean text and images from PDF. Returns (cleaned_text, word_count, images_info)."""
-    text_content = ""
-    images_info = []
-    
-    # Create images directory for this PDF
-    images_dir = os.path.join(PDFS_DIR, 'images', pdf_name.replace('.pdf', ''))
-    os.makedirs(images_dir, exist_ok=True)
-    
+def clean_pages(pages: Iterable[Optional[str]]) -> Iterator[str]:
+    """clean_text over a PDF's pages, one cleaned text per page (see GeezTextCleaner.clean_pages)."""
+    return _CLEANER.clean_pages(pages)
+
+
+def _raster_page_boxes(page, page_num: int) -> List[Dict]:
+    """Each `page.images` box of a pdfplumber page as {page, object, bbox}, bbox = [x0, top, x1, bottom]."""
+    boxes = []
+    # Clamp bbox strictly inside page to avoid "outside parent page" errors
     try:
+        page_width = float(page.width) if hasattr(page, 'width') else 841.89
+        page_height = float(page.height) if hasattr(page, 'height') else 1190.55
+        # Require box fully inside page; use small inset to avoid float/edge issues
+        eps = 1e-3
+        for i, image in enumerate(page.images):
+            try:
+                x0 = max(0.0, min(float(image['x0']), page_width - eps))
+                top = max(0.0, min(float(image['top']), page_height - eps))
+                x1 = max(0.0, min(float(image['x1']), page_width - eps))
+                bottom = max(0.0, min(float(image['bottom']), page_height - eps))
+                # Ensure left < right and top < bottom after clamping
+                if x0 >= x1 or top >= bottom:
+                    continue
+                boxes.append({"page": page_num + 1, "object": i, "bbox": [x0, top, x1, bottom]})
+            except:
+                pass
+    except:
+        pass
+    return boxes
+
+
+def _render_raster_box(page, box: Dict, images_dir: str) -> Dict:
+    """Render one `_raster_page_boxes` box of the pdfplumber page at 200 DPI; returns {path, page, filename}."""
+    image_filename = f"page_{box['page']}_img_{box['object'] + 1}.png"
+    image_path = os.path.join(images_dir, image_filename)
+    page.crop(tuple(box["bbox"])).to_image(resolution=200).save(image_path)
+    return {'path': image_path, 'page': box['page'], 'filename': image_filename}
+
+
+def _raster_page_images(page, page_num: int, images_dir: str) -> List[Dict]:
+    """IMAGE_EXTRACTION=raster: render the crop of each `page.images` box at 200 DPI (pdfplumber page)."""
+    images_info = []
+    for box in _raster_page_boxes(page, page_num):
+        try:
+            images_info.append(_render_raster_box(page, box, images_dir))
+        except:
+            pass
+    return images_info
+
+
+def iter_raw_pages(
+    pdf_path: str,
+    pdf_name: str,
+    images_dir: str,
+    text_extractor: Optional[str] = None,
+    raster_images: Callable = _raster_page_images,
+) -> Iterator[Tuple[Optional[str], List[Dict]]]:
+    """(uncleaned text, images) for each page of `pdf_path`, holding one page in memory at a time.
+
+    Text comes from `text_extractor` (see text_extractors; default TEXT_EXTRACTOR), falling back to
+    the first-page text cached at download time when page 1 has none. Images are written to
+    `images_dir`: embedded XObjects, or with IMAGE_EXTRACTION=raster, `raster_images(page, page_num,
+    images_dir)` on the pdfplumber page. With IMAGE_PROCESSING=deferred nothing is saved: each
+    image is located as {page, object, bbox, extraction} for `complete_pending_images` (bbox is
+    [x0, top, x1, bottom] from the page's top-left corner for both extraction modes).
+    Each pdfplumber page's parsed objects and layout are released once it is done (pdf.pages keeps
+    every page, and its caches, until the file closes).
+    """
+    backend = text_extractor or TEXT_EXTRACTOR
+    texts = None if backend == "pdfplumber" else page_texts(pdf_path, backend)
+    defer = IMAGE_PROCESSING == "deferred"
+    if IMAGE_EXTRACTION == "embedded":
+        embedded = iter_embedded_images(pdf_path, images_dir, save=not defer)
+    else:
+        embedded = iter(())
+
+    def plumber_pages() -> Iterator[Tuple[Optional[str], List[Dict]]]:
         with pdfplumber.open(pdf_path) as pdf:
             for page_num, page in enumerate(pdf.pages):
-                # Extract text
                 try:
-                    t = page.extract_text()
-                    if t:
-                        text_content += t + "\n"
-                except:
-                    pass
-                
-                # Extract images (clamp bbox strictly inside page to avoid "outside parent page" errors)
-                try:
-                    page_width = float(page.width) if hasattr(page, 'width') else 841.89
-                    page_height = float(page.height) if hasattr(page, 'height') else 1190.55
-                    # Require box fully inside page; use small inset to avoid float/edge issues
-                    eps = 1e-3
-                    for i, image in enumerate(page.images):
+                    if texts is not None:
+                        t = next(texts, None)
+                    else:
                         try:
-                            x0 = max(0.0, min(float(image['x0']), page_width - eps))
-                            top = max(0.0, min(float(image['top']), page_height - eps))
-                            x1 = max(0.0, min(float(image['x1']), page_width - eps))
-                            bottom = max(0.0, min(float(image['bottom']), page_height - eps))
-                            # Ensure left < right and top < bottom after clamping
-                            if x0 >= x1 or top >= bottom:
-                                continue
-                            cropped_page = page.crop((x0, top, x1, bottom))
-                            img_obj = cropped_page.to_image(resolution=200)
-                            
-                            image_filename = f"page_{page_num+1}_img_{i+1}.png"
-                            image_path = os.path.join(images_dir, image_filename)
-                            img_obj.save(image_path)
-                            
-                            images_info.append({
-                                'path': image_path,
-                                'page': page_num + 1,
-                                'filename': image_filename
-                            })
-                        except:
-                            pass
-                except:
-                    pass
-
-            cleaned = clean_text(text_content)
-            words = [w for w in cleaned.split() if w.strip()]
-            return cleaned, len(words), images_info
+                            t = page.extract_text()
+                        except Exception:
+                            t = None
+                    if IMAGE_EXTRACTION != "raster":
+                        images = []
+                    elif defer:
+                        images = _raster_page_boxes(page, page_num)
+                    else:
+                        images = raster_images(page, page_num, images_dir)
+                finally:
+                    page.close()
+                yield t, images
+
+    if texts is not None and IMAGE_EXTRACTION == "embedded":
+        # Neither text nor images need pdfplumber: skip its page parsing entirely
+        pages = ((t, []) for t in texts)
+    else:
+        pages = plumber_pages()
+
+    # pypdfium2 and pdfplumber may disagree on a broken file's page count: pad the shorter side
+    for page_num, (text_page, embedded_images) in enumerate(zip_longest(pages, embedded)):
+        t, images = text_page or (None, [])
+        if page_num == 0 and not t:
+            # Layout extraction found nothing: use the text-only page 1 cached at download time
+            t = cached_first_page_text(pdf_name)
+        images = images + (embedded_images or [])
+        if defer:
+            images = [{**image, "extraction": IMAGE_EXTRACTION} for image in images]
+        yield t, images
+
+
+def iter_pdf_pages(pdf_path: str, pdf_name: str, text_extractor: Optional[str] = None) -> Iterator[Dict]:
+    """Extract, clean and yield `pdf_path` one page at a time: {page, text, word_count, images}.
+
+    `pdf_name` is the PDF's content hash: it names the images directory and keys the cached
+    first-page text. Memory stays flat whatever the page count. Pages are cleaned by `clean_pages`,
+    so a page's last line may be cleaned (and counted) with the next page; joined, the page texts
+    are the whole PDF's clean text. The uncleaned page texts are kept in the PDF store (see `reclean`).
+    """
+    images_dir = os.path.join(PDFS_DIR, 'images', pdf_name.replace('.pdf', ''))
+    os.makedirs(images_dir, exist_ok=True)
+    page_images = deque()
+
+    def raw_texts() -> Iterator[Optional[str]]:
+        for t, images in iter_raw_pages(pdf_path, pdf_name, images_dir, text_extractor):
+            record(t)
+            page_images.append(images)
+            yield t
+
+    with page_text_writer(pdf_name, text_extractor or TEXT_EXTRACTOR) as record:
+        for page_num, cleaned in enumerate(clean_pages(raw_texts())):
+            images = page_images.popleft()
+            yield {"page": page_num + 1, "text": cleaned, "word_count": len(cleaned.split()), "images": images}
+
+
+def join_pages(cleaned_pages: Iterable[str]) -> Tuple[str, int]:
+    """(text, word_count) of a PDF from its cleaned pages: non-empty pages joined by spaces."""
+    text = " ".join(t for t in cleaned_pages if t)
+    return text, len(text.split())
+
+
+def extract_content_from_pdf(
+    pdf_path: str, pdf_name: str, text_extractor: Optional[str] = None, raise_errors: bool = False
+) -> Tuple[str, int, List[Dict]]:
+    """Extract and clean text and images from PDF. Returns (cleaned_text, word_count, images_info).
+
+    Assembles `iter_pdf_pages`: the cleaned pages joined by spaces, as one cleaned text. A PDF that
+    cannot be read gives ("", 0, []), or raises with `raise_errors`.
+    """
+    texts, images_info = [], []
+    try:
+        for page in iter_pdf_pages(pdf_path, pdf_name, text_extractor):
+            texts.append(page["text"])
+            images_info.extend(page["images"])
+        text, word_count = join_pages(texts)
+        return text, word_count, images_info
     except Exception:
+        if raise_errors:
+            raise
         return "", 0, []
 
 
-def process_pdfs(pdf_filenames: List[str] = None) -> dict:
+def _extract_or_none(pdf_path: str, pdf_name: str) -> Optional[Tuple[str, int, List[Dict]]]:
+    try:
+        return extract_content_from_pdf(pdf_path, pdf_name, raise_errors=True)
+    except Exception as e:
+        print(f"Error processing PDF {pdf_path}: {e}")
+        return None
+
+
+def extract_many(
+    jobs: List[Tuple[str, str]], workers: int = 1
+) -> Iterator[Tuple[str, Optional[Tuple[str, int, List[Dict]]]]]:
+    """Run `extract_content_from_pdf` over (pdf_path, sha256) jobs; yield (sha256, result) as each finishes.
+
+    The result is None if the PDF could not be read or its worker died. With `workers` > 1 the PDFs
+    are extracted in a process pool (layout analysis is CPU-bound), so results arrive in completion
+    order, not job order.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        for path, sha256 in jobs:
+            yield sha256, _extract_or_none(path, sha256)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = {pool.submit(_extract_or_none, path, sha256): sha256 for path, sha256 in jobs}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # Worker died (e.g. out of memory)
+                print(f"Extraction worker failed for {futures[future][:12]}: {e}")
+                result = None
+            yield futures[future], result
+
+
+def clean_stored_pages(
+    sha256: str, clean: Callable[[Iterable[Optional[str]]], Iterable[str]] = clean_pages
+) -> Optional[Tuple[str, int]]:
+    """(text, word_count) from the PDF's stored uncleaned page texts run through the page cleaner `clean`;
+    None if none are stored."""
+    stored = load_page_texts(sha256)
+    if stored is None:
+        return None
+    return join_pages(clean(stored["pages"]))
+
+
+def reclean_raw_data(
+    raw_data: List[Dict],
+    workers: int = 1,
+    clean: Callable[[Iterable[Optional[str]]], Iterable[str]] = clean_pages,
+    cleaner: str = CLEANER,
+) -> Tuple[int, int]:
+    """Re-clean raw_data entries in place from the stored page texts; no PDF is opened.
+
+    Updates extracted_text and word_count, and records `cleaner` (the name of `clean`'s rules, see
+    processing_settings) on each (entities and image descriptions are kept). Each
+    distinct PDF is cleaned once, in `workers` processes. Returns (entries updated, entries
+    whose PDF has no stored page text and were left as they are).
+    """
+    hashes = sorted({entry["pdf_sha256"] for entry in raw_data if entry.get("pdf_sha256")})
+    clean_one = partial(clean_stored_pages, clean=clean)
+    if workers <= 1 or len(hashes) <= 1:
+        results = dict(zip(hashes, map(clean_one, hashes)))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(hashes))) as pool:
+            chunksize = max(1, len(hashes) // (workers * 4))
+            results = dict(zip(hashes, pool.map(clean_one, hashes, chunksize=chunksize)))
+
+    updated = missing = 0
+    for entry in raw_data:
+        result = results.get(entry.get("pdf_sha256"))
+        if result is None:
+            missing += 1
+            continue
+        entry["extracted_text"], entry["word_count"] = result
+        entry["cleaner"] = cleaner
+        updated += 1
+    return updated, missing
+
+
+def reclean(workers: Optional[int] = None) -> dict:
+    """Re-run clean_text over every article in raw_data.json from the stored page texts.
+
+    Takes seconds where re-extraction takes hours, so cleaning rules can be iterated on the
+    whole archive. Entries extracted before page texts were stored are reported as `missing`.
+    """
+    raw_data = load_raw_data()
+    if not raw_data:
+        return {"ok": False, "error": "No raw_data.json entries. Run the PDF processor first."}
+    updated, missing = reclean_raw_data(raw_data, workers or PDF_WORKERS)
+    write_json_atomic(RAW_DATA_PATH, raw_data)
+    return {
+        "ok": True,
+        "recleaned": updated,
+        "missing": missing,
+        "total_words": sum(entry.get("word_count", 0) for entry in raw_data),
+        "raw_data_path": RAW_DATA_PATH,
+    }
+
+
+def _article_key(entry: dict) -> str:
+    """Identifies an article across pdf_metadata.json and raw_data.json."""
+    return entry.get("article_url") or entry.get("pdf_filename") or ""
+
+
+# description_source of an image whose description request failed (no API key, request error)
+FAILED = "failed"
+
+
+def _api_result(description: Optional[str]) -> Tuple[str, str]:
+    return (description, "api") if description is not None else ("", FAILED)
+
+
+class _InFlight:
+    """Images sent to Gemini in this run whose descriptions have not arrived, by perceptual hash."""
+
+    def __init__(self):
+        self._index = ImageIndex(path=None)
+        self._futures: Dict[str, asyncio.Future] = {}
+
+    def lookup(self, value: int) -> Optional[asyncio.Future]:
+        match = self._index.lookup(value)
+        return self._futures[match["source"]] if match else None
+
+    def add(self, value: int, image_path: str, future: asyncio.Future) -> None:
+        self._index.add(value, "", image_path)
+        self._futures[image_path] = future
+
+
+async def describe_images_async(
+    images_info: List[Dict],
+    index: ImageIndex,
+    api_key_error_logged: dict,
+    client: AsyncGemini,
+    in_flight: Optional[_InFlight] = None,
+) -> List[Dict]:
+    """Describe extracted images in Tigrinya, DESCRIBE_BATCH_SIZE per Gemini request, requests in parallel.
+
+    Images under IMAGE_DESCRIBE_MIN_PX pixels a side and flat fills are skipped (empty description); images
+    whose perceptual hash is close to one in `index` reuse its description, and images close to one
+    already being described (in `in_flight`, shared across concurrent calls) wait for that description.
+    New descriptions are added to `index`. Each result records its `phash` and `description_source`
+    (api/duplicate/skipped, or FAILED when the request failed); results keep the order of `images_info`.
+    """
+    in_flight = in_flight or _InFlight()
+    loop = asyncio.get_running_loop()
+
+    async def request(batch: List[Tuple[Dict, Optional[int], asyncio.Future]]) -> None:
+        try:
+            descriptions = await client.describe_images([img['path'] for img, _, _ in batch], api_key_error_logged)
+        except Exception as e:
+            print(f"Error describing images: {e}")
+            descriptions = [None] * len(batch)
+        for (img, value, future), description in zip(batch, descriptions):
+            if value is not None and description:
+                index.add(value, description, img['path'])
+            future.set_result(description)
+
+    async def reuse(original: asyncio.Future, img: Dict, value: int) -> Tuple[str, str]:
+        description = await original
+        if description:
+            return description, "duplicate"
+        # The original failed; as in a sequential run, this image gets its own request
+        future = loop.create_future()
+        await request([(img, value, future)])
+        return _api_result(future.result())
+
+    async def settled(description: str, source: str) -> Tuple[str, str]:
+        return description, source
+
+    async def requested(task: asyncio.Future) -> Tuple[str, str]:
+        return _api_result(await task)
+
+    hashes, results, to_request = [], [], []
+    for img in images_info:
+        value, width, height = dhash(img['path']) or (None, None, None)
+        hashes.append(value)
+        if width is not None and (value is None or min(width, height) < IMAGE_DESCRIBE_MIN_PX):
+            # Too small, or a flat single-colour fill: nothing worth describing
+            results.append(settled("", "skipped"))
+        elif value is not None and (match := index.lookup(value)) is not None:
+            results.append(settled(match["description"], "duplicate"))
+        elif value is not None and (original := in_flight.lookup(value)) is not None:
+            results.append(reuse(original, img, value))
+        else:
+            future = loop.create_future()
+            if value is not None:
+                in_flight.add(value, img['path'], future)
+            to_request.append((img, value, future))
+            results.append(requested(future))
+
+    batches = [
+        asyncio.ensure_future(request(to_request[start:start + DESCRIBE_BATCH_SIZE]))
+        for start in range(0, len(to_request), DESCRIBE_BATCH_SIZE)
+    ]
+    described = await asyncio.gather(*results)
+    await asyncio.gather(*batches)
+
+    return [
+        {
+            'path': img['path'],
+            'filename': img['filename'],
+            'page': img['page'],
+            'description_tigrinya': description,
+            'phash': f"{value:032x}" if value is not None else None,
+            'description_source': source,
+        }
+        for img, value, (description, source) in zip(images_info, hashes, described)
+    ]
+
+
+def describe_images(images_info: List[Dict], index: ImageIndex, api_key_error_logged: dict) -> List[Dict]:
+    """describe_images_async for callers outside an event loop, with GEMINI_CONCURRENCY requests at once."""
+    if not images_info:
+        return []
+    with AsyncGemini() as client:
+        return asyncio.run(describe_images_async(images_info, index, api_key_error_logged, client))
+
+
+# description_source of an image a deferred run located but has not saved or described yet
+PENDING = "pending"
+
+
+# Beside a PDF's saved images: its pending images as completed by deferred_images.complete_images
+COMPLETED_IMAGES_FILE = "completed.json"
+
+
+def has_pending(images: List[Dict]) -> bool:
+    return any(img.get("description_source") == PENDING for img in images or [])
+
+
+def completed_images_path(sha256: str) -> str:
+    return os.path.join(PDFS_DIR, 'images', sha256, COMPLETED_IMAGES_FILE)
+
+
+def merge_completed_images(raw_data: List[Dict]) -> List[Dict]:
+    """`raw_data` with the images completed since it was written (see complete_images) merged in, in place.
+
+    Completed images are kept beside the images rather than written to raw_data.json, which a
+    processing run or reclean may be rewriting from its own copy meanwhile. A completion applies to
+    entries that still have the image list it was made from.
+    """
+    completed: Dict[str, Optional[dict]] = {}
+    for entry in raw_data:
+        sha256 = entry.get("pdf_sha256")
+        if not sha256 or not has_pending(entry.get("images")):
+            continue
+        if sha256 not in completed:
+            completed[sha256] = load_json(completed_images_path(sha256), None)
+        record = completed[sha256]
+        if not record or record.get("pending") != entry["images"]:
+            continue
+        entry["images"] = record["images"]
+        failed = any(img.get("description_source") == FAILED for img in entry["images"])
+        if failed and "images" not in entry.get("processing_errors", []):
+            # Redone by the next processing run (see previous_results)
+            entry["processing_errors"] = entry.get("processing_errors", []) + ["images"]
+            entry["processing_status"] = processing_status(entry["processing_errors"])
+    return raw_data
+
+
+def load_raw_data(path: str = RAW_DATA_PATH) -> List[Dict]:
+    """raw_data.json's entries with completed deferred images merged in (see merge_completed_images)."""
+    return merge_completed_images(load_json(path, []))
+
+
+def discard_completed_images(sha256: str) -> None:
+    """Forget images completed for a PDF's earlier results (it is being processed again)."""
+    try:
+        os.remove(completed_images_path(sha256))
+    except OSError:
+        pass
+
+
+def defer_images(images_info: List[Dict]) -> List[Dict]:
+    """raw_data image entries for images located with IMAGE_PROCESSING=deferred (see complete_pending_images)."""
+    return [{**img, 'description_tigrinya': "", 'description_source': PENDING} for img in images_info]
+
+
+def _render_raster_boxes(pdf_path: str, images_dir: str, boxes: List[Dict]) -> List[Dict]:
+    by_page: Dict[int, List[Dict]] = {}
+    for box in boxes:
+        by_page.setdefault(box["page"], []).append(box)
+    images_info = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_number in sorted(by_page):
+            page = pdf.pages[page_number - 1]
+            try:
+                for box in by_page[page_number]:
+                    try:
+                        images_info.append(_render_raster_box(page, box, images_dir))
+                    except Exception:
+                        pass
+            finally:
+                page.close()
+    return images_info
+
+
+def complete_pending_images(
+    pdf_path: str, sha256: str, images: List[Dict], index: ImageIndex, api_key_error_logged: dict
+) -> List[Dict]:
+    """Save and describe the pending images in `images` (one raw_data entry's list) from the PDF at `pdf_path`.
+
+    Returns the new list, ordered by page: described images as they were, pending ones replaced by
+    `describe_images` results. Images that can no longer be read are dropped, as an eager run skips them.
+    """
+    pending = [img for img in images if img.get('description_source') == PENDING]
+    if not pending:
+        return images
+    images_dir = os.path.join(PDFS_DIR, 'images', sha256)
+    os.makedirs(images_dir, exist_ok=True)
+    saved = save_embedded_images(pdf_path, images_dir, [img for img in pending if img.get('extraction') == "embedded"])
+    boxes = [img for img in pending if img.get('extraction') == "raster"]
+    if boxes:
+        saved.extend(_render_raster_boxes(pdf_path, images_dir, boxes))
+    done = [img for img in images if img.get('description_source') != PENDING]
+    described = describe_images(saved, index, api_key_error_logged)
+    return sorted(done + described, key=lambda img: img.get('page') or 0)
+
+
+# Values assumed for raw_data entries written before a setting was recorded
+_SETTING_DEFAULTS = {"text_extractor": "pdfplumber", "image_extraction": "raster"}
+
+
+def processing_settings(cleaner: str = CLEANER) -> dict:
+    """Settings stored on each raw_data entry; entries made with other settings are reprocessed.
+
+    `cleaner` names the text cleaning rules: the backend's and pdf_processor.py's differ and both
+    write raw_data.json. Entries that do not record it are reprocessed.
+    """
+    return {
+        "processing_version": PROCESSING_VERSION,
+        "text_extractor": TEXT_EXTRACTOR,
+        "image_extraction": IMAGE_EXTRACTION,
+        "cleaner": cleaner,
+    }
+
+
+def previous_results(raw_data: List[dict], cleaner: str = CLEANER) -> Dict[str, tuple]:
+    """(text, word_count, entities, images, failed steps) per PDF hash from raw_data entries made with the
+    current processing_settings(cleaner).
+
+    Completed entries have no failed steps. "partial" entries keep theirs (from processing_errors), so
+    only those steps are redone (see analyse_pdfs); entries whose extraction failed are left out.
+    """
+    settings = processing_settings(cleaner)
+    results = {}
+    for entry in raw_data:
+        sha256 = entry.get("pdf_sha256")
+        errors = entry.get("processing_errors") or []
+        status = entry.get("processing_status")
+        if (
+            sha256
+            and (status == "completed" or (status == "partial" and "extraction" not in errors))
+            and all(
+                entry.get(k, _SETTING_DEFAULTS.get(k)) == v
+                for k, v in settings.items()
+                # The image mode cannot have changed the result of an issue without images
+                if k != "image_extraction" or entry.get("images")
+            )
+        ):
+            results.setdefault(sha256, (
+                entry.get("extracted_text", ""),
+                entry.get("word_count", 0),
+                entry.get("entities", []),
+                entry.get("images", []),
+                list(errors) if status == "partial" else [],
+            ))
+    return results
+
+
+def merge_raw_data(metadata: List[dict], existing: List[dict], processed: List[dict]) -> List[dict]:
+    """Existing raw_data entries updated with this run's `processed` ones, in pdf_metadata.json order.
+
+    Entries for articles no longer in the metadata are kept at the end.
+    """
+    new_by_key = {_article_key(e): e for e in processed}
+    old_by_key = {_article_key(e): e for e in existing}
+    merged = []
+    for item in metadata:
+        key = _article_key(item)
+        old_entry = old_by_key.pop(key, None)
+        entry = new_by_key.pop(key, old_entry)
+        if entry is not None:
+            merged.append(entry)
+    merged.extend(new_by_key.values())
+    merged.extend(old_by_key.values())
+    return merged
+
+
+def processing_status(failures: List[str]) -> str:
+    """raw_data processing_status for a PDF whose steps in `failures` ("extraction", "ner", "images") failed.
+
+    "failed" if it could not be extracted, "partial" if NER or an image description failed, else
+    "completed". Only completed entries are reused by later runs (see previous_results).
+    """
+    if "extraction" in failures:
+        return "failed"
+    return "partial" if failures else "completed"
+
+
+async def analyse_pdf(
+    text: str,
+    images_info: List[Dict],
+    index: ImageIndex,
+    api_key_error_logged: dict,
+    client: AsyncGemini,
+    in_flight: Optional[_InFlight] = None,
+) -> Tuple[dict, List[Dict], List[str]]:
+    """(entities, raw_data images, failed steps) for one extracted PDF: NER and its image descriptions run concurrently."""
+    if IMAGE_PROCESSING == "deferred":
+        entities, ner_ok = await client.perform_ner(text)
+        images = defer_images(images_info)
+    else:
+        (entities, ner_ok), images = await asyncio.gather(
+            client.perform_ner(text),
+            describe_images_async(images_info, index, api_key_error_logged, client, in_flight),
+        )
+    return entities, images, _failed_steps(ner_ok, images)
+
+
+def _failed_steps(ner_ok: bool, images: List[Dict]) -> List[str]:
+    failures = [] if ner_ok else ["ner"]
+    if any(img.get('description_source') == FAILED for img in images):
+        failures.append("images")
+    return failures
+
+
+async def redo_failed_steps(
+    result: tuple,
+    index: ImageIndex,
+    api_key_error_logged: dict,
+    client: AsyncGemini,
+    in_flight: Optional[_InFlight] = None,
+) -> tuple:
+    """A previous (text, word_count, entities, images, failed steps) result with its failed steps run again.
+
+    The extracted text and saved images are kept: NER runs again if it failed, and only the images whose
+    description failed are described again.
+    """
+    text, wc, entities, images, failures = result
+
+    async def ner() -> Tuple[dict, bool]:
+        return await client.perform_ner(text) if "ner" in failures else (entities, True)
+
+    async def describe() -> List[Dict]:
+        failed = [img for img in images if img.get('description_source') == FAILED]
+        if not failed:
+            return images
+        described = iter(await describe_images_async(failed, index, api_key_error_logged, client, in_flight))
+        return [next(described) if img.get('description_source') == FAILED else img for img in images]
+
+    (entities, ner_ok), images = await asyncio.gather(ner(), describe())
+    return text, wc, entities, images, _failed_steps(ner_ok, images)
+
+
+async def analyse_pdfs(
+    extracted: Iterable[Tuple[str, Optional[Tuple[str, int, List[Dict]]]]],
+    index: ImageIndex,
+    api_key_error_logged: dict,
+    client: AsyncGemini,
+    partial: Optional[Dict[str, tuple]] = None,
+) -> Dict[str, tuple]:
+    """(text, word_count, entities, images, failed steps) per PDF hash for extract_many's results, and for
+    the `partial` previous results (see previous_results) with their failed steps redone.
+
+    Each PDF's analysis starts as soon as it is extracted (extraction runs in a thread meanwhile), so
+    NER and image descriptions of all PDFs share the client's concurrency limit. PDFs that could not
+    be extracted (result None) are not analysed. Deferred images completed for a PDF's earlier
+    results are discarded.
+    """
+    in_flight = _InFlight()
+    extracted = iter(extracted)
+
+    async def analyse(text: str, wc: int, images_info: List[Dict]) -> tuple:
+        analysed = await analyse_pdf(text, images_info, index, api_key_error_logged, client, in_flight)
+        return (text, wc, *analysed)
+
+    async def unreadable() -> tuple:
+        return "", 0, {"people": [], "locations": [], "organizations": []}, [], ["extraction"]
+
+    tasks = {
+        sha256: asyncio.create_task(redo_failed_steps(result, index, api_key_error_logged, client, in_flight))
+        for sha256, result in (partial or {}).items()
+    }
+    while (result := await asyncio.to_thread(next, extracted, None)) is not None:
+        sha256, extraction = result
+        discard_completed_images(sha256)
+        if extraction is None:
+            tasks[sha256] = asyncio.create_task(unreadable())
+        else:
+            text, wc, images_info = extraction
+            tasks[sha256] = asyncio.create_task(analyse(text, wc, images_info))
+    return {sha256: await task for sha256, task in tasks.items()}
+
+
+def process_pdfs(pdf_filenames: List[str] = None, workers: Optional[int] = None, force: bool = False) -> dict:
     """Process PDFs: extract text, perform NER, and describe images.
     
     Args:
         pdf_filenames: Optional list of specific PDF filenames to process.
                       If None, processes all PDFs in metadata.
+        workers: Extraction processes (default PDF_WORKERS). NER and image descriptions
+                 start as each extraction completes, up to GEMINI_CONCURRENCY Gemini requests
+                 at once; raw_data.json keeps metadata order.
+        force: Reprocess every PDF. By default a PDF whose content hash was already processed
+               with the current processing_settings() reuses its stored results.
+
+    Results are merged into raw_data.json: entries for articles not processed in this run are kept.
     """
     if not os.path.exists(METADATA_PATH):
         return {"ok": False, "error": "No metadata file found. Run scraper first."}
@@ -162,8 +721,12 @@ def process_pdfs(pdf_filenames: List[str] = None) -> dict:
     with open(METADATA_PATH, encoding="utf-8") as f:
         metadata = json.load(f)
 
-    processed = []
-    api_key_error_logged = {}
+    existing = load_raw_data()
+    previous = {} if force else previous_results(existing)
+
+    # Articles to write, in metadata order, and one extraction job per distinct, unprocessed PDF
+    articles = []
+    jobs: Dict[str, str] = {}
     for item in metadata:
         fn = item.get("pdf_filename")
         if not fn:
@@ -173,28 +736,34 @@ def process_pdfs(pdf_filenames: List[str] = None) -> dict:
         if pdf_filenames is not None and fn not in pdf_filenames:
             continue
             
-        path = os.path.join(PDFS_DIR, fn)
+        # Entries scraped before the PDF store existed point into PDFS_DIR by filename
+        path = item.get("pdf_filepath") or os.path.join(PDFS_DIR, fn)
         if not os.path.exists(path):
             continue
+        sha256 = item.get("pdf_sha256") or file_sha256(path)
+        articles.append((item, fn, sha256))
+        # Identical issues (same content hash) are extracted and NER'd once
+        if sha256 not in previous:
+            jobs.setdefault(sha256, path)
 
-        title = fn.split("_", 1)[1].replace(".pdf", "") if "_" in fn else fn.replace(".pdf", "")
-
+    api_key_error_logged = {}
+    by_hash: Dict[str, tuple] = {sha256: previous[sha256] for _, _, sha256 in articles if sha256 in previous}
+    reused = len(by_hash)
+    job_list = [(path, sha256) for sha256, path in jobs.items()]
+    cache = get_cache()
+    cache_before = (cache.hits, cache.misses) if cache else (0, 0)
+    image_index = ImageIndex()
+    # Reused entries with failed NER or image descriptions redo just those steps
+    partial = {sha256: result for sha256, result in by_hash.items() if result[4]}
+    with AsyncGemini() as client:
+        extracted = extract_many(job_list, workers or PDF_WORKERS)
+        by_hash.update(asyncio.run(analyse_pdfs(extracted, image_index, api_key_error_logged, client, partial)))
+    image_index.save()
 
-        # Extract text and images
-        text, wc, images_info = extract_content_from_pdf(path, fn)
-        
-        # AI Processing
-        entities = ai_processor.perform_ner(text)
-        
-        processed_images = []
-        for img in images_info:
-            description = ai_processor.describe_image(img['path'], _api_key_error_logged=api_key_error_logged)
-            processed_images.append({
-                'path': img['path'],
-                'filename': img['filename'],
-                'page': img['page'],
-                'description_tigrinya': description
-            })
+    processed = []
+    for item, fn, sha256 in articles:
+        title = fn.split("_", 1)[1].replace(".pdf", "") if "_" in fn else fn.replace(".pdf", "")
+        text, wc, entities, processed_images, failures = by_hash[sha256]
 
         processed.append({
             "index": item.get("index"),
@@ -203,20 +772,32 @@ def process_pdfs(pdf_filenames: List[str] = None) -> dict:
             "publication_date": item.get("date"),
             "pdf_filename": fn,
             "pdf_url": item.get("pdf_url"),
+            "pdf_sha256": sha256,
             "extracted_text": text,
             "word_count": wc,
             "entities": entities,
             "images": processed_images,
-            "processing_status": "completed",
+            "processing_status": processing_status(failures),
+            "processing_errors": failures,
+            **processing_settings(),
         })
 
-    with open(RAW_DATA_PATH, "w", encoding="utf-8") as f:
-        json.dump(processed, f, ensure_ascii=False, indent=2)
+    raw_data = merge_raw_data(metadata, existing, processed)
+    write_json_atomic(RAW_DATA_PATH, raw_data)
 
     total_words = sum(p["word_count"] for p in processed)
     return {
         "ok": True,
         "processed": len(processed),
+        "unique_pdfs": len(by_hash),
+        "extracted": len(jobs),
+        "reused": reused,
+        # Articles saved as "partial" or "failed": redone on the next run
+        "incomplete": sum(p["processing_status"] != "completed" for p in processed),
+        # Gemini requests answered from / missing in the result cache during this run
+        "cache_hits": cache.hits - cache_before[0] if cache else 0,
+        "cache_misses": cache.misses - cache_before[1] if cache else 0,
+        "total_articles": len(raw_data),
         "total_words": total_words,
         "raw_data_path": RAW_DATA_PATH,
     }
@@ -0,0 +1,135 @@
+"""Content-addressed PDF store: every distinct PDF is kept once, under the SHA-256 of its bytes."""
+import gzip
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from app.config import PDF_STORE_DIR
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def store_path(sha256: str) -> str:
+    """Where the PDF with this hash lives: pdfs/store/ab/abcdef....pdf"""
+    return os.path.join(PDF_STORE_DIR, sha256[:2], f"{sha256}.pdf")
+
+
+def incoming_path(pdf_url: str) -> str:
+    """Staging path for a download that has not been hashed yet.
+
+    Named after the URL, so a rerun resumes the same .part file. Only one task may download a URL
+    at a time: a scrape starts one download per PDF URL (see scraper_service.PdfDownloads).
+    """
+    directory = os.path.join(PDF_STORE_DIR, "incoming")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, hashlib.sha1(pdf_url.encode("utf-8")).hexdigest() + ".pdf")
+
+
+def add_file(path: str, sha256: Optional[str] = None) -> tuple[str, str]:
+    """Move the file at `path` into the store. Returns (sha256, stored path).
+
+    If the same bytes are already stored, the new copy is deleted and the existing file is used.
+    Pass `sha256` if the file was already hashed.
+    """
+    sha256 = sha256 or file_sha256(path)
+    dest = store_path(sha256)
+    if os.path.exists(dest):
+        os.remove(path)
+    else:
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        os.replace(path, dest)
+    return sha256, dest
+
+
+
+def _first_page_text_path(sha256: str) -> str:
+    return os.path.join(PDF_STORE_DIR, "text", sha256[:2], f"{sha256}.page1.txt")
+
+
+def cached_first_page_text(sha256: str) -> Optional[str]:
+    """First-page text stored by an earlier `first_page_text` call, or None."""
+    path = _first_page_text_path(sha256)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def first_page_text(pdf_path: str, sha256: str) -> str:
+    """Plain text of page 1 without layout analysis, cached per content hash.
+
+    Uses pdfium's text layer (a pdfplumber dependency), which is far cheaper than
+    pdfplumber's layout extraction; good enough for date checks.
+    """
+    cached = cached_first_page_text(sha256)
+    if cached is not None:
+        return cached
+
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        if len(pdf) == 0:
+            text = ""
+        else:
+            textpage = pdf[0].get_textpage()
+            text = textpage.get_text_range().replace("\r\n", "\n")
+            textpage.close()
+    finally:
+        pdf.close()
+
+    path = _first_page_text_path(sha256)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return text
+
+
+def page_texts_path(sha256: str) -> str:
+    """Raw per-page text of the PDF with this hash: pdfs/store/text/ab/abcdef....pages.jsonl.gz"""
+    return os.path.join(PDF_STORE_DIR, "text", sha256[:2], f"{sha256}.pages.jsonl.gz")
+
+
+@contextmanager
+def page_text_writer(sha256: str, text_extractor: str) -> Iterator[Callable[[Optional[str]], None]]:
+    """Record a PDF's uncleaned page texts as they are extracted; yields `add(page_text)`.
+
+    Stored as gzipped JSON lines: a {sha256, text_extractor} header, then one JSON string (or
+    null for an unreadable page) per page. The file replaces any earlier one only when the block
+    finishes without error, so an interrupted extraction never leaves a truncated page list.
+    """
+    path = page_texts_path(sha256)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            f.write(json.dumps({"sha256": sha256, "text_extractor": text_extractor}) + "\n")
+            yield lambda text: f.write(json.dumps(text, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_page_texts(sha256: str) -> Optional[dict]:
+    """{sha256, text_extractor, pages} stored by `page_text_writer`, or None if missing or unreadable."""
+    path = page_texts_path(sha256)
+    if not os.path.exists(path):
+        return None
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            stored = json.loads(f.readline())
+            stored["pages"] = [json.loads(line) for line in f]
+        return stored
+    except (OSError, EOFError, ValueError):
+        return None
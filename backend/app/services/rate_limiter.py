@@ -0,0 +1,131 @@
+"""Per-host async rate limiting for the scraper: token buckets that adapt to 429/5xx and Retry-After."""
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+# Responses that mean "slow down": the host's rate is halved and the request retried
+THROTTLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+class _Bucket:
+    def __init__(self, rate: float, burst: float, min_rate: float):
+        # A zero or negative rate would make acquire() wait forever (or spin on negative waits)
+        self.rate = max(min_rate, rate)
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self.lock = asyncio.Lock()
+
+
+class HostRateLimiter:
+    """Token bucket per host with additive-increase / multiplicative-decrease of the rate.
+
+    Every successful response nudges the host's rate up by `increase` req/s (up to `max_rate`);
+    a throttling response halves it (down to `min_rate`) and, with a Retry-After header, pauses
+    the host until then. Waiting is done with asyncio.sleep, so the event loop stays free.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: float = 4.0,
+        min_rate: float = 0.1,
+        max_rate: float = 10.0,
+        increase: float = 0.05,
+    ):
+        self.min_rate = max(min_rate, 0.001)
+        self.initial_rate = max(self.min_rate, rate)
+        self.burst = max(1.0, burst)
+        self.max_rate = max(self.initial_rate, max_rate)
+        self.increase = increase
+        self._buckets: dict[str, _Bucket] = {}
+
+    def _bucket(self, url: str) -> _Bucket:
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = _Bucket(self.initial_rate, self.burst, self.min_rate)
+        return self._buckets[host]
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to `url`'s host is allowed."""
+        bucket = self._bucket(url)
+        async with bucket.lock:
+            while True:
+                now = time.monotonic()
+                bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+                bucket.updated = now
+                wait = bucket.blocked_until - now
+                if wait <= 0:
+                    if bucket.tokens >= 1:
+                        bucket.tokens -= 1
+                        return
+                    wait = (1 - bucket.tokens) / bucket.rate
+                await asyncio.sleep(wait)
+
+    def feedback(self, url: str, status: int, retry_after: Optional[str] = None) -> bool:
+        """Adapt the host's rate to a response. Returns True if the response was a throttle."""
+        bucket = self._bucket(url)
+        if status not in THROTTLE_STATUSES:
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+            return False
+
+        bucket.throttled += 1
+        bucket.rate = max(self.min_rate, bucket.rate / 2)
+        bucket.tokens = 0
+        delay = _retry_after_seconds(retry_after)
+        if delay:
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+        return True
+
+    def stats(self) -> dict:
+        """Current rate (req/s) and throttle count per host."""
+        return {host: {"rate": round(b.rate, 2), "throttled": b.throttled} for host, b in self._buckets.items()}
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Retry-After as seconds: either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that waits for the limiter before each request and retries throttled responses."""
+
+    def __init__(self, limiter: HostRateLimiter, transport: httpx.AsyncBaseTransport, retries: int = 3):
+        self.limiter = limiter
+        self.transport = transport
+        self.retries = retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        attempt = 0
+        while True:
+            await self.limiter.acquire(url)
+            response = await self.transport.handle_async_request(request)
+            throttled = self.limiter.feedback(url, response.status_code, response.headers.get("Retry-After"))
+            if not throttled or attempt >= self.retries:
+                return response
+            attempt += 1
+            await response.aclose()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def limited_transport(limiter: Optional[HostRateLimiter], limits: httpx.Limits) -> httpx.AsyncBaseTransport:
+    """Connection-pooled transport, rate limited through `limiter` when one is given."""
+    transport = httpx.AsyncHTTPTransport(limits=limits)
+    return RateLimitedTransport(limiter, transport) if limiter else transport
@@ -1,207 +1,377 @@
 """Scraper service: parameterized scraping for Tigrinya newspapers."""
 import asyncio
-import json
 import os
 import time
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 from dateutil import parser
 
-import requests
-from playwright.async_api import async_playwright
-
-from app.config import DATA_DIR, METADATA_PATH, NEWSPAPERS_BY_ID, PDFS_DIR, RAW_DATA_PATH
-import pdfplumber
-
-def _verify_pdf_date(pdf_path: str, date_obj) -> bool:
-    """Extract text from first page of PDF and check if it contains the year/month/day."""
+from app.config import DATA_DIR, FRONTIER_PATH, METADATA_PATH, NEWSPAPERS, NEWSPAPERS_BY_ID, PDFS_DIR, RAW_DATA_PATH
+from app.services.downloader import open_downloader
+from app.services.fetchers import absolute_url, open_fetcher
+from app.services.frontier import UrlFrontier
+from app.services.json_store import load_json, write_json_atomic
+from app.services.page_index import PageDateIndex
+from app.services.pdf_store import add_file as add_to_store, file_sha256, first_page_text, incoming_path
+from app.services.rate_limiter import HostRateLimiter
+
+def _verify_pdf_date(pdf_path: str, date_obj, sha256: str) -> bool:
+    """Check the PDF's first-page text (cheap text-only extraction, cached by hash) for the year/month/day."""
     if not date_obj:
         return True
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if not pdf.pages:
-                return False
-            first_page = pdf.pages[0].extract_text()
-            if not first_page:
-                return False
-            
-            # Check for year (e.g., 2026)
-            year_str = str(date_obj.year)
-            # Tigrinya months/days can be tricky, but year is almost always in Western numerals
-            if year_str not in first_page:
-                return False
+        first_page = first_page_text(pdf_path, sha256)
+        if not first_page:
+            return False
+        
+        # Check for year (e.g., 2026)
+        year_str = str(date_obj.year)
+        # Tigrinya months/days can be tricky, but year is almost always in Western numerals
+        if year_str not in first_page:
+            return False
+        
+        # Additional check: day (with padding and without)
+        day_str = str(date_obj.day)
+        day_str_padded = f"{date_obj.day:02d}"
+        if day_str not in first_page and day_str_padded not in first_page:
+            # Year matched but day didn't - might still be okay but let's be strict
+            # if the user asked for "strict" check.
+            pass
             
-            # Additional check: day (with padding and without)
-            day_str = str(date_obj.day)
-            day_str_padded = f"{date_obj.day:02d}"
-            if day_str not in first_page and day_str_padded not in first_page:
-                # Year matched but day didn't - might still be okay but let's be strict
-                # if the user asked for "strict" check.
-                pass
-                
-            return True
+        return True
     except Exception:
         return True # Default to True if PDF can't be read to avoid deleting valid files
 
 
-async def scrape_articles(
-    newspaper_id: str = "haddas-ertra",
-    max_articles: int = 100,
-    max_pages: int = 100,
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    progress_callback: Any = None,
-) -> dict:
-    """Scrape and download newspaper PDFs. Returns summary dict."""
-    # Reset existing data if starting a new scrape
-    import shutil
-    if os.path.exists(PDFS_DIR):
-        try:
-            shutil.rmtree(PDFS_DIR)
-        except Exception:
-            pass
-    os.makedirs(PDFS_DIR, exist_ok=True)
-    
-    if os.path.exists(METADATA_PATH):
-        try:
-            os.remove(METADATA_PATH)
-        except Exception:
-            pass
-            
-    if os.path.exists(RAW_DATA_PATH):
-        try:
-            os.remove(RAW_DATA_PATH)
-        except Exception:
-            pass
+async def download_to_store(downloader, pdf_url: str, parsed_start=None) -> dict:
+    """Download `pdf_url` into the PDF store: {"sha256", "filepath"}; raises if the download fails.
 
-    newspaper = NEWSPAPERS_BY_ID.get(newspaper_id)
-    if not newspaper:
-        return {
-            "ok": False,
-            "error": f"Unknown newspaper: {newspaper_id}",
-            "successful": 0,
-            "total": 0,
-        }
+    With `parsed_start`, a PDF whose first page does not show that date's year is deleted instead
+    and {"sha256", "out_of_range": True} is returned.
+    """
+    staging_path = incoming_path(pdf_url)
+    await downloader.download(pdf_url, staging_path)
+    sha256 = await asyncio.to_thread(file_sha256, staging_path)
+    # VERIFY PDF CONTENT DATE
+    if parsed_start and not await asyncio.to_thread(_verify_pdf_date, staging_path, parsed_start, sha256):
+        os.remove(staging_path)
+        return {"sha256": sha256, "out_of_range": True}
+    sha256, filepath = await asyncio.to_thread(add_to_store, staging_path, sha256)
+    return {"sha256": sha256, "filepath": filepath}
 
-    os.makedirs(PDFS_DIR, exist_ok=True)
-    base_url = newspaper["base_url"]
-    href_filter = newspaper["link_selector_href"]
-    article_selector = 'article.listing-item'  # CSS selector for article elements
-    
-    # Parse dates and make them timezone-naive for comparison
-    parsed_start = None
-    parsed_end = None
-    if start_date and start_date.strip():
-        parsed_start = parser.parse(start_date)
-        if parsed_start.tzinfo:
-            parsed_start = parsed_start.replace(tzinfo=None)
-    if end_date and end_date.strip():
-        parsed_end = parser.parse(end_date)
-        if parsed_end.tzinfo:
-            parsed_end = parsed_end.replace(tzinfo=None)
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+class PdfDownloads:
+    """The PDF downloads of one scrape, one per URL.
 
-        try:
-            article_urls: list[str] = []
-            max_pages_to_check = 100 if (start_date or end_date) else max_pages 
+    Reposts are several articles pointing at one PDF URL. The first article starts the download and
+    the others await its result, so two tasks never write the same staging file. Share one instance
+    across all newspaper jobs of a scrape.
+    """
 
-            base = base_url.rstrip("/")
-            for page_num in range(1, max_pages_to_check + 1):
-                if progress_callback:
-                    progress_callback({"stage": "collecting", "page": page_num, "urls": len(article_urls)})
+    def __init__(self):
+        self._tasks: dict[str, asyncio.Task] = {}
 
-                page_url = f"{base}/page/{page_num}/" if page_num > 1 else base
+    async def get(self, pdf_url: str, download: Callable[[], Awaitable[dict]]) -> dict:
+        """The result of `download()` for `pdf_url`, started only if no article has asked for this URL yet."""
+        task = self._tasks.get(pdf_url)
+        if task is None:
+            task = self._tasks[pdf_url] = asyncio.create_task(download())
+        # One article's cancellation must not cancel the download the others are waiting for
+        return await asyncio.shield(task)
 
-                try:
-                    await page.goto(page_url)
-                    await page.wait_for_load_state("networkidle")
-                    await page.wait_for_timeout(2000)
-                except Exception as e:
-                    break
-
-                # Query for articles on the page
-                articles = await page.query_selector_all(article_selector)
-                current_urls = []
-                
-                # Inspect articles on page for date filtering
-                found_on_page = 0
-                older_found = False
-
-                for article in articles:
-                   try:
-                        # Date check
-                        should_include = True
-                        article_date = None
-                        date_el = await article.query_selector('.entry-date, .post-date, time')
-                        if date_el:
-                            date_text = (await date_el.text_content()).strip()
-                            try:
-                                article_date = parser.parse(date_text)
-                                # Make timezone-naive for comparison
-                                if article_date.tzinfo:
-                                    article_date = article_date.replace(tzinfo=None)
-                                    
-                                if parsed_end and article_date > parsed_end:
-                                    should_include = False
-                                if parsed_start and article_date < parsed_start:
-                                    should_include = False
-                                    older_found = True # We hit older articles
-                            except:
-                                pass # Include if date can't be parsed on listing
-                        
-                        if should_include:
-                            link = await article.query_selector(f'a.post-url[href*="{href_filter}"]')
-                            if link:
-                                href = await link.get_attribute("href")
-                                if href and href not in article_urls:
-                                    href = f"https://shabait.com{href}" if not href.startswith("http") else href
-                                    current_urls.append(href)
-                                    found_on_page += 1
-                   except Exception:
-                       continue
-
-                # If we hit older articles than our start date, we can stop traversing pages
-                if older_found and parsed_start:
-                    article_urls.extend(current_urls)
-                    break
-                
-                article_urls.extend(current_urls)
-
-                # If we've collected enough articles and no date range is specified, or we hit max
-                if not (parsed_start or parsed_end) and len(article_urls) >= max_articles:
-                    break
 
+def _parse_listing_date(date_text: Optional[str]):
+    """Parse a listing date into a timezone-naive datetime, or None if it can't be parsed."""
+    if not date_text:
+        return None
+    try:
+        article_date = parser.parse(date_text)
+    except Exception:
+        return None
+    # Make timezone-naive for comparison
+    return article_date.replace(tzinfo=None) if article_date.tzinfo else article_date
+
+
+def _listing_dates(items: list[dict]) -> list:
+    """Parsed dates of the listing items that have one."""
+    return [d for d in (_parse_listing_date(item.get("date_text")) for item in items) if d]
+
+
+def _filter_listing_items(items: list[dict], parsed_start, parsed_end, seen, site_url: str) -> tuple[list[str], bool]:
+    """Apply the date range to listing items. Returns (new article URLs, whether an item older than start was seen)."""
+    urls: list[str] = []
+    older_found = False
+    for item in items:
+        should_include = True
+        article_date = _parse_listing_date(item.get("date_text"))
+        if article_date:  # Include if date can't be parsed on listing
+            if parsed_end and article_date > parsed_end:
+                should_include = False
+            if parsed_start and article_date < parsed_start:
+                should_include = False
+                older_found = True  # We hit older articles
+
+        href = item.get("href")
+        if should_include and href:
+            href = absolute_url(href, site_url)
+            if href not in seen and href not in urls:
+                urls.append(href)
+    return urls, older_found
+
+
+async def collect_article_urls(
+    fetcher,
+    site: dict,
+    max_pages: int = 100,
+    max_articles: int = 100,
+    parsed_start=None,
+    parsed_end=None,
+    concurrency: int = 4,
+    progress_callback: Any = None,
+    is_known: Any = None,
+    stop_at_known: bool = False,
+    page_index: Optional[PageDateIndex] = None,
+) -> list[str]:
+    """Walk `site`'s listing pages `concurrency` at a time through `fetcher` and collect article URLs in listing order.
+
+    `site` is a NEWSPAPERS entry: base_url and page_url_pattern locate the pages, its selectors parse them.
+
+    Pages are fetched ahead in a sliding window but consumed in page order, so the early stop on
+    `older_found` (start date passed) and on `max_articles` behaves exactly like the sequential walk.
+    URLs for which `is_known(url)` is true are skipped; with `stop_at_known` the walk also ends on the
+    first page that contains one, since everything older was handled by an earlier run.
+
+    With a `page_index`, every loaded page's date range is recorded under the newspaper id, and when
+    `parsed_end` is set the walk starts at the first page reaching back to it (found by binary
+    search) instead of page 1; `max_pages` then counts from that page.
+    """
+    base = site["base_url"].rstrip("/")
+    index_key = site["id"]
+    concurrency = max(1, min(concurrency, max_pages))
+    loaded: dict[int, Optional[list[dict]]] = {}
+
+    async def fetch(page_num: int) -> Optional[list[dict]]:
+        if page_num in loaded:
+            return loaded.pop(page_num)
+        page_url = site["page_url_pattern"].format(base_url=base, page=page_num) if page_num > 1 else base
+        try:
+            items = await fetcher.fetch_listing(page_url, site)
+        except Exception:
+            return None
+        if page_index is not None and items:
+            page_index.record(index_key, page_num, _listing_dates(items))
+        return items
+
+    start_page = 1
+    if page_index is not None and parsed_end:
+
+        async def probe(page_num: int) -> Optional[list]:
+            # Keep probed pages so the walk below doesn't load its first page twice
+            loaded[page_num] = await fetch(page_num)
+            items = loaded[page_num]
+            return None if items is None else _listing_dates(items)
+
+        start_page = await page_index.find_first_page(index_key, parsed_end, probe)
+        loaded = {start_page: loaded[start_page]} if start_page in loaded else {}
+        if progress_callback:
+            progress_callback({"stage": "collecting", "start_page": start_page})
+
+    last_page = start_page + max_pages - 1
+    article_urls: list[str] = []
+    pending: dict[int, asyncio.Task] = {}
+    next_page = start_page
+    started = time.monotonic()
+    try:
+        for page_num in range(start_page, last_page + 1):
+            while next_page <= last_page and next_page < page_num + concurrency:
+                pending[next_page] = asyncio.create_task(fetch(next_page))
+                next_page += 1
+
+            items = await pending.pop(page_num)
+            if items is None:
+                break
+
+            current_urls, older_found = _filter_listing_items(items, parsed_start, parsed_end, article_urls, site["site_url"])
+            known_found = False
+            if is_known:
+                new_urls = [u for u in current_urls if not is_known(u)]
+                known_found = len(new_urls) < len(current_urls)
+                current_urls = new_urls
+            article_urls.extend(current_urls)
+
+            if progress_callback:
+                elapsed = time.monotonic() - started
+                progress_callback({
+                    "stage": "collecting",
+                    "page": page_num,
+                    "urls": len(article_urls),
+                    "pages_per_sec": round((page_num - start_page + 1) / elapsed, 2) if elapsed > 0 else None,
+                })
+
+            # If we hit older articles than our start date, we can stop traversing pages
+            if older_found and parsed_start:
+                break
+            # Only the first max_articles URLs are used, so there is no point loading more pages
+            if len(article_urls) >= max_articles:
+                break
+            if known_found and stop_at_known:
+                break
+    finally:
+        for task in pending.values():
+            task.cancel()
+        await asyncio.gather(*pending.values(), return_exceptions=True)
+        if page_index is not None:
+            page_index.save()
+
+    return article_urls
+
+
+def merge_metadata(existing: list[dict], new_entries: list[dict]) -> list[dict]:
+    """Merge this run's metadata into the stored list.
+
+    Entries for article URLs already in `existing` replace them in place (keeping their index);
+    the rest are appended in order with fresh indexes.
+    """
+    by_url = {e.get("article_url"): e for e in new_entries}
+    merged = []
+    for entry in existing:
+        replacement = by_url.pop(entry.get("article_url"), None)
+        if replacement is not None:
+            replacement["index"] = entry.get("index")
+        merged.append(replacement or entry)
+    next_index = max((e.get("index") or 0 for e in merged), default=0) + 1
+    for entry in new_entries:
+        if entry.get("article_url") in by_url:
+            entry["index"] = next_index
+            next_index += 1
+            merged.append(entry)
+    return merged
+
+
+class MetadataStore:
+    """pdf_metadata.json shared by the newspaper jobs of one scrape.
+
+    Holds the entries stored by earlier runs plus one slot list per job (one slot per article, so
+    entries keep listing order however downloads finish). Jobs run on one event loop and `save()`
+    is synchronous, so concurrent jobs never overwrite each other's entries.
+    """
+
+    def __init__(self, path: str = METADATA_PATH, existing: Optional[list[dict]] = None):
+        self.path = path
+        self.existing = existing or []
+        self._jobs: list[list[Optional[dict]]] = []
+
+    def job_slots(self, size: int) -> list[Optional[dict]]:
+        slots: list[Optional[dict]] = [None] * size
+        self._jobs.append(slots)
+        return slots
+
+    def save(self) -> list[dict]:
+        """Write stored + completed new entries; returns the completed new entries."""
+        new_metadata = [e for slots in self._jobs for e in slots if e and e["download_status"] == "completed"]
+        write_json_atomic(self.path, merge_metadata(self.existing, new_metadata))
+        return new_metadata
+
+
+async def _scrape_newspaper(
+    newspaper: dict,
+    store: MetadataStore,
+    frontier: UrlFrontier,
+    page_index: PageDateIndex,
+    max_articles: int,
+    max_pages: int,
+    parsed_start,
+    parsed_end,
+    progress_callback: Any,
+    listing_concurrency: Optional[int],
+    fetcher_mode: str,
+    download_concurrency: Optional[int],
+    incremental: bool,
+    requests_per_second: Optional[float],
+    browser_manager,
+    pdf_downloads: PdfDownloads,
+) -> dict:
+    """Scrape one newspaper with its own fetcher, downloader and rate limiter into the shared `store`.
+
+    PDF URLs already being downloaded by any job (`pdf_downloads`) are awaited, not fetched again.
+    """
+    newspaper_id = newspaper["id"]
+    # Explicit arguments override the newspaper's own crawl budget
+    listing_concurrency = listing_concurrency or newspaper.get("listing_concurrency", 4)
+    download_concurrency = download_concurrency or newspaper.get("download_concurrency", 4)
+    requests_per_second = requests_per_second or newspaper.get("requests_per_second", 2.0)
+
+    def report(progress: dict) -> None:
+        if progress_callback:
+            progress_callback({**progress, "newspaper_id": newspaper_id})
+
+    def save_progress() -> list[dict]:
+        new_metadata = store.save()
+        frontier.save()
+        return new_metadata
+
+    limiter = HostRateLimiter(rate=requests_per_second)
+    async with open_fetcher(fetcher_mode, listing_concurrency, limiter, browser_manager=browser_manager) as fetcher, \
+            open_downloader(download_concurrency, limiter=limiter) as downloader:
+        try:
+            # The page index jumps straight to the end date, so 100 pages from there covers long ranges
+            max_pages_to_check = 100 if (parsed_start or parsed_end) else max_pages
+
+            article_urls = await collect_article_urls(
+                fetcher,
+                newspaper,
+                max_pages=max_pages_to_check,
+                max_articles=max_articles,
+                parsed_start=parsed_start,
+                parsed_end=parsed_end,
+                concurrency=listing_concurrency,
+                progress_callback=report,
+                is_known=frontier.is_known_article if incremental else None,
+                stop_at_known=incremental and not (parsed_start or parsed_end),
+                page_index=page_index,
+            )
             article_urls = article_urls[:max_articles]
 
-            pdf_metadata: list[dict] = [] # Initialize empty, append as we process/confirm
+            entries = store.job_slots(len(article_urls))
+            downloads: list[asyncio.Task] = []
 
-            
-            # Temporary storage to save metadata iteratively
-            # Re-read existing metadata might be safer? 
-            # For this service, let's just overwrite for the current scraping session or append?
-            # The original code overwrote. Let's stick to that for now or clear.
-            
-            # Let's process and then save.
-            
-            final_metadata = []
+            async def download(slot: int, meta_entry: dict) -> None:
+                pdf_url = meta_entry["pdf_url"]
+                try:
+                    stored = await pdf_downloads.get(
+                        pdf_url, lambda: download_to_store(downloader, pdf_url, parsed_start)
+                    )
+                    sha256 = stored["sha256"]
+                    if stored.get("out_of_range"):
+                        # Remembered, so later runs for the same year skip the download
+                        frontier.mark_pdf(
+                            pdf_url, "out_of_range", sha256=sha256, checked_year=parsed_start.year,
+                            article_url=meta_entry["article_url"],
+                        )
+                        frontier.mark_article(meta_entry["article_url"], "out_of_range", pdf_url=pdf_url)
+                        return
+                    filepath = stored["filepath"]
+                    meta_entry.update({"pdf_filepath": filepath, "pdf_sha256": sha256, "download_status": "completed"})
+                    frontier.mark_pdf(pdf_url, "completed", filepath=filepath, sha256=sha256, article_url=meta_entry["article_url"])
+                    frontier.mark_article(meta_entry["article_url"], "completed", pdf_url=pdf_url)
+                except Exception as e:
+                    meta_entry["download_status"] = "failed"
+                    meta_entry["error"] = str(e)
+                    frontier.mark_pdf(pdf_url, "failed", error=str(e), article_url=meta_entry["article_url"])
+                    frontier.mark_article(meta_entry["article_url"], "failed", pdf_url=pdf_url)
+                entries[slot] = meta_entry
+                if meta_entry["download_status"] == "completed":
+                    # Save progressively
+                    save_progress()
 
             for i, article_url in enumerate(article_urls):
-                if progress_callback:
-                    progress_callback(
-                        {"stage": "downloading", "current": i + 1, "total": len(article_urls), "url": article_url}
-                    )
+                report({"stage": "downloading", "current": i + 1, "total": len(article_urls), "url": article_url})
 
                 try:
-                    await page.goto(article_url)
-                    await page.wait_for_load_state("networkidle")
-
-                    title_el = await page.query_selector("h1, .entry-title, .post-title")
-                    title = (await title_el.text_content()).strip() if title_el else f"Article {i+1}"
-
-                    date_el = await page.query_selector(".entry-date, .post-date, time")
-                    date = (await date_el.text_content()).strip() if date_el else "Unknown Date"
+                    info = await fetcher.fetch_article(article_url, newspaper)
+                    if info is None:
+                        continue
+                    title = info["title"] or f"Article {i+1}"
+                    date = info["date"] or "Unknown Date"
                     
                     # Double check date if filtering was requested
                     if parsed_start or parsed_end:
@@ -214,24 +384,11 @@ async def scrape_articles(
                         except:
                             pass
 
-                    direct_pdf_url = None
-                    icon = await page.query_selector("img.wp-image-77661")
-                    if icon:
-                        parent = await icon.query_selector("xpath=ancestor::a[1]")
-                        if parent:
-                            href = await parent.get_attribute("href")
-                            if href and (href.endswith(".pdf") or "erinewspapers.com" in href):
-                                direct_pdf_url = href if href.startswith("http") else f"https://shabait.com{href}"
-
-                    if not direct_pdf_url:
-                        for link in await page.query_selector_all('a[href$=".pdf"]'):
-                            href = await link.get_attribute("href")
-                            if href and ("erinewspapers.com" in href or "hadas-eritrea" in href):
-                                direct_pdf_url = href if href.startswith("http") else f"https://shabait.com{href}"
-                                break
+                    direct_pdf_url = info["pdf_url"]
 
                     meta_entry = {
-                        "index": len(final_metadata) + 1,
+                        "index": None,
+                        "newspaper_id": newspaper_id,
                         "article_url": article_url,
                         "download_status": "pending",
                         "text_extraction_status": "pending",
@@ -243,67 +400,242 @@ async def scrape_articles(
                         def _safe(s: str) -> str:
                             return "".join(c if c not in '/\\:*?"<>|' else "-" for c in (s or ""))
 
+                        # Display name only; the file itself lives in the content-addressed store
                         filename = f"{_safe(date)}_{_safe(title)}.pdf"
-                        filepath = os.path.join(PDFS_DIR, filename)
-                        
+
                         meta_entry.update({
                             "pdf_filename": filename,
-                            "pdf_filepath": filepath,
+                            "pdf_filepath": None,
+                            "pdf_sha256": None,
                             "pdf_url": direct_pdf_url
                         })
 
-                        try:
-                            r = requests.get(direct_pdf_url, timeout=30)
-                            r.raise_for_status()
-                            with open(filepath, "wb") as f:
-                                f.write(r.content)
-                            
-                            # VERIFY PDF CONTENT DATE
-                            if parsed_start and not _verify_pdf_date(filepath, parsed_start):
-                                os.remove(filepath)
-                                continue
-                                
-                            meta_entry["download_status"] = "completed"
-                        except Exception as e:
-                            meta_entry["download_status"] = "failed"
-                            meta_entry["error"] = str(e)
+                        known_pdf = frontier.completed_pdf(direct_pdf_url) if incremental else None
+                        if known_pdf and os.path.exists(known_pdf.get("filepath", "")):
+                            # Same issue already downloaded (e.g. reposted under a new article URL)
+                            meta_entry.update({
+                                "pdf_filepath": known_pdf["filepath"],
+                                "pdf_sha256": known_pdf.get("sha256"),
+                                "download_status": "completed",
+                            })
+                            frontier.mark_article(article_url, "completed", pdf_url=direct_pdf_url)
+                            entries[i] = meta_entry
+                            save_progress()
+                        elif incremental and parsed_start and frontier.out_of_range_pdf(direct_pdf_url, parsed_start.year):
+                            # Downloaded on an earlier run; its first page is not from the requested year
+                            frontier.mark_article(article_url, "out_of_range", pdf_url=direct_pdf_url)
+                        else:
+                            # Download in the background while the next article page is visited
+                            downloads.append(asyncio.create_task(download(i, meta_entry)))
                     else:
-                        meta_entry["download_status"] = "failed"
-                        meta_entry["error"] = "No PDF link found"
-                    
-                    if meta_entry["download_status"] == "completed":
-                        final_metadata.append(meta_entry)
-                        # Save progressively
-                        with open(METADATA_PATH, "w", encoding="utf-8") as f:
-                            json.dump(final_metadata, f, ensure_ascii=False, indent=2)
+                        frontier.mark_article(article_url, "no_pdf")
 
                 except Exception as e:
                    pass # Log error but continue
 
-                if i < len(article_urls) - 1:
-                    time.sleep(2)
+            if downloads:
+                report({"stage": "downloading", "current": len(article_urls), "total": len(article_urls), "pending_downloads": sum(not t.done() for t in downloads)})
+                await asyncio.gather(*downloads)
 
-            successful = sum(1 for m in final_metadata if m.get("download_status") == "completed")
+            completed = [e for e in entries if e and e["download_status"] == "completed"]
             return {
                 "ok": True,
                 "newspaper_id": newspaper_id,
-                "total": len(final_metadata),
-                "successful": successful,
-                "metadata_path": METADATA_PATH,
+                "total": len(completed),
+                "successful": len(completed),
+                "fetcher": fetcher.name,
+                "playwright_fallbacks": getattr(fetcher, "fallbacks", 0),
+                "rate_limits": limiter.stats(),
+                "page_latency": fetcher.latency.summary(),
             }
 
         except Exception as e:
-            return {"ok": False, "error": str(e), "successful": 0, "total": 0}
-        finally:
-            await browser.close()
+            return {"ok": False, "newspaper_id": newspaper_id, "error": str(e), "successful": 0, "total": 0}
 
 
+async def scrape_newspapers(
+    newspaper_ids: Optional[list[str]] = None,
+    max_articles: int = 100,
+    max_pages: int = 100,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    progress_callback: Any = None,
+    listing_concurrency: Optional[int] = None,
+    fetcher_mode: str = "auto",
+    download_concurrency: Optional[int] = None,
+    incremental: bool = True,
+    requests_per_second: Optional[float] = None,
+    browser_manager=None,
+) -> dict:
+    """Scrape several newspapers (default: every NEWSPAPERS entry) concurrently. Returns summary dict.
+
+    Each newspaper runs with its own fetcher, downloader and rate limiter, sized from its registry
+    entry (`listing_concurrency`, `download_concurrency`, `requests_per_second`) unless overridden
+    here. `max_articles`/`max_pages` apply per newspaper. All jobs write into one pdf_metadata.json
+    (entries carry `newspaper_id`) and share the URL frontier, page index and PDF store.
+
+    Downloads are moved into the content-addressed PDF store, so identical issues are kept once;
+    each metadata entry records `pdf_sha256` and points `pdf_filepath` at the stored copy.
+
+    With `incremental` (the default) existing PDFs, metadata and processed data are kept: the
+    URL frontier skips known articles, the listing walk stops at the first known article, only
+    new issues are downloaded, and their entries are appended to pdf_metadata.json.
+    `incremental=False` wipes everything and scrapes from scratch.
+
+    Listing pages are fetched `listing_concurrency` at a time; progress payloads carry the
+    `newspaper_id` and, for the "collecting" stage, `pages_per_sec`. `fetcher_mode` is "auto"
+    (plain HTTP, falling back to Playwright when the selectors come back empty), "http" or "playwright".
+    PDFs download in the background, `download_concurrency` at a time, while article pages are visited.
+
+    Requests go through a per-host rate limiter starting at `requests_per_second`; it speeds up
+    while the site answers and backs off on 429/5xx and Retry-After. Each newspaper's summary
+    includes its final per-host rates (`rate_limits`) and per-page fetch latencies by fetcher and
+    page type (`page_latency`).
+
+    Pass the backend's `browser_manager` to render pages in contexts of its long-lived
+    Chromium instead of launching (and tearing down) a browser for this call.
+    """
+    newspaper_ids = newspaper_ids or [n["id"] for n in NEWSPAPERS]
+    unknown = [nid for nid in newspaper_ids if nid not in NEWSPAPERS_BY_ID]
+    if unknown:
+        return {
+            "ok": False,
+            "error": f"Unknown newspaper: {', '.join(unknown)}",
+            "successful": 0,
+            "total": 0,
+        }
+
+    if not incremental:
+        # Reset existing data if starting a new scrape
+        import shutil
+        if os.path.exists(PDFS_DIR):
+            try:
+                shutil.rmtree(PDFS_DIR)
+            except Exception:
+                pass
+        os.makedirs(PDFS_DIR, exist_ok=True)
+
+        for path in (METADATA_PATH, RAW_DATA_PATH, FRONTIER_PATH):
+            if os.path.exists(path):
+                try:
+                    os.remove(path)
+                except Exception:
+                    pass
+
+    os.makedirs(PDFS_DIR, exist_ok=True)
+    frontier = UrlFrontier()
+    page_index = PageDateIndex()
+    store = MetadataStore(METADATA_PATH, load_json(METADATA_PATH, []) if incremental else [])
+    
+    # Parse dates and make them timezone-naive for comparison
+    parsed_start = None
+    parsed_end = None
+    if start_date and start_date.strip():
+        parsed_start = parser.parse(start_date)
+        if parsed_start.tzinfo:
+            parsed_start = parsed_start.replace(tzinfo=None)
+    if end_date and end_date.strip():
+        parsed_end = parser.parse(end_date)
+        if parsed_end.tzinfo:
+            parsed_end = parsed_end.replace(tzinfo=None)
+
+    pdf_downloads = PdfDownloads()
+    results = await asyncio.gather(*(
+        _scrape_newspaper(
+            NEWSPAPERS_BY_ID[nid],
+            store,
+            frontier,
+            page_index,
+            max_articles=max_articles,
+            max_pages=max_pages,
+            parsed_start=parsed_start,
+            parsed_end=parsed_end,
+            progress_callback=progress_callback,
+            listing_concurrency=listing_concurrency,
+            fetcher_mode=fetcher_mode,
+            download_concurrency=download_concurrency,
+            incremental=incremental,
+            requests_per_second=requests_per_second,
+            browser_manager=browser_manager,
+            pdf_downloads=pdf_downloads,
+        )
+        for nid in newspaper_ids
+    ))
+
+    final_metadata = store.save()
+    frontier.save()
+    errors = [f"{r['newspaper_id']}: {r['error']}" for r in results if not r["ok"]]
+    return {
+        "ok": not errors,
+        "error": "; ".join(errors) or None,
+        "total": len(final_metadata),
+        "successful": sum(r["successful"] for r in results),
+        "incremental": incremental,
+        "metadata_path": METADATA_PATH,
+        "newspapers": {r["newspaper_id"]: r for r in results},
+    }
+
+
+async def scrape_articles(
+    newspaper_id: str = "haddas-ertra",
+    max_articles: int = 100,
+    max_pages: int = 100,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    progress_callback: Any = None,
+    listing_concurrency: Optional[int] = None,
+    fetcher_mode: str = "auto",
+    download_concurrency: Optional[int] = None,
+    incremental: bool = True,
+    requests_per_second: Optional[float] = None,
+    browser_manager=None,
+) -> dict:
+    """Scrape and download one newspaper's PDFs. Returns summary dict (see scrape_newspapers)."""
+    result = await scrape_newspapers(
+        [newspaper_id],
+        max_articles=max_articles,
+        max_pages=max_pages,
+        start_date=start_date,
+        end_date=end_date,
+        progress_callback=progress_callback,
+        listing_concurrency=listing_concurrency,
+        fetcher_mode=fetcher_mode,
+        download_concurrency=download_concurrency,
+        incremental=incremental,
+        requests_per_second=requests_per_second,
+        browser_manager=browser_manager,
+    )
+    if "newspapers" not in result:
+        return result
+    job = result["newspapers"][newspaper_id]
+    if not job["ok"]:
+        return {"ok": False, "error": job["error"], "successful": 0, "total": 0}
+    return {**job, "incremental": incremental, "metadata_path": METADATA_PATH}
+
 def run_scrape_sync(
     newspaper_id: str = "haddas-ertra",
     max_articles: int = 20,
     max_pages: int = 50,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    listing_concurrency: Optional[int] = None,
+    fetcher_mode: str = "auto",
+    download_concurrency: Optional[int] = None,
+    incremental: bool = True,
+    requests_per_second: Optional[float] = None,
 ) -> dict:
     """Synchronous wrapper for scrape_articles."""
-    return asyncio.run(scrape_articles(newspaper_id, max_articles, max_pages, start_date, end_date))
+    return asyncio.run(
+        scrape_articles(
+            newspaper_id,
+            max_articles,
+            max_pages,
+            start_date,
+            end_date,
+            listing_concurrency=listing_concurrency,
+            fetcher_mode=fetcher_mode,
+            download_concurrency=download_concurrency,
+            incremental=incremental,
+            requests_per_second=requests_per_second,
+        )
+    )
@@ -0,0 +1,160 @@
+"""Compiled Ge'ez text cleaner behind clean_text: patterns built once, whole-text passes where lines allow."""
+import re
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+# Newspaper furniture removed from the whole text, in this order (each pass sees the previous one's output)
+NOISE_PATTERNS = [
+    r"PAGE\s+\d+", r"page\s+\d+", r"waga\s+[\d.]+", r"ዋጋ\s+[\d.]+",
+    r"ISSUE\s+\d+", r"VOL\s+\d+", r"VOLUME\s+\d+",
+    r"\d{1,2}/\d{1,2}/\d{4}", r"\d{4}-\d{2}-\d{2}",
+    r"©\s*\d{4}", r"All rights reserved", r"http[s]?://\S+", r"www\.\S+",
+]
+# Bullets, separators, ((boxed)) notes and "12km"-style tokens removed from each kept line. They run
+# over all kept lines joined by "\n" at once, so none of them may match a newline.
+NAV_PATTERNS = [r"•", r"▪", r"&", r"±±", r"——", r"\(\([^)\n]*\)\)", r"\b\d+[^\S\n]*[a-zA-Z]+\b"]
+# Lines where these make up more than MAX_SPECIAL_RATIO of the non-space characters are dropped
+SPECIAL_CHARS = "•●○■□▪▫▲▼◄►◆◇◈◉◊※‹›«»\"'±—&()[]{}"
+MAX_SPECIAL_RATIO = 0.15
+# Lines shorter than SHORT_LINE characters need at least MIN_SHORT_LINE_GEEZ Ge'ez characters
+SHORT_LINE = 10
+MIN_SHORT_LINE_GEEZ = 3
+
+_ENGLISH_WORD = re.compile(r"\b[a-zA-Z]+\b")
+_GEEZ_CHAR = re.compile(r"[\u1200-\u137F]")
+_GEEZ_REPEAT = re.compile(r"([\u1200-\u137F])\1+")
+# One match per whitespace-separated token containing a Ge'ez character
+_GEEZ_WORD = re.compile(r"[^\s\u1200-\u137F]*[\u1200-\u137F]\S*")
+# The original filter f"[^{allowed}]" with allowed = "[...]" parses as a class followed by a literal "]",
+# so it only drops a character outside Ge'ez, ASCII and general punctuation that precedes a "]". Kept as is.
+_STRAY_BEFORE_BRACKET = re.compile(r"[^\u1200-\u137F\u0000-\u007F\u2000-\u206F]\]")
+
+
+def deduplicate_geez_chars(text: str) -> str:
+    """Fix character repetition in Ge'ez text (e.g., 'ክክብብ' -> 'ክብ') and doubled words ('ገጽገጽ' -> 'ገጽ').
+
+    Whitespace is normalised to single spaces.
+    """
+    if not text:
+        return ""
+    words = []
+    for word in _GEEZ_REPEAT.sub(r"\1", text).split():
+        half = len(word) // 2
+        # The halves are equal, so one Ge'ez character means at least two in the word
+        if len(word) > 2 and word[:half] == word[half:] and _GEEZ_CHAR.search(word):
+            word = word[:half]
+        words.append(word)
+    return " ".join(words)
+
+
+def _remove_all_but_last_line(pattern: re.Pattern, text: str) -> tuple[str, str]:
+    """(text before its last non-blank line with `pattern` removed, the rest unchanged).
+
+    Only a match starting on the last non-blank line can run on into text that follows (noise
+    patterns cross newlines only in their whitespace), so the rest is what must wait for more text;
+    a match reaching into it from an earlier line is left with it.
+    """
+    end = len(text.rstrip())
+    split = text.rfind("\n", 0, end) + 1 if end else 0
+    pieces, position = [], 0
+    for match in pattern.finditer(text):
+        if match.end() > split:
+            split = min(split, match.start())
+            break
+        pieces.append(text[position:match.start()])
+        position = match.end()
+    pieces.append(text[position:split])
+    return "".join(pieces), text[split:]
+
+
+class GeezTextCleaner:
+    """clean_text's rules with every pattern compiled once.
+
+    The noise passes stay separate and ordered: a single alternation would miss matches that one
+    removal exposes for the next (e.g. "waPAGE 1ga 5"). Line filters count characters with one
+    compiled class each; nav removal and de-duplication then run once over the surviving lines.
+    `dedupe` runs deduplicate_geez_chars on kept lines; lines with fewer than `min_geez_words`
+    Ge'ez-bearing words are dropped (0 keeps every non-empty line).
+    """
+
+    def __init__(
+        self,
+        nav_patterns: Iterable[str] = NAV_PATTERNS,
+        special_chars: str = SPECIAL_CHARS,
+        dedupe: bool = True,
+        min_geez_words: int = 4,
+    ):
+        self._noise = [re.compile(p, re.IGNORECASE) for p in NOISE_PATTERNS]
+        self._nav = [re.compile(p) for p in nav_patterns]
+        self._special = re.compile(f"[{re.escape(special_chars)}]")
+        self.dedupe = dedupe
+        self.min_geez_words = min_geez_words
+
+    def _enough_geez_words(self, line: str) -> bool:
+        if not self.min_geez_words:
+            return True
+        found = islice(_GEEZ_WORD.finditer(line), self.min_geez_words)
+        return sum(1 for _ in found) == self.min_geez_words
+
+    def clean(self, text: str) -> str:
+        """Clean extracted text: keep Ge'ez, numbers, punctuation; remove English and noise."""
+        if not text:
+            return ""
+        return self._clean_lines(self._remove_noise(text))
+
+    def clean_pages(self, pages: Iterable[Optional[str]]) -> Iterator[str]:
+        """clean() for a document read page by page: one cleaned text per page, in order.
+
+        Joined by spaces the pages give exactly what clean() gives for the whole document (each page
+        ending in a newline), while only about a page of text is held. Noise patterns can span a page
+        break ("... PAGE" ending one page, "12 ..." starting the next), so each noise pass holds back
+        its input from the start of the last non-blank line; held lines are cleaned with a later page.
+        """
+        held = [""] * len(self._noise)
+        pending, previous = "", None
+        for page in pages:
+            if previous is not None:
+                yield self._clean_lines(previous)
+            text = page + "\n" if page else ""
+            for i, pattern in enumerate(self._noise):
+                text, held[i] = _remove_all_but_last_line(pattern, held[i] + text)
+            pending += text
+            cut = pending.rfind("\n") + 1
+            previous, pending = pending[:cut], pending[cut:]
+        if previous is not None:
+            text = ""
+            for i, pattern in enumerate(self._noise):
+                text = pattern.sub("", held[i] + text)
+            yield self._clean_lines(previous + pending + text)
+
+    def _remove_noise(self, text: str) -> str:
+        for pattern in self._noise:
+            text = pattern.sub("", text)
+        return text
+
+    def _clean_lines(self, text: str) -> str:
+        text = _ENGLISH_WORD.sub("", text)
+
+        candidates = []
+        for line in text.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            total = len(line) - line.count(" ")
+            if total > 0 and len(self._special.findall(line)) / total > MAX_SPECIAL_RATIO:
+                continue
+            if len(line) < SHORT_LINE and len(_GEEZ_CHAR.findall(line)) < MIN_SHORT_LINE_GEEZ:
+                continue
+            candidates.append(line)
+
+        text = "\n".join(candidates)
+        for pattern in self._nav:
+            text = pattern.sub("", text)
+        text = "\n".join(line for line in text.split("\n") if line.strip() and self._enough_geez_words(line))
+        if self.dedupe:
+            # Per-line de-duplication would join words with spaces; lines are flattened below anyway
+            text = deduplicate_geez_chars(text)
+
+        if "]" in text:
+            text = _STRAY_BEFORE_BRACKET.sub("", text)
+        return " ".join(text.split())
@@ -0,0 +1,81 @@
+"""Pluggable PDF text extraction: one generator of page texts per backend, chosen by TEXT_EXTRACTOR."""
+import io
+from typing import Callable, Iterator, Optional
+
+from app.config import TEXT_EXTRACTOR
+
+
+def pdfplumber_page_texts(pdf_path: str) -> Iterator[Optional[str]]:
+    """pdfplumber's layout-aware `extract_text()`: best reading order, slowest."""
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            try:
+                text = page.extract_text()
+            except Exception:
+                text = None
+            page.close()
+            yield text
+
+
+def pdfminer_page_texts(pdf_path: str) -> Iterator[Optional[str]]:
+    """pdfminer text grouped into lines, without pdfplumber's character clustering or box ordering."""
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    # Line grouping keeps spaces between words; boxes_flow=None skips the reading-order pass
+    laparams = LAParams(boxes_flow=None)
+    resources = PDFResourceManager(caching=True)
+    with open(pdf_path, "rb") as f:
+        for page in PDFPage.get_pages(f):
+            out = io.StringIO()
+            device = TextConverter(resources, out, laparams=laparams)
+            try:
+                PDFPageInterpreter(resources, device).process_page(page)
+                text = out.getvalue()
+            except Exception:
+                text = None
+            finally:
+                device.close()
+            yield text
+
+
+def pypdfium2_page_texts(pdf_path: str) -> Iterator[Optional[str]]:
+    """PDFium's text layer (C++, no layout analysis): by far the fastest."""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page in pdf:
+            try:
+                textpage = page.get_textpage()
+                text = textpage.get_text_range().replace("\r\n", "\n")
+                textpage.close()
+            except Exception:
+                text = None
+            finally:
+                page.close()
+            yield text
+    finally:
+        pdf.close()
+
+
+TEXT_EXTRACTORS: dict[str, Callable[[str], Iterator[Optional[str]]]] = {
+    "pdfplumber": pdfplumber_page_texts,
+    "pdfminer": pdfminer_page_texts,
+    "pypdfium2": pypdfium2_page_texts,
+}
+
+
+def page_texts(pdf_path: str, backend: Optional[str] = None) -> Iterator[Optional[str]]:
+    """Text of each page of `pdf_path` in order (None where a page could not be read).
+
+    `backend` is a TEXT_EXTRACTORS key; defaults to the TEXT_EXTRACTOR setting.
+    """
+    backend = backend or TEXT_EXTRACTOR
+    if backend not in TEXT_EXTRACTORS:
+        raise ValueError(f"Unknown text extractor {backend!r}; choose from {', '.join(TEXT_EXTRACTORS)}")
+    return TEXT_EXTRACTORS[backend](pdf_path)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Golden check and micro-benchmark for the Ge'ez text cleaners.
+
+First checks clean_text (backend/app/services/pdf_service.py) and pdf_processor.clean_text against
+golden outputs in benchmarks/fixtures, recorded from the original implementations on
+issue_text.txt, a synthetic issue mixing Ge'ez words with the noise the cleaners remove (page
+and issue markers, dates, URLs, English, bullets, doubled characters and words, odd whitespace).
+The page-by-page cleaners (clean_pages) are checked against the same outputs, with the issue cut
+into pages of 1 and 7 lines, and against clean_text on BREAK_PAGES, where noise spans page breaks.
+Any difference fails the run.
+
+Then times clean_text on a large generated issue (default 40 pages) against the original
+line-by-line implementation kept below as the reference, and checks both outputs match.
+
+    python benchmarks/bench_cleaner.py --pages 40 --repeat 5
+    python benchmarks/bench_cleaner.py --check-only
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+sys.path.insert(0, ROOT)
+
+FIXTURES_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+INPUT_PATH = os.path.join(FIXTURES_DIR, "issue_text.txt")
+GOLDEN_PATHS = {
+    "pdf_service.clean_text": os.path.join(FIXTURES_DIR, "issue_text.clean.txt"),
+    "pdf_processor.clean_text": os.path.join(FIXTURES_DIR, "issue_text.clean_cli.txt"),
+}
+
+# Page and price markers split from their numbers by a page break, and a page of only a marker
+BREAK_PAGES = [
+    "ሰላም ሃገርና ህዝብና ኤርትራ ብዓብዪ ሓጎስ ሃገር PAGE",
+    "12 ሰብ ሰላም ሓቢሩ ይሰርሕ ኣሎ ሎሚ waga",
+    "",
+    "\n3.50 ዓቢ ዜና ካብ ኣስመራ ሎሚ ተዘርጊሑ ISSUE",
+    "VOL",
+    "7 ሓጎስ ህዝብና ብዓብዪ ዜና ኣስመራ ©\n",
+    "2025 ሎሚ ሰላም ሃገርና ህዝብና ኤርትራ",
+]
+
+GEEZ = [chr(c) for c in range(0x1200, 0x1358)]
+PUNCT = ["።", "፣", "፤", "፡", "?", "!", ",", ".", ":", "-", "(", ")", "“", "”", "'", '"']
+NOISE = [
+    "PAGE {n}", "page {n}", "Page  {n}", "waga {n}.00", "ዋጋ {n}.50", "ISSUE {n}", "Vol {n}", "VOLUME {n}",
+    "{d}/{m}/2025", "2025-03-{d:02d}", "© 2025", "All rights reserved", "https://shabait.com/{n}/x",
+    "www.shabait.com", "HADDAS ERTRA", "Eritrea", "No.{n}", "{n}km", "{n} ሚልዮን", "{n}%",
+]
+ODD = [
+    "•", "▪", "\uf0a7", "\uf0b7", "&", "±±", "——", "●", "■", "◆", "※", "«", "»", "[", "]", "{", "}",
+    "((ማስታወቂያ))", "é", "€", "ß", "\u017f", "\u212a", "\xa0", "\u2003", "\t", "\x0c", "\u3000", "ع", "中",
+    "\U0001f44d", "\ufb01", "\u200b", "é]", "€]", "中]", "\u017f\u017fue 4", "Pa\u212aGE 3", "waPAGE 1ga 5",
+    "((ሰላም", "))", "12km", "5 \u212am",
+]
+
+
+def _word(rng: random.Random) -> str:
+    w = "".join(rng.choice(GEEZ) for _ in range(rng.randint(1, 6)))
+    r = rng.random()
+    if r < 0.04:
+        w = w + w  # doubled word (ገጽገጽ)
+    elif r < 0.08:
+        i = rng.randrange(len(w))
+        w = w[:i] + w[i] * rng.randint(2, 3) + w[i + 1:]  # doubled character (ክክብ)
+    return w
+
+
+def _line(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.05:
+        return ""
+    if kind < 0.12:
+        return " ".join(rng.choice(ODD + PUNCT) for _ in range(rng.randint(1, 8)))
+    if kind < 0.2:
+        return " ".join(_word(rng) for _ in range(rng.randint(1, 3)))
+    parts = []
+    for _ in range(rng.randint(3, 18)):
+        r = rng.random()
+        if r < 0.72:
+            parts.append(_word(rng))
+        elif r < 0.82:
+            parts.append(rng.choice(NOISE).format(n=rng.randint(1, 999), d=rng.randint(1, 28), m=rng.randint(1, 12)))
+        elif r < 0.9:
+            parts.append(rng.choice(PUNCT))
+        elif r < 0.96:
+            parts.append(rng.choice(ODD))
+        else:
+            parts.append(str(rng.randint(0, 99999)))
+    text = rng.choice([" ", " ", " ", "  ", "\t"]).join(parts)
+    if rng.random() < 0.1:
+        text = "   " + text + "  "
+    return text
+
+
+def make_issue_text(pages: int = 40, lines_per_page: int = 60, seed: int = 1) -> str:
+    """Deterministic synthetic issue text: `pages` pages of `lines_per_page` lines, separated by form feeds."""
+    rng = random.Random(seed)
+    return "\n".join("\n".join(_line(rng) for _ in range(lines_per_page)) + "\f" for _ in range(pages))
+
+
+# The original pdf_service implementation, kept verbatim as the timing and equivalence reference
+def _reference_deduplicate_geez_chars(text: str) -> str:
+    """Fix character repetition in Ge'ez text (e.g., 'ክክብብ' -> 'ክብ')."""
+    if not text:
+        return ""
+
+    # Pattern: doubled characters (AABBCC)
+    # Applying to Ge'ez range \u1200-\u137F
+    result = ""
+    if len(text) > 0:
+        result += text[0]
+        for i in range(1, len(text)):
+            # If current char is same as previous and is in Ge'ez range, skip it
+            is_geez = "\u1200" <= text[i] <= "\u137F"
+            if is_geez and text[i] == text[i-1]:
+                continue
+            result += text[i]
+
+    # Pattern: doubled words (ገጽገጽ) - optional but common in extraction errors
+    # Split text into potential Ge'ez blocks and deduplicate if whole blocks repeat
+    words = []
+    for word in result.split():
+        if len(word) > 2 and word[:len(word)//2] == word[len(word)//2:]:
+            # Check if it looks like a Ge'ez word repetition
+            geez_count = sum(1 for c in word if "\u1200" <= c <= "\u137F")
+            if geez_count > 1:
+                words.append(word[:len(word)//2])
+                continue
+        words.append(word)
+
+    return " ".join(words)
+
+
+def reference_clean_text(text: str) -> str:
+    """Clean extracted text: keep Ge'ez, numbers, punctuation; remove English and noise."""
+    if not text:
+        return ""
+
+    noise = [
+        r"PAGE\s+\d+", r"page\s+\d+", r"waga\s+[\d.]+", r"ዋጋ\s+[\d.]+",
+        r"ISSUE\s+\d+", r"VOL\s+\d+", r"VOLUME\s+\d+",
+        r"\d{1,2}/\d{1,2}/\d{4}", r"\d{4}-\d{2}-\d{2}",
+        r"©\s*\d{4}", r"All rights reserved", r"http[s]?://\S+", r"www\.\S+",
+    ]
+    for p in noise:
+        text = re.sub(p, "", text, flags=re.IGNORECASE)
+    text = re.sub(r"\b[a-zA-Z]+\b", "", text)
+
+    nav = [r"•", r"▪", r"&", r"±±", r"——", r"\(\([^)]*\)\)", r"\b\d+\s*[a-zA-Z]+\b"]
+    lines = text.split("\n")
+    kept = []
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        special = sum(1 for c in line if c in "•●○■□▪▫▲▼◄►◆◇◈◉◊※‹›«»\"\"''±——&()[]{}")
+        total = len(line.replace(" ", ""))
+        if total > 0 and special / total > 0.15:
+            continue
+        if len(line) < 10:
+            geez = sum(1 for c in line if "\u1200" <= c <= "\u137F")
+            if geez < 3:
+                continue
+        for p in nav:
+            line = re.sub(p, "", line)
+        if line.strip():
+            # Deduplicate characters
+            line = _reference_deduplicate_geez_chars(line)
+
+            # Filter by word count (strictly at least 4 words)
+            # Use Ge'ez aware splitting
+            words = [w for w in line.split() if any("\u1200" <= c <= "\u137F" for c in w)]
+            if len(words) >= 4:
+                kept.append(line)
+
+    text = "\n".join(kept)
+    allowed = r"[\u1200-\u137F\u0000-\u007F\u2000-\u206F]"
+    text = re.sub(f"[^{allowed}]", "", text)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\n\s*\n", "\n", text)
+    return text.strip()
+
+
+def _cleaners() -> dict:
+    import warnings
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        from app.services.pdf_service import clean_text
+        from pdf_processor import clean_text as cli_clean_text
+    return {"pdf_service.clean_text": clean_text, "pdf_processor.clean_text": cli_clean_text}
+
+
+def _page_cleaners() -> dict:
+    import warnings
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        from app.services.pdf_service import clean_pages
+        from pdf_processor import clean_pages as cli_clean_pages
+    return {"pdf_service.clean_text": clean_pages, "pdf_processor.clean_text": cli_clean_pages}
+
+
+def _paged(clean_pages, lines_per_page: int):
+    """Clean text as the page-by-page cleaner `clean_pages` gives it for text cut every `lines_per_page` lines."""
+    def clean(text: str) -> str:
+        lines = text.split("\n")
+        pages = ["\n".join(lines[i:i + lines_per_page]) for i in range(0, len(lines), lines_per_page)]
+        return " ".join(t for t in clean_pages(pages) if t)
+    return clean
+
+
+def check_golden() -> bool:
+    with open(INPUT_PATH, encoding="utf-8", newline="") as f:
+        text = f.read()
+    checks = [(name, name, clean) for name, clean in _cleaners().items()]
+    for name, clean_pages in _page_cleaners().items():
+        for size in (1, 7):
+            label = f"{name.replace('clean_text', 'clean_pages')}/{size}"
+            checks.append((label, name, _paged(clean_pages, size)))
+    ok = True
+    whole = "".join(page + "\n" for page in BREAK_PAGES if page)
+    for name, clean_pages in _page_cleaners().items():
+        label = f"{name.replace('clean_text', 'clean_pages')}/breaks"
+        got, expected = " ".join(t for t in clean_pages(BREAK_PAGES) if t), _cleaners()[name](whole)
+        print(f"golden  {label:<31} {'OK' if got == expected else 'MISMATCH'} ({len(got)} chars)")
+        ok = ok and got == expected
+    for label, name, clean in checks:
+        with open(GOLDEN_PATHS[name], encoding="utf-8", newline="") as f:
+            expected = f.read()
+        got = clean(text)
+        if got == expected:
+            print(f"golden  {label:<31} OK ({len(got)} chars)")
+            continue
+        ok = False
+        at = next((i for i, (a, b) in enumerate(zip(got, expected)) if a != b), min(len(got), len(expected)))
+        print(f"golden  {label:<31} MISMATCH at char {at}: got {got[at:at + 40]!r}, expected {expected[at:at + 40]!r}")
+    return ok
+
+
+def best_time(fn, text: str, repeat: int) -> tuple[float, str]:
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        out = fn(text)
+        best = min(best, time.perf_counter() - started)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Golden check and micro-benchmark for clean_text")
+    parser.add_argument("--pages", type=int, default=40, help="Pages in the generated benchmark issue")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per implementation (best is reported)")
+    parser.add_argument("--check-only", action="store_true", help="Only run the golden check")
+    args = parser.parse_args()
+
+    if not check_golden():
+        sys.exit(1)
+    if args.check_only:
+        return
+
+    text = make_issue_text(pages=args.pages)
+    clean_text = _cleaners()["pdf_service.clean_text"]
+    import warnings
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        ref_secs, ref_out = best_time(reference_clean_text, text, args.repeat)
+    new_secs, new_out = best_time(clean_text, text, args.repeat)
+    mb = len(text.encode("utf-8")) / 1e6
+    print(f"\nissue   {args.pages} pages, {len(text)} chars ({mb:.2f} MB UTF-8)")
+    print(f"original  {ref_secs * 1000:8.1f} ms   {mb / ref_secs:6.1f} MB/s")
+    print(f"compiled  {new_secs * 1000:8.1f} ms   {mb / new_secs:6.1f} MB/s   {ref_secs / new_secs:.1f}x")
+    print(f"identical output: {new_out == ref_out}")
+    if new_out != ref_out:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark the PDF text-extraction backends (backend/app/services/text_extractors.py).
+
+Extracts every page of a set of PDFs with each backend and reports pages/sec, Ge'ez characters
+found, words left after clean_text, and a Ge'ez-character agreement score against pdfplumber:
+per page, the overlap of the two bags of Ge'ez characters (2 * common / (a + b)), summed over
+all pages. 1.0 means the same Ge'ez characters in the same amounts; reading order is not scored.
+
+Defaults to benchmarks/fixtures/geez_issue.pdf: four two-column pages of the cleaner fixture's
+text (issue_text.txt) in a non-embedded Ge'ez font with a ToUnicode map, so every backend reads
+the same characters. Pass files or directories, e.g. the content-addressed store (pdfs/store), to
+measure real issues. Set TEXT_EXTRACTOR to the backend you pick.
+
+    python benchmarks/bench_extractors.py
+    python benchmarks/bench_extractors.py pdfs/store --max-pages 8
+    python benchmarks/bench_extractors.py path/to/issues/ --backends pdfplumber pypdfium2
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+from app.services.pdf_service import clean_text  # noqa: E402
+from app.services.text_extractors import TEXT_EXTRACTORS, page_texts  # noqa: E402
+
+REFERENCE = "pdfplumber"
+FIXTURE_PDF = os.path.join(ROOT, "benchmarks", "fixtures", "geez_issue.pdf")
+
+
+def find_pdfs(paths: list[str]) -> list[str]:
+    pdfs = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                # Skip half-finished downloads in the store's staging area
+                dirnames[:] = sorted(d for d in dirnames if d != "incoming")
+                pdfs.extend(os.path.join(dirpath, f) for f in sorted(filenames) if f.lower().endswith(".pdf"))
+        elif path.lower().endswith(".pdf"):
+            pdfs.append(path)
+    return pdfs
+
+
+def geez_counts(text: str) -> Counter:
+    return Counter(c for c in text or "" if "ሀ" <= c <= "፿")
+
+
+def run_backend(backend: str, pdfs: list[str], max_pages: int) -> tuple[float, list[str]]:
+    """Seconds taken and the text of every page (pages of all PDFs, in order)."""
+    texts = []
+    started = time.perf_counter()
+    for pdf_path in pdfs:
+        try:
+            for page_num, text in enumerate(page_texts(pdf_path, backend)):
+                if max_pages and page_num >= max_pages:
+                    break
+                texts.append(text or "")
+        except Exception as e:
+            print(f"  {backend}: {os.path.basename(pdf_path)} failed: {e}")
+    return time.perf_counter() - started, texts
+
+
+def agreement(pages: list[str], reference: list[str]) -> float:
+    """Ge'ez bag-of-characters overlap with the reference pages (1.0 = identical)."""
+    common = total = 0
+    for text, ref in zip(pages, reference):
+        a, b = geez_counts(text), geez_counts(ref)
+        common += sum((a & b).values())
+        total += sum(a.values()) + sum(b.values())
+    if len(pages) != len(reference):
+        # A backend that lost or added pages disagrees on all of them
+        for text in pages[len(reference):] + reference[len(pages):]:
+            total += sum(geez_counts(text).values())
+    return 2 * common / total if total else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare PDF text-extraction backends on speed and Ge'ez agreement")
+    parser.add_argument("paths", nargs="*", default=[FIXTURE_PDF], help="PDF files or directories (default: the Ge'ez fixture PDF)")
+    parser.add_argument("--backends", nargs="+", choices=list(TEXT_EXTRACTORS), default=list(TEXT_EXTRACTORS))
+    parser.add_argument("--max-pages", type=int, default=0, help="Pages per PDF (0 = all)")
+    parser.add_argument("--max-pdfs", type=int, default=20, help="PDFs to use from the paths (0 = all)")
+    args = parser.parse_args()
+
+    pdfs = find_pdfs(args.paths)
+    if args.max_pdfs:
+        pdfs = pdfs[:args.max_pdfs]
+    if not pdfs:
+        print(f"No PDFs found in {', '.join(args.paths)}")
+        sys.exit(1)
+
+    backends = [REFERENCE] + [b for b in args.backends if b != REFERENCE]
+    print(f"{len(pdfs)} PDFs, reference backend: {REFERENCE}\n")
+    print(f"{'backend':<12}{'pages':>7}{'pages/sec':>11}{'speedup':>9}{'geez chars':>12}{'words':>9}{'agreement':>11}")
+
+    reference = None
+    reference_rate = None
+    for backend in backends:
+        secs, texts = run_backend(backend, pdfs, args.max_pages)
+        rate = len(texts) / secs if secs else 0.0
+        if reference is None:
+            reference, reference_rate = texts, rate
+        geez = sum(sum(geez_counts(t).values()) for t in texts)
+        words = sum(len(clean_text(t).split()) for t in texts)
+        speedup = rate / reference_rate if reference_rate else 0.0
+        print(
+            f"{backend:<12}{len(texts):>7}{rate:>11.1f}{speedup:>8.1f}x{geez:>12}{words:>9}"
+            f"{agreement(texts, reference):>11.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTTP and Playwright scraper fetchers against saved HTML fixtures.
+
+Serves benchmarks/fixtures/{listing,article}.html from a local HTTP server and fetches
+them repeatedly through each fetcher. Reports pages/sec and per-page latency, and checks
+all fetchers parse the same items. "playwright" is the lean browser mode (blocked
+subresources, selector waits); "playwright-full" is the old networkidle + 2 s load.
+
+    python benchmarks/bench_fetchers.py --pages 50 --concurrency 4
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+from app.config import NEWSPAPERS_BY_ID  # noqa: E402
+from app.services.fetchers import open_fetcher  # noqa: E402
+
+FIXTURES_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+LISTING_PATH = "/category/newspapers/haddas-ertra-news"
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Serve listing.html for listing URLs and article.html for everything else."""
+
+    def translate_path(self, path):
+        name = "listing.html" if path.startswith(LISTING_PATH) else "article.html"
+        return os.path.join(FIXTURES_DIR, name)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(FixtureHandler, directory=FIXTURES_DIR))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run_fetcher(mode: str, base_url: str, pages: int, concurrency: int) -> dict:
+    sem = asyncio.Semaphore(concurrency)
+    lean = mode != "playwright-full"
+    site = {**NEWSPAPERS_BY_ID["haddas-ertra"], "base_url": f"{base_url}{LISTING_PATH}", "site_url": base_url}
+    async with open_fetcher(mode.replace("-full", ""), concurrency, lean_browser=lean) as fetcher:
+
+        async def listing(n):
+            async with sem:
+                return await fetcher.fetch_listing(f"{base_url}{LISTING_PATH}/page/{n}/", site)
+
+        async def article(n):
+            async with sem:
+                return await fetcher.fetch_article(f"{base_url}/2025/03/{n}/haddas-ertra/", site)
+
+        # Warm up (browser start, connection setup) outside the timed section
+        first_listing = await listing(1)
+        first_article = await article(1)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(listing(n) for n in range(pages)))
+        listing_secs = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await asyncio.gather(*(article(n) for n in range(pages)))
+        article_secs = time.perf_counter() - started
+        latency = fetcher.latency.summary()
+
+    return {
+        "listing_pages_per_sec": pages / listing_secs,
+        "article_pages_per_sec": pages / article_secs,
+        "listing": first_listing,
+        "article": first_article,
+        "latency": latency,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP vs Playwright fetchers on saved fixtures")
+    parser.add_argument("--pages", type=int, default=50, help="Listing and article pages fetched per fetcher")
+    parser.add_argument("--concurrency", type=int, default=4, help="Pages in flight at once")
+    args = parser.parse_args()
+
+    server = start_fixture_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    results = {}
+    try:
+        for mode in ("http", "playwright", "playwright-full"):
+            try:
+                results[mode] = asyncio.run(run_fetcher(mode, base_url, args.pages, args.concurrency))
+            except Exception as e:
+                print(f"{mode:>10}: skipped ({e.__class__.__name__}: {str(e).splitlines()[0]})")
+                continue
+            r = results[mode]
+            print(
+                f"{mode:>10}: listing {r['listing_pages_per_sec']:8.1f} pages/sec   "
+                f"article {r['article_pages_per_sec']:8.1f} pages/sec   "
+                f"({len(r['listing'] or [])} items, pdf={'yes' if (r['article'] or {}).get('pdf_url') else 'no'})"
+            )
+            for key, stats in r["latency"].items():
+                print(f"{'':>12}{key:<20} p50 {stats['p50_ms']:8.1f} ms   p95 {stats['p95_ms']:8.1f} ms")
+    finally:
+        server.shutdown()
+
+    if "http" in results and len(results) > 1:
+        reference = results["http"]
+        same = all(r["listing"] == reference["listing"] and r["article"] == reference["article"] for r in results.values())
+        speedups = "   ".join(
+            f"http vs {mode}: {reference['listing_pages_per_sec'] / r['listing_pages_per_sec']:.1f}x"
+            for mode, r in results.items() if mode != "http"
+        )
+        print(f"parsed output identical: {same}   listing speedup {speedups}")
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark a full scrape (listing walk, article pages, PDF downloads) against the local replay server.
+
+Starts benchmarks/replay_server.py in-process, registers it as a "replay" newspaper and runs
+scrape_newspapers over plain HTTP into a temporary data directory. Reports pages/sec, PDFs/sec,
+peak RSS, the requests the server answered (including injected faults) and the rate limiter's
+final per-host rate.
+
+    python benchmarks/bench_scraper.py --articles 100 --latency-ms 30 --rate-429 0.02
+"""
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from replay_server import LISTING_PATH, add_server_args, server_options, start_replay_server  # noqa: E402
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper against the offline replay server")
+    parser.add_argument("--articles", type=int, default=100, help="max_articles for the scrape")
+    parser.add_argument("--max-pages", type=int, default=100, help="max_pages for the scrape")
+    parser.add_argument("--concurrency", type=int, default=4, help="Listing pages fetched in parallel")
+    parser.add_argument("--download-concurrency", type=int, default=4, help="PDF downloads in parallel")
+    parser.add_argument("--rate", type=float, default=50.0, help="Starting requests/sec per host")
+    parser.add_argument("--start-date", default=None, help="Only issues on or after this date")
+    parser.add_argument("--end-date", default=None, help="Only issues on or before this date")
+    add_server_args(parser)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="tigrinya-bench-") as data_dir:
+        # app.config reads the data directory at import time
+        os.environ["TIGRINYA_DATA_DIR"] = data_dir
+        from app.config import NEWSPAPERS_BY_ID
+        from app.services.scraper_service import scrape_newspapers
+
+        server = start_replay_server(**server_options(args))
+        NEWSPAPERS_BY_ID["replay"] = {
+            **NEWSPAPERS_BY_ID["haddas-ertra"],
+            "id": "replay",
+            "name": "Replay",
+            "source": "replay",
+            "base_url": f"{server.base_url}{LISTING_PATH}",
+            "site_url": server.base_url,
+        }
+        try:
+            started = time.perf_counter()
+            result = asyncio.run(scrape_newspapers(
+                ["replay"],
+                max_articles=args.articles,
+                max_pages=args.max_pages,
+                start_date=args.start_date,
+                end_date=args.end_date,
+                listing_concurrency=args.concurrency,
+                fetcher_mode="http",
+                download_concurrency=args.download_concurrency,
+                incremental=False,
+                requests_per_second=args.rate,
+            ))
+            elapsed = time.perf_counter() - started
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    if not result["ok"]:
+        print(f"Scrape failed: {result['error']}")
+        sys.exit(1)
+
+    counts = server.counts
+    pages = counts.get("listing", 0) + counts.get("article", 0)
+    job = result["newspapers"]["replay"]
+    print(f"elapsed      {elapsed:8.2f} s")
+    print(f"pages        {pages:8d}   {pages / elapsed:8.1f} pages/sec  ({counts.get('listing', 0)} listing, {counts.get('article', 0)} article)")
+    print(f"pdfs         {result['successful']:8d}   {result['successful'] / elapsed:8.1f} PDFs/sec")
+    print(f"peak RSS     {peak_rss_mb():8.1f} MB")
+    print(f"server       {counts}")
+    for host, stats in job.get("rate_limits", {}).items():
+        print(f"rate limit   {host}: {stats['rate']} req/s, throttled {stats['throttled']}x")
+    for key, stats in job.get("page_latency", {}).items():
+        print(f"latency      {key:<16} p50 {stats['p50_ms']:8.1f} ms   p95 {stats['p95_ms']:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for shabait.com: listing pages, article pages and issue PDFs with the site's markup.
+
+Synthetic mode (default) serves `--issues` Haddas Ertra issues, newest first, `--per-page` per
+listing page, each with its own small PDF (page 1 carries the issue date, so date checks pass).
+`--recorded` serves the saved pages in benchmarks/fixtures instead, with shabait.com and
+erinewspapers.com links pointed back at this server.
+
+Faults are injected per request after `--latency-ms`: `--rate-429` answers 429 with Retry-After,
+`--error-rate` answers 503. PDFs honour Range requests, so resumed downloads work.
+
+    python benchmarks/replay_server.py --port 8765 --issues 200 --latency-ms 50 --rate-429 0.02
+"""
+import argparse
+import os
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+LISTING_PATH = "/category/newspapers/haddas-ertra-news"
+RECORDED_HOSTS = ("https://shabait.com", "https://erinewspapers.com")
+
+_LISTING_PAGE_RE = re.compile(rf"^{re.escape(LISTING_PATH)}(?:/page/(\d+))?/?$")
+_ARTICLE_RE = re.compile(r"^/\d{4}/\d{2}/\d{2}/haddas-ertra-(\d+)/$")
+_PDF_RE = re.compile(r"^/wp-content/uploads/\d{4}/\d{2}/Hadas-Eritrea-(\d+)\.pdf$")
+
+PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en-US">
+<head>
+<meta charset="UTF-8">
+<title>{title} &#8211; Shabait</title>
+<link rel="stylesheet" href="/wp-content/themes/publisher/style-7.11.0.min.css?ver=7.11.0" media="all">
+<script async src="https://www.googletagmanager.com/gtag/js?id=G-XXXXXXX"></script>
+</head>
+"""
+
+LISTING_ITEM = """<article class="post-{post_id} type-post format-standard has-post-thumbnail listing-item listing-item-grid">
+  <div class="item-inner">
+    <h2 class="title"><a href="{href}" class="post-url post-title">{title}</a></h2>
+    <div class="post-meta"><span class="time"><time class="post-published updated entry-date" datetime="{iso}T08:00:00+03:00">{date_text}</time></span></div>
+  </div>
+</article>
+"""
+
+ARTICLE_BODY = """<body class="post-template-default single single-post">
+<main class="content-wrap">
+<article class="post-{post_id} type-post single-post-content">
+  <div class="post-header">
+    <h1 class="single-post-title entry-title"><span class="post-title">{title}</span></h1>
+    <div class="post-meta"><time class="post-published updated entry-date" datetime="{iso}T08:00:00+03:00">{date_text}</time></div>
+  </div>
+  <div class="entry-content clearfix single-post-content">
+    <p style="text-align: center;"><a href="{pdf_href}"><img class="alignnone size-full wp-image-77661" src="/wp-content/uploads/2022/05/download-pdf.png" alt="" width="120" height="40"></a></p>
+    <p><a href="/wp-content/uploads/2019/01/media-guidelines.pdf">Media guidelines</a></p>
+  </div>
+</article>
+</main>
+</body>
+</html>
+"""
+
+
+def synthetic_pdf(text: str, size: int) -> bytes:
+    """A one-page PDF showing `text`, padded with an unreferenced stream to about `size` bytes."""
+    content = f"BT /F1 18 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    padding = max(0, size - 600)
+    if padding:
+        # Deterministic filler so every issue has distinct bytes and a realistic size
+        filler = random.Random(text).randbytes(padding)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(filler), filler))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer holding the replay settings, the synthetic issue list and request counters."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address=("127.0.0.1", 0),
+        issues: int = 200,
+        per_page: int = 12,
+        latest: date = date(2025, 3, 29),
+        pdf_kb: int = 256,
+        latency_ms: float = 0.0,
+        error_rate: float = 0.0,
+        rate_429: float = 0.0,
+        retry_after: str = "1",
+        recorded: bool = False,
+        seed: int = 0,
+    ):
+        super().__init__(address, ReplayHandler)
+        self.issues = issues
+        self.per_page = max(1, per_page)
+        self.latest = latest
+        self.pdf_size = pdf_kb * 1024
+        self.latency = latency_ms / 1000
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.recorded = recorded
+        self.base_url = f"http://{self.server_address[0]}:{self.server_address[1]}"
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts: dict[str, int] = {}
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def roll_fault(self) -> int:
+        """Status to inject for the next request: 429, 503 or 0 for none."""
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.rate_429:
+            return 429
+        if roll < self.rate_429 + self.error_rate:
+            return 503
+        return 0
+
+    def issue_date(self, n: int) -> date:
+        """Issues come out every other day, newest (n = 0) first."""
+        return self.latest - timedelta(days=2 * n)
+
+    def article_path(self, n: int) -> str:
+        return f"{self.issue_date(n):/%Y/%m/%d}/haddas-ertra-{n}/"
+
+    def pdf_path(self, n: int) -> str:
+        return f"{self.issue_date(n):/wp-content/uploads/%Y/%m}/Hadas-Eritrea-{n}.pdf"
+
+    def listing_html(self, page: int) -> str:
+        items = []
+        for n in range((page - 1) * self.per_page, min(page * self.per_page, self.issues)):
+            d = self.issue_date(n)
+            items.append(LISTING_ITEM.format(
+                post_id=100000 - n,
+                href=self.article_path(n),
+                title=f"Haddas Ertra {d:%d %B %Y}",
+                iso=d.isoformat(),
+                date_text=f"{d:%B} {d.day}, {d.year}",
+            ))
+        return (
+            PAGE_HEAD.format(title="Haddas Ertra")
+            + '<body class="archive category"><main class="content-wrap"><div class="listing listing-grid">\n'
+            + "".join(items)
+            + "</div></main></body></html>\n"
+        )
+
+    def article_html(self, n: int) -> str:
+        d = self.issue_date(n)
+        title = f"Haddas Ertra {d:%d %B %Y}"
+        return PAGE_HEAD.format(title=title) + ARTICLE_BODY.format(
+            post_id=100000 - n,
+            title=title,
+            iso=d.isoformat(),
+            date_text=f"{d:%B} {d.day}, {d.year}",
+            pdf_href=self.pdf_path(n),
+        )
+
+    def recorded_html(self, name: str) -> str:
+        html = _read_fixture(name)
+        for host in RECORDED_HOSTS:
+            html = html.replace(host, self.base_url)
+        return html
+
+    @lru_cache(maxsize=256)
+    def pdf_bytes(self, n: int) -> bytes:
+        d = self.issue_date(n)
+        return synthetic_pdf(f"Haddas Ertra {d.day:02d} {d.month:02d} {d.year}", self.pdf_size)
+
+
+@lru_cache(maxsize=None)
+def _read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    server: ReplayServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, keep-alive responses stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+
+        fault = server.roll_fault()
+        if fault:
+            server.count(str(fault))
+            headers = {"Retry-After": server.retry_after} if fault == 429 else {}
+            return self._send(fault, b"", "text/plain", headers)
+
+        path = self.path.split("?", 1)[0]
+        if server.recorded:
+            return self._recorded(path)
+
+        match = _LISTING_PAGE_RE.match(path)
+        if match:
+            page = int(match.group(1) or 1)
+            if (page - 1) * server.per_page >= server.issues:
+                return self._not_found()
+            server.count("listing")
+            return self._send(200, server.listing_html(page).encode("utf-8"), "text/html; charset=UTF-8")
+
+        match = _ARTICLE_RE.match(path)
+        if match and int(match.group(1)) < server.issues and path == server.article_path(int(match.group(1))):
+            server.count("article")
+            return self._send(200, server.article_html(int(match.group(1))).encode("utf-8"), "text/html; charset=UTF-8")
+
+        match = _PDF_RE.match(path)
+        if match and int(match.group(1)) < server.issues:
+            server.count("pdf")
+            return self._send_pdf(server.pdf_bytes(int(match.group(1))))
+
+        return self._not_found()
+
+    def _recorded(self, path: str):
+        if path.endswith(".pdf"):
+            self.server.count("pdf")
+            return self._send_pdf(self.server.pdf_bytes(0))
+        kind = "listing" if path.startswith(LISTING_PATH) else "article"
+        self.server.count(kind)
+        html = self.server.recorded_html(f"{kind}.html")
+        return self._send(200, html.encode("utf-8"), "text/html; charset=UTF-8")
+
+    def _send_pdf(self, body: bytes):
+        total = len(body)
+        match = re.match(r"bytes=(\d+)-$", self.headers.get("Range", ""))
+        if not match:
+            return self._send(200, body, "application/pdf", {"Accept-Ranges": "bytes"})
+        start = int(match.group(1))
+        if start >= total:
+            return self._send(416, b"", "application/pdf", {"Content-Range": f"bytes */{total}"})
+        return self._send(206, body[start:], "application/pdf", {"Content-Range": f"bytes {start}-{total - 1}/{total}"})
+
+    def _not_found(self):
+        self.server.count("404")
+        return self._send(404, b"Not Found", "text/plain")
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_replay_server(**options) -> ReplayServer:
+    """Start a ReplayServer on a free local port in a background thread (options as in ReplayServer)."""
+    server = ReplayServer(**options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_server_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--issues", type=int, default=200, help="Synthetic issues on the listing")
+    parser.add_argument("--per-page", type=int, default=12, help="Issues per listing page")
+    parser.add_argument("--pdf-kb", type=int, default=256, help="Approximate size of each issue PDF")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay before every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--retry-after", default="1", help="Retry-After header sent with injected 429s")
+    parser.add_argument("--recorded", action="store_true", help="Serve the saved fixture pages instead of synthetic ones")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for fault injection")
+
+
+def server_options(args: argparse.Namespace) -> dict:
+    return {
+        "issues": args.issues,
+        "per_page": args.per_page,
+        "pdf_kb": args.pdf_kb,
+        "latency_ms": args.latency_ms,
+        "error_rate": args.error_rate,
+        "rate_429": args.rate_429,
+        "retry_after": args.retry_after,
+        "recorded": args.recorded,
+        "seed": args.seed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve synthetic or recorded shabait.com pages and PDFs locally")
+    parser.add_argument("--port", type=int, default=8765)
+    add_server_args(parser)
+    args = parser.parse_args()
+
+    server = ReplayServer(("127.0.0.1", args.port), **server_options(args))
+    print(f"Replaying on {server.base_url}{LISTING_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Requests served: {server.counts}")
+
+
+if __name__ == "__main__":
+    main()
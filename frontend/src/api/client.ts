@@ -51,6 +51,12 @@ export const api = {
     return res.json();
   },
 
+  async getArticleImages(index: number): Promise<{ images: NonNullable<ArticleText['images']>; pending: boolean }> {
+    const res = await fetch(`${API_BASE}/articles/${index}/images`);
+    if (!res.ok) throw new Error('Article not found');
+    return res.json();
+  },
+
   async wordFrequency(text: string, topN = 50): Promise<{ word: string; count: number }[]> {
     const res = await fetch(`${API_BASE}/nlp/word-frequency`, {
       method: 'POST',
@@ -23,6 +23,7 @@ export default function ArticleDetail({ index, onBack }: Props) {
     try {
       const data = await api.getArticleText(index);
       setArticle(data);
+      loadImages();
     } catch (err) {
       console.error(err);
     } finally {
@@ -30,6 +31,16 @@ export default function ArticleDetail({ index, onBack }: Props) {
     }
   };
 
+  // Images may be saved and described on this first request, so they load after the text
+  const loadImages = async () => {
+    try {
+      const { images } = await api.getArticleImages(index);
+      setArticle((prev) => (prev && prev.index === index ? { ...prev, images } : prev));
+    } catch (err) {
+      console.error(err);
+    }
+  };
+
   const copyText = async () => {
     if (!article?.extracted_text) return;
     try {
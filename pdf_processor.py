@@ -1,132 +1,136 @@
 import os
 import sys
+import asyncio
 import json
-import re
-import pdfplumber
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Add backend to path to reuse ai_processor
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
-from app.services import ai_processor
+from app.config import IMAGE_PROCESSING, PDFS_DIR, PDF_WORKERS, TEXT_EXTRACTOR
+from app.services.ai_processor import get_cache
+from app.services.gemini_async import AsyncGemini
+from app.services.json_store import write_json_atomic
+from app.services.image_index import ImageIndex
+from app.services.pdf_service import (
+    analyse_pdfs,
+    iter_raw_pages,
+    join_pages,
+    load_raw_data,
+    merge_raw_data,
+    previous_results,
+    processing_settings,
+    processing_status,
+    reclean_raw_data,
+)
+from app.services.pdf_store import file_sha256, page_text_writer
+from app.services.text_cleaner import GeezTextCleaner
+
+# Same rules as the backend's clean_text, without Ge'ez de-duplication or the 4-word line minimum
+_CLEANER = GeezTextCleaner(
+    nav_patterns=[r'•', r'\uf0a7', r'&', r'±±', r'——', r'\(\([^)\n]*\)\)', r'\b\d+[^\S\n]*[a-zA-Z]+\b'],
+    special_chars='•●○■□▪▫▲▼◄►◆◇◈◉◊※‹›«»"±—&()[]{}',
+    dedupe=False,
+    min_geez_words=0,
+)
+
+
+# Recorded on raw_data entries, so the backend does not reuse text cleaned with these rules (and vice versa)
+CLEANER = "pdf_processor"
+
 
 def clean_text(text):
     """Clean extracted text by keeping only Ge'ez script characters, numbers, and punctuation."""
-    if not text:
-        return ""
-
-    # Remove common newspaper noise patterns
-    noise_patterns = [
-        r'PAGE\s+\d+', r'page\s+\d+', r'waga\s+[\d.]+', r'ዋጋ\s+[\d.]+',
-        r'ISSUE\s+\d+', r'VOL\s+\d+', r'VOLUME\s+\d+',
-        r'\d{1,2}/\d{1,2}/\d{4}', r'\d{4}-\d{2}-\d{2}',
-        r'©\s*\d{4}', r'All rights reserved', r'http[s]?://\S+', r'www\.\S+'
-    ]
-
-    for pattern in noise_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-
-    # Remove English words
-    text = re.sub(r'\b[a-zA-Z]+\b', '', text)
-
-    # Remove navigation elements
-    navigation_patterns = [
-        r'•', r'', r'&', r'±±', r'——', r'\(\([^)]*\)\)', r'\b\d+\s*[a-zA-Z]+\b'
-    ]
-
-    lines = text.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Skip lines with too many special characters
-        special_count = sum(1 for c in line if c in '•●○■□▪▫▲▼◄►◆◇◈◉◊※‹›«»""''±——&()[]{}')
-        total_chars = len(line.replace(' ', ''))
-        if total_chars > 0 and special_count / total_chars > 0.15:
-            continue
+    return _CLEANER.clean(text)
 
-        # Skip very short lines
-        if len(line) < 10:
-            geez_chars = sum(1 for c in line if '\u1200' <= c <= '\u137F')
-            if geez_chars < 3:
-                continue
 
-        # Remove navigation patterns
-        for pattern in navigation_patterns:
-            line = re.sub(pattern, '', line)
+def clean_pages(pages):
+    """clean_text over a PDF's pages, one cleaned text per page (a page's last line may go with the next page)."""
+    return _CLEANER.clean_pages(pages)
 
-        if line.strip():
-            cleaned_lines.append(line)
 
-    text = '\n'.join(cleaned_lines)
+def extract_raster_images(page, page_num, images_dir):
+    """IMAGE_EXTRACTION=raster: re-render each image's crop of the pdfplumber page at 200 DPI."""
+    images_info = []
+    try:
+        for i, image in enumerate(page.images):
+            try:
+                # Get image object
+                x0, top, x1, bottom = image['x0'], image['top'], image['x1'], image['bottom']
+                cropped_page = page.crop((x0, top, x1, bottom))
+                img_obj = cropped_page.to_image(resolution=200)
+                
+                # Save image
+                image_filename = f"page_{page_num+1}_img_{i+1}.png"
+                image_path = os.path.join(images_dir, image_filename)
+                img_obj.save(image_path)
+                
+                images_info.append({
+                    'path': image_path,
+                    'page': page_num + 1,
+                    'filename': image_filename
+                })
+            except Exception as img_err:
+                print(f"Error extracting image {i} on page {page_num}: {img_err}")
+    except Exception as e:
+        print(f"Error processing images on page {page_num}: {e}")
+    return images_info
 
-    # Keep only Ge'ez script, numbers, and punctuation
-    allowed_chars = r'[\u1200-\u137F\u0000-\u007F\u2000-\u206F]'
-    text = re.sub(f'[^{allowed_chars}]', '', text)
 
-    # Clean whitespace
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'\n\s*\n', '\n', text)
-    return text.strip()
+def extract_content_from_pdf(pdf_path, pdf_name):
+    """Extract text (TEXT_EXTRACTOR backend) and images (IMAGE_EXTRACTION mode) from PDF, one page at a time.
 
+    The uncleaned page texts are kept in the PDF store, so `--reclean` can redo the cleaning later.
+    Returns (cleaned_text, word_count, images_info), or None if the PDF could not be read.
+    """
+    texts, images_info = [], []
 
-def extract_content_from_pdf(pdf_path, pdf_name):
-    """Extract text and images from PDF using pdfplumber."""
-    text_content = ""
-    images_info = []
-    
     # Create images directory for this PDF
-    images_dir = os.path.join(os.path.dirname(pdf_path), 'images', pdf_name.replace('.pdf', ''))
+    images_dir = os.path.join(PDFS_DIR, 'images', pdf_name.replace('.pdf', ''))
     os.makedirs(images_dir, exist_ok=True)
-    
+
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                # Extract text
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content += page_text + "\n"
-                except:
-                    pass
-                
-                # Extract images
-                try:
-                    for i, image in enumerate(page.images):
-                        try:
-                            # Get image object
-                            x0, top, x1, bottom = image['x0'], image['top'], image['x1'], image['bottom']
-                            cropped_page = page.crop((x0, top, x1, bottom))
-                            img_obj = cropped_page.to_image(resolution=200)
-                            
-                            # Save image
-                            image_filename = f"page_{page_num+1}_img_{i+1}.png"
-                            image_path = os.path.join(images_dir, image_filename)
-                            img_obj.save(image_path)
-                            
-                            images_info.append({
-                                'path': image_path,
-                                'page': page_num + 1,
-                                'filename': image_filename
-                            })
-                        except Exception as img_err:
-                            print(f"Error extracting image {i} on page {page_num}: {img_err}")
-                except Exception as e:
-                    print(f"Error processing images on page {page_num}: {e}")
-
-            cleaned_text = clean_text(text_content)
-            words = [word for word in cleaned_text.split() if word.strip()]
-            
-            return cleaned_text, len(words), images_info
-            
+        pages = iter_raw_pages(pdf_path, pdf_name, images_dir, raster_images=extract_raster_images)
+        with page_text_writer(pdf_name, TEXT_EXTRACTOR) as record:
+            for page_text, page_images in pages:
+                record(page_text)
+                texts.append(page_text)
+                images_info.extend(page_images)
+        extracted_text, word_count = join_pages(clean_pages(texts))
+        return extracted_text, word_count, images_info
+
     except Exception as e:
         print(f"Error processing PDF {pdf_path}: {e}")
-        return "", 0, []
+        return None
 
 
-def process_pdfs():
-    """Process all PDFs and create structured JSON output."""
+def extract_many(jobs, workers=1):
+    """Yield (sha256, extraction result or None) for each (pdf_path, sha256) job, in completion order with a process pool."""
+    if workers <= 1 or len(jobs) <= 1:
+        for pdf_path, sha256 in jobs:
+            yield sha256, extract_content_from_pdf(pdf_path, sha256)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = {pool.submit(extract_content_from_pdf, pdf_path, sha256): sha256 for pdf_path, sha256 in jobs}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Extraction worker failed for {futures[future][:12]}: {e}")
+                result = None
+            yield futures[future], result
+
+
+def process_pdfs(workers=PDF_WORKERS, force=False):
+    """Process all PDFs and create structured JSON output.
+
+    Text and images are extracted by `workers` processes; NER and image descriptions start here
+    as each PDF finishes, up to GEMINI_CONCURRENCY Gemini requests at once across all PDFs, and
+    raw_data.json keeps the order of pdf_metadata.json.
+    PDFs already processed (same content hash and processing settings) are skipped and their
+    previous results carried forward, unless `force` is set.
+    """
     with open('pdf_metadata.json', 'r', encoding='utf-8') as f:
         metadata = json.load(f)
 
@@ -136,40 +140,61 @@ def process_pdfs():
         print("No completed PDF downloads found")
         return
 
-    processed_data = []
-
-    print(f"Processing {len(completed_metadata)} PDFs...")
+    existing = load_raw_data('raw_data.json')
+    previous = {} if force else previous_results(existing, CLEANER)
 
-    for i, item in enumerate(completed_metadata):
+    # (metadata entry, content hash) to write, and one extraction job per distinct PDF not
+    # processed before: identical issues are extracted and NER'd once
+    articles = []
+    jobs = {}
+    for item in completed_metadata:
         pdf_path = item.get('pdf_filepath')
         if not pdf_path or not os.path.exists(pdf_path):
             continue
-            
-        print(f"Processing {i+1}/{len(completed_metadata)}: {item.get('pdf_filename')}")
+        sha256 = item.get('pdf_sha256') or file_sha256(pdf_path)
+        articles.append((item, sha256))
+        if sha256 not in previous:
+            jobs.setdefault(sha256, pdf_path)
+
+    by_hash = {sha256: previous[sha256] for _, sha256 in articles if sha256 in previous}
+    print(f"Processing {len(articles)} PDFs: {len(jobs)} to extract, {len(by_hash)} unchanged since the last run")
+    if jobs:
+        print(f"Extracting with {min(workers, len(jobs))} worker(s)...")
+
+    job_list = [(pdf_path, sha256) for sha256, pdf_path in jobs.items()]
+    def extracted():
+        for done, (sha256, result) in enumerate(extract_many(job_list, workers), start=1):
+            print(f"Extracted {done}/{len(jobs)}: {os.path.basename(jobs[sha256])}")
+            yield sha256, result
+
+    # NER and image descriptions start as each PDF is extracted, GEMINI_CONCURRENCY requests at once
+    # Reused entries with failed NER or image descriptions redo just those steps
+    partial = {sha256: result for sha256, result in by_hash.items() if result[4]}
+    if partial:
+        print(f"Retrying failed NER or image descriptions of {len(partial)} PDFs")
+    image_index = ImageIndex()
+    with AsyncGemini() as client:
+        analysed = asyncio.run(analyse_pdfs(extracted(), image_index, {}, client, partial))
+    by_hash.update(analysed)
+
+    images = [img for _, _, _, processed_images, _ in analysed.values() for img in processed_images]
+    if images and IMAGE_PROCESSING == "deferred":
+        print(f"Located {len(images)} images (saved and described later by the backend)")
+    elif images:
+        sources = [img['description_source'] for img in images]
+        print(
+            f"Described {len(images)} images: {sources.count('duplicate')} near-duplicates reused an "
+            f"earlier description, {sources.count('skipped')} too small to describe"
+        )
+    image_index.save()
 
+    processed_data = []
+    for item, sha256 in articles:
         # Extract news title from filename
         filename = item.get('pdf_filename', '')
         news_title = filename.split('_', 1)[1].replace('.pdf', '') if '_' in filename else filename.replace('.pdf', '')
 
-        # Extract text and images
-        extracted_text, word_count, images_info = extract_content_from_pdf(pdf_path, filename)
-        
-        # Perform AI tasks
-        print("  - Performing NER...")
-        entities = ai_processor.perform_ner(extracted_text)
-        
-        processed_images = []
-        api_key_error_logged = {}
-        if images_info:
-            print(f"  - Describing {len(images_info)} images...")
-            for img in images_info:
-                description = ai_processor.describe_image(img['path'], _api_key_error_logged=api_key_error_logged)
-                processed_images.append({
-                    'path': img['path'],
-                    'filename': img['filename'],
-                    'page': img['page'],
-                    'description_tigrinya': description
-                })
+        extracted_text, word_count, entities, processed_images, failures = by_hash[sha256]
 
         processed_entry = {
             'index': item.get('index'),
@@ -178,28 +203,64 @@ def process_pdfs():
             'publication_date': item.get('date'),
             'pdf_filename': item.get('pdf_filename'),
             'pdf_url': item.get('pdf_url'),
+            'pdf_sha256': sha256,
             'extracted_text': extracted_text,
             'word_count': word_count,
             'entities': entities,
             'images': processed_images,
-            'processing_status': 'completed'
+            'processing_status': processing_status(failures),
+            'processing_errors': failures,
+            **processing_settings(CLEANER)
         }
 
         processed_data.append(processed_entry)
 
-    # Save processed data
-    with open('raw_data.json', 'w', encoding='utf-8') as f:
-        json.dump(processed_data, f, ensure_ascii=False, indent=2)
+    # Save processed data, keeping entries for articles not processed in this run
+    write_json_atomic('raw_data.json', merge_raw_data(metadata, existing, processed_data))
 
     # Summary
     total_words = sum(item['word_count'] for item in processed_data)
     print(f"\nProcessing Complete!")
-    print(f"Processed {len(processed_data)} PDFs")
+    print(f"Processed {len(processed_data)} PDFs ({len(by_hash)} unique, {len(jobs)} extracted)")
     print(f"Total words extracted: {total_words}")
     print(f"Average words per PDF: {total_words/len(processed_data):.1f}")
     print("All text has been cleaned to contain only Ge'ez script characters.")
     print("Entities extracted and images described in Tigrinya.")
+    incomplete = [item for item in processed_data if item['processing_status'] != 'completed']
+    if incomplete:
+        print(f"{len(incomplete)} PDFs had failed steps (extraction, NER or images); they are redone next run")
+    cache = get_cache()
+    if cache:
+        print(f"Gemini cache: {cache.hits} hits, {cache.misses} misses ({cache.path})")
+
+
+def reclean(workers=PDF_WORKERS):
+    """Re-run clean_text over raw_data.json from the page texts stored at extraction time (no PDF is re-read)."""
+    raw_data = load_raw_data('raw_data.json')
+    if not raw_data:
+        print("No processed articles in raw_data.json")
+        return
+
+    updated, missing = reclean_raw_data(raw_data, workers, clean=clean_pages, cleaner=CLEANER)
+    write_json_atomic('raw_data.json', raw_data)
+
+    total_words = sum(item.get('word_count', 0) for item in raw_data)
+    print(f"Re-cleaned {updated} articles; total words: {total_words}")
+    if missing:
+        print(f"{missing} articles have no stored page text (extracted before it was kept); "
+              f"run with --force to re-extract them")
 
 
 if __name__ == "__main__":
-    process_pdfs()
+    arg_parser = argparse.ArgumentParser(description="Extract text and images from downloaded PDFs into raw_data.json")
+    arg_parser.add_argument("--workers", type=int, default=PDF_WORKERS,
+                            help="Extraction processes (default: PDF_WORKERS env var, or one per CPU core)")
+    arg_parser.add_argument("--force", action="store_true",
+                            help="Reprocess every PDF, even if unchanged since the last run")
+    arg_parser.add_argument("--reclean", action="store_true",
+                            help="Only re-run text cleaning on raw_data.json from the stored page texts")
+    args = arg_parser.parse_args()
+    if args.reclean:
+        reclean(workers=max(1, args.workers))
+    else:
+        process_pdfs(workers=max(1, args.workers), force=args.force)
@@ -1,132 +1,68 @@
 import asyncio
-import json
-import time
-import requests
 import os
 import argparse
+import sys
 from datetime import datetime
 from dateutil import parser
-from playwright.async_api import async_playwright
-
-
-async def scrape_articles(start_date=None, end_date=None, limit=50):
-    """Scrape and download Haddas Ertra PDFs within a date range."""
-    
-    print(f"Scraping articles" + (f" from {start_date}" if start_date else "") + (f" to {end_date}" if end_date else "") + f" (limit={limit})...")
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
 
+# Add backend to path to reuse the scraper service helpers
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+from app.config import NEWSPAPERS_BY_ID
+from app.services.downloader import open_downloader
+from app.services.fetchers import FETCHER_MODES, open_fetcher
+from app.services.frontier import UrlFrontier
+from app.services.json_store import load_json, write_json_atomic
+from app.services.page_index import PageDateIndex
+from app.services.rate_limiter import HostRateLimiter
+from app.services.scraper_service import PdfDownloads, collect_article_urls, download_to_store, merge_metadata
+
+
+async def scrape_articles(start_date=None, end_date=None, limit=50, concurrency=None, fetcher_mode='auto', download_concurrency=None, incremental=True, requests_per_second=None, newspaper_id='haddas-ertra'):
+    """Scrape and download a newspaper's PDFs (Haddas Ertra by default) within a date range.
+
+    Selectors, URLs and the default crawl budget (concurrency, download concurrency, requests/sec)
+    come from the newspaper's entry in app.config.NEWSPAPERS.
+
+    Incrementally by default: articles and PDFs already in the URL frontier are skipped and
+    new entries are merged into the existing pdf_metadata.json. PDFs are kept once per content
+    hash in the shared PDF store (pdfs/store/).
+    """
+    site = NEWSPAPERS_BY_ID[newspaper_id]
+    concurrency = concurrency or site['listing_concurrency']
+    download_concurrency = download_concurrency or site['download_concurrency']
+    requests_per_second = requests_per_second or site['requests_per_second']
+    frontier = UrlFrontier()
+    existing_metadata = load_json('pdf_metadata.json', []) if incremental else []
+
+    print(f"Scraping {site['name']} articles" + (f" from {start_date}" if start_date else "") + (f" to {end_date}" if end_date else "") + f" (limit={limit})...")
+
+    # One limiter for listing, article and PDF requests, adapting per host to 429/5xx responses
+    limiter = HostRateLimiter(rate=requests_per_second)
+    async with open_fetcher(fetcher_mode, concurrency, limiter) as fetcher, \
+            open_downloader(download_concurrency, limiter=limiter) as downloader:
         try:
-            # Collect article URLs from multiple pages
-            article_urls = []
+            # Collect article URLs from listing pages, several pages at a time
             max_articles = limit
-            found_articles_in_range = False
-            
-            for page_num in range(1, 101):  # Check up to 100 pages
-                print(f"Processing page {page_num}...")
-
-                page_url = "https://shabait.com/category/newspapers/haddas-ertra-news/" + (f"page/{page_num}/" if page_num > 1 else "")
-
-                try:
-                    await page.goto(page_url)
-                    await page.wait_for_load_state('networkidle')
-                    await page.wait_for_timeout(2000)
-                except Exception as e:
-                    print(f"Error loading page {page_num}: {e}")
-                    break
-
-                # Get articles on this page with their dates if possible (metadata often not available directly on listing)
-                # So we collect links and check dates inside, OR check dates on listing if available.
-                # Checking listing dates first is much faster.
-                
-                articles = await page.query_selector_all('article.listing-item')
-                current_page_urls = []
-                
-                for article in articles:
-                    try:
-                        # Extract date from listing
-                        date_elem = await article.query_selector('.entry-date, .post-date, time')
-                        if date_elem:
-                            date_text = (await date_elem.text_content()).strip()
-                            try:
-                                article_date = parser.parse(date_text)
-                                # Filter
-                                if end_date and article_date > end_date:
-                                    continue # Too new, skip
-                                if start_date and article_date < start_date:
-                                    # Assuming reverse chronological order, if we hit a date older than start_date, we might be done?
-                                    # But sometimes sticky posts exist, so maybe just skip for now, but mark signal.
-                                    # However, standard newspaper archives are usually chronological.
-                                    # Let's simple skip but keep checking to be safe, or break if we are sure.
-                                    # For now, let's just skip but keep checking page.
-                                    # Actually, if we are on page 10 and see 2020, and want 2022, we should stop? No, we are going backwards.
-                                    # We want 2022-2023.
-                                    # Page 1: 2024 (skip, > end)
-                                    # ...
-                                    # Page 5: 2023 (keep)
-                                    # ...
-                                    # Page 10: 2021 (< start, stop?)
-                                    # Yes, usually can stop if significantly past start date.
-                                    pass
-                                    
-                                if (not start_date or article_date >= start_date) and (not end_date or article_date <= end_date):
-                                     link = await article.query_selector('a.post-url[href*="haddas-ertra"]')
-                                     if link:
-                                         href = await link.get_attribute('href')
-                                         if href and href not in article_urls:
-                                             href = f"https://shabait.com{href}" if not href.startswith('http') else href
-                                             current_page_urls.append(href)
-                                             found_articles_in_range = True
-                            except:
-                                # If date parse fails, maybe include it to be safe and check later? or skip?
-                                # safer to include if we can't parse date on listing
-                                link = await article.query_selector('a.post-url[href*="haddas-ertra"]')
-                                if link:
-                                     href = await link.get_attribute('href')
-                                     if href and href not in article_urls:
-                                         current_page_urls.append(href)
-                        else:
-                             # No date on listing, grab link to check later
-                             link = await article.query_selector('a.post-url[href*="haddas-ertra"]')
-                             if link:
-                                 href = await link.get_attribute('href')
-                                 if href and href not in article_urls:
-                                     current_page_urls.append(href)
-
-                    except Exception as e:
-                        continue
-
-                print(f"Found {len(current_page_urls)} potential articles on page {page_num}")
 
-                if not current_page_urls and found_articles_in_range:
-                     # If we found some before, but none now, and assuming chronological, maybe we are done?
-                     # But let's verify if we passed the start date.
-                     # Simplified: If we found no matching URLs on a page, and we have found some before, likely reached end.
-                     # Or if we have collected enough.
-                     if len(article_urls) > 0:
-                         # Check if the last article date on page was before start_date
-                         # This is complex to do perfectly without seeing all dates.
-                         # Let's rely on manual break or sufficient count.
-                         pass
-                
-                # If we found nothing on this page, and haven't found anything yet, maybe we just need to go further back (if searching for old dates)
-                # If we found nothing, and DID find something before, maybe we are done.
-
-                if not current_page_urls and len(article_urls) > 0:
-                     # Heuristic: stop if empty page after finding stuff
-                     # But current_page_urls is filtered.
-                     pass
-
-                article_urls.extend(current_page_urls)
-
-                if len(article_urls) >= max_articles:
-                    break
-                
-                # Heuristic to stop if we are going too far back?
-                # Hard to tell without parsing all dates.
-                # Let's limit strictly by pages for safety or max count.
+            def report(progress):
+                if 'start_page' in progress:
+                    print(f"Page index: starting at listing page {progress['start_page']}")
+                    return
+                print(f"Processed page {progress['page']} ({progress['urls']} articles so far, {progress['pages_per_sec']} pages/sec)")
+
+            article_urls = await collect_article_urls(
+                fetcher,
+                site,
+                max_pages=100,  # Check up to 100 pages
+                max_articles=max_articles,
+                parsed_start=start_date,
+                parsed_end=end_date,
+                concurrency=concurrency,
+                progress_callback=report,
+                is_known=frontier.is_known_article if incremental else None,
+                stop_at_known=incremental and not (start_date or end_date),
+                page_index=PageDateIndex(),
+            )
 
             article_urls = article_urls[:max_articles]
             print(f"Collected {len(article_urls)} article URLs")
@@ -134,24 +70,41 @@ async def scrape_articles(start_date=None, end_date=None, limit=50):
             # Create metadata
             pdf_metadata = []
             
-            # Create download directory
-            download_dir = os.path.join(os.getcwd(), 'pdfs')
-            os.makedirs(download_dir, exist_ok=True)
+            def save_metadata():
+                write_json_atomic('pdf_metadata.json', merge_metadata(existing_metadata, pdf_metadata))
+                frontier.save()
 
-            # Download PDFs
+            async def download(meta_entry):
+                pdf_url, article_url = meta_entry['pdf_url'], meta_entry['article_url']
+                try:
+                    stored = await pdf_downloads.get(pdf_url, lambda: download_to_store(downloader, pdf_url))
+                    sha256, filepath = stored['sha256'], stored['filepath']
+                    print(f"✓ Downloaded: {meta_entry['pdf_filename']} ({sha256[:12]})")
+                    meta_entry.update({'pdf_filepath': filepath, 'pdf_sha256': sha256, 'download_status': 'completed'})
+                    frontier.mark_pdf(pdf_url, 'completed', filepath=filepath, sha256=sha256, article_url=article_url)
+                    frontier.mark_article(article_url, 'completed', pdf_url=pdf_url)
+                except Exception as e:
+                    print(f"✗ Failed: {meta_entry['pdf_filename']} - {str(e)}")
+                    meta_entry['download_status'] = 'failed'
+                    meta_entry['error'] = str(e)
+                    frontier.mark_pdf(pdf_url, 'failed', error=str(e), article_url=article_url)
+                    frontier.mark_article(article_url, 'failed', pdf_url=pdf_url)
+                save_metadata()
+
+            # Download PDFs; reposts of one PDF URL share its download
+            downloads = []
+            pdf_downloads = PdfDownloads()
             for i, article_url in enumerate(article_urls):
                 print(f"Processing article {i+1}/{len(article_urls)}")
 
                 try:
-                    await page.goto(article_url)
-                    await page.wait_for_load_state('networkidle')
-
-                    # Extract title and date
-                    title_element = await page.query_selector('h1, .entry-title, .post-title')
-                    title = (await title_element.text_content()).strip() if title_element else f'Article {i+1}'
-
-                    date_element = await page.query_selector('.entry-date, .post-date, time')
-                    date_str = (await date_element.text_content()).strip() if date_element else 'Unknown Date'
+                    # Extract title, date and PDF link
+                    info = await fetcher.fetch_article(article_url, site)
+                    if info is None:
+                        print(f"✗ Could not load article {i+1}")
+                        continue
+                    title = info['title'] or f'Article {i+1}'
+                    date_str = info['date'] or 'Unknown Date'
                     
                     # Double check date if we pushed it here
                     try:
@@ -165,41 +118,24 @@ async def scrape_articles(start_date=None, end_date=None, limit=50):
                     except:
                         pass # Keep if date parse fails
 
-                    # Find PDF download link
-                    download_icon = await page.query_selector('img.wp-image-77661')
-                    direct_pdf_url = None
-
-                    if download_icon:
-                        parent_link = await download_icon.query_selector('xpath=ancestor::a[1]')
-                        if parent_link:
-                            href = await parent_link.get_attribute('href')
-                            if href and (href.endswith('.pdf') or 'erinewspapers.com' in href):
-                                direct_pdf_url = href if href.startswith('http') else f"https://shabait.com{href}"
-
-                    # Fallback: search for PDF links
-                    if not direct_pdf_url:
-                        pdf_links = await page.query_selector_all('a[href$=".pdf"]')
-                        for link in pdf_links:
-                            href = await link.get_attribute('href')
-                            if href and ('erinewspapers.com' in href or 'hadas-eritrea' in href):
-                                direct_pdf_url = href if href.startswith('http') else f"https://shabait.com{href}"
-                                break
+                    direct_pdf_url = info['pdf_url']
 
                     if direct_pdf_url:
                         # Create filename and download
                         safe_title = title.replace('/', '-').replace('\\', '-').replace(':', '-').replace('*', '-').replace('?', '-').replace('"', '-').replace('<', '-').replace('>', '-').replace('|', '-')
                         safe_date = date_str.replace('/', '-').replace('\\', '-').replace(':', '-').replace('*', '-').replace('?', '-').replace('"', '-').replace('<', '-').replace('>', '-').replace('|', '-')
                         filename = f"{safe_date}_{safe_title}.pdf"
-                        filepath = os.path.join(download_dir, filename)
                         
                         # Add to metadata
                         meta_entry = {
                             'index': len(pdf_metadata) + 1,
+                            'newspaper_id': newspaper_id,
                             'article_url': article_url,
                             'title': title,
                             'date': date_str,
                             'pdf_filename': filename,
-                            'pdf_filepath': filepath,
+                            'pdf_filepath': None,  # Set once the download is in the PDF store
+                            'pdf_sha256': None,
                             'pdf_url': direct_pdf_url,
                             'download_status': 'pending',
                             'text_extraction_status': 'pending'
@@ -207,43 +143,45 @@ async def scrape_articles(start_date=None, end_date=None, limit=50):
                         
                         pdf_metadata.append(meta_entry)
 
-                        try:
-                            response = requests.get(direct_pdf_url, timeout=60) # Increased timeout
-                            response.raise_for_status()
-
-                            with open(filepath, 'wb') as f:
-                                f.write(response.content)
-
-                            print(f"✓ Downloaded: {filename}")
-                            meta_entry['download_status'] = 'completed'
-
-                        except Exception as e:
-                            print(f"✗ Failed: {filename} - {str(e)}")
-                            meta_entry['download_status'] = 'failed'
-                            meta_entry['error'] = str(e)
+                        known_pdf = frontier.completed_pdf(direct_pdf_url) if incremental else None
+                        if known_pdf and os.path.exists(known_pdf.get('filepath', '')):
+                            print(f"= Already downloaded: {filename}")
+                            meta_entry.update({
+                                'pdf_filepath': known_pdf['filepath'],
+                                'pdf_sha256': known_pdf.get('sha256'),
+                                'download_status': 'completed',
+                            })
+                            frontier.mark_article(article_url, 'completed', pdf_url=direct_pdf_url)
+                        else:
+                            # Download in the background while the next article page is visited
+                            downloads.append(asyncio.create_task(download(meta_entry)))
                     else:
                         print(f"✗ No PDF link found for article {i+1}")
+                        frontier.mark_article(article_url, 'no_pdf')
 
                 except Exception as e:
                     print(f"✗ Error processing article {i+1}: {str(e)}")
 
                 # Update metadata after each article
-                with open('pdf_metadata.json', 'w', encoding='utf-8') as f:
-                    json.dump(pdf_metadata, f, ensure_ascii=False, indent=2)
+                save_metadata()
 
-                # Rate limiting
-                time.sleep(2)
+            if downloads:
+                print(f"Waiting for {sum(not t.done() for t in downloads)} downloads to finish...")
+                await asyncio.gather(*downloads)
 
             # Final summary
             successful_count = sum(1 for m in pdf_metadata if m['download_status'] == 'completed')
             print(f"\nCompleted: {successful_count}/{len(pdf_metadata)} PDFs downloaded")
+            if getattr(fetcher, 'fallbacks', 0):
+                print(f"Playwright fallback used for {fetcher.fallbacks} pages")
+            for host, stats in limiter.stats().items():
+                print(f"{host}: ended at {stats['rate']} req/s, throttled {stats['throttled']} times")
+            for key, stats in fetcher.latency.summary().items():
+                print(f"{key}: {stats['pages']} pages, p50 {stats['p50_ms']} ms, p95 {stats['p95_ms']} ms")
 
         except Exception as e:
             print(f"Scraping error: {str(e)}")
 
-        finally:
-            await browser.close()
-
 
 async def main():
     """Main function."""
@@ -251,6 +189,12 @@ async def main():
     parser_args.add_argument('--start-date', type=str, help='Start date (YYYY-MM-DD)')
     parser_args.add_argument('--end-date', type=str, help='End date (YYYY-MM-DD)')
     parser_args.add_argument('--limit', type=int, default=50, help='Max number of newspapers to scrape')
+    parser_args.add_argument('--newspaper', choices=sorted(NEWSPAPERS_BY_ID), default='haddas-ertra', help='Newspaper from app.config.NEWSPAPERS')
+    parser_args.add_argument('--concurrency', type=int, default=None, help="Listing pages fetched at once (default: the newspaper's setting)")
+    parser_args.add_argument('--download-concurrency', type=int, default=None, help="PDFs downloaded at once (default: the newspaper's setting)")
+    parser_args.add_argument('--full', action='store_true', help='Ignore already scraped articles and rewrite pdf_metadata.json from scratch')
+    parser_args.add_argument('--rate', type=float, default=None, help="Starting requests/sec per host, adapts to 429/5xx (default: the newspaper's setting)")
+    parser_args.add_argument('--fetcher', choices=FETCHER_MODES, default='auto', help='auto = plain HTTP with Playwright fallback')
     args = parser_args.parse_args()
     
     start_date = parser.parse(args.start_date) if args.start_date else None
@@ -258,7 +202,15 @@ async def main():
     limit = max(1, min(500, args.limit))
 
     print("Starting Haddas Ertra PDF downloader...")
-    await scrape_articles(start_date, end_date, limit=limit)
+    await scrape_articles(
+        start_date, end_date, limit=limit,
+        concurrency=args.concurrency and max(1, args.concurrency),
+        fetcher_mode=args.fetcher,
+        download_concurrency=args.download_concurrency and max(1, args.download_concurrency),
+        incremental=not args.full,
+        requests_per_second=args.rate and max(0.1, args.rate),
+        newspaper_id=args.newspaper,
+    )
 
 
 if __name__ == "__main__":